@@ -0,0 +1,29 @@
+from .hazard_unit import HazardUnit
+from .parser import parse_riscv_line, format_instruction, load_assembly_file
+from .pipeline import Pipeline
+from .multithreading import MultithreadedPipeline
+from .golden_model import GoldenModel
+from .state import export_state, import_state
+
+"""
+Simulador de pipeline RISC-V de 5 etapas.
+
+El núcleo (parser, pipeline, unidad de riesgos y modelos de referencia) no
+depende de pygame ni de tkinter y se puede importar desde scripts:
+
+    from riscv_pipeline import Pipeline, HazardUnit, load_assembly_file
+
+La interfaz gráfica vive en riscv_pipeline.gui y solo se carga al ejecutarla.
+"""
+
+__all__ = [
+    "HazardUnit",
+    "Pipeline",
+    "MultithreadedPipeline",
+    "GoldenModel",
+    "parse_riscv_line",
+    "format_instruction",
+    "load_assembly_file",
+    "export_state",
+    "import_state",
+]
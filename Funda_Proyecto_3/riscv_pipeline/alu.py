@@ -0,0 +1,48 @@
+"""
+ALU de 32 bits compartida por Pipeline, OutOfOrderCore y GoldenModel.
+
+Los registros y la memoria guardan enteros de 32 bits con signo (ver state):
+los resultados se reducen con complemento a dos, así ADD/SUB/MUL desbordan
+igual que el hardware. SLT compara con signo y SLTU sin signo.
+"""
+
+MASK32 = 0xFFFFFFFF
+SIGN32 = 0x80000000
+
+R_TYPE_OPS = ("ADD", "SUB", "AND", "OR", "MUL", "SLT", "SLTU")
+
+
+def wrap32(value):
+    """
+    Reduce un entero a 32 bits con signo (complemento a dos).
+    """
+    return ((value + SIGN32) & MASK32) - SIGN32
+
+
+def to_unsigned(value):
+    """
+    Interpretación sin signo de una palabra de 32 bits.
+    """
+    return value & MASK32
+
+
+def execute(op, a, b):
+    """
+    Resultado de la ALU para una instrucción tipo R, o ADDI con b = imm.
+    """
+    if op == "ADD" or op == "ADDI":
+        return wrap32(a + b)
+    if op == "SUB":
+        return wrap32(a - b)
+    if op == "AND":
+        return a & b
+    if op == "OR":
+        return a | b
+    if op == "MUL":
+        # Parte baja del producto, como MUL de RV32M.
+        return wrap32(a * b)
+    if op == "SLT":
+        return int(a < b)
+    if op == "SLTU":
+        return int(to_unsigned(a) < to_unsigned(b))
+    return 0
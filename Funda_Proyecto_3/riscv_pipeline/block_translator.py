@@ -0,0 +1,338 @@
+from .alu import MASK32, R_TYPE_OPS, SIGN32
+from .hazard_unit import HazardUnit
+
+"""
+Motor de traducción por bloques básicos.
+
+Divide el programa cargado en bloques básicos (cortando en BEQ/BNE y en los
+destinos de salto) y compila cada bloque a una función de Python especializada
+(código fuente generado + compile), con los índices de registros y los
+inmediatos ya resueltos. Así se evita recorrer las cadenas if/elif de
+Pipeline.step por cada instrucción cuando solo interesa el resultado funcional.
+
+Los bloques traducidos se guardan en caché y se invalidan cuando cambia el
+programa. Cada bloque lleva además una estimación de su costo en ciclos y
+stalls para una configuración de HazardUnit dada.
+"""
+
+BRANCH_OPS = ["BEQ", "BNE"]
+
+# Reducción a 32 bits con signo en línea (igual que alu.wrap32).
+_WRAP = f"((({{}}) + {SIGN32:#x}) & {MASK32:#x}) - {SIGN32:#x}"
+
+# Expresiones de la ALU para las instrucciones tipo R.
+_R_TYPE_EXPR = {
+    "ADD": _WRAP.format("r[{rs1}] + r[{rs2}]"),
+    "SUB": _WRAP.format("r[{rs1}] - r[{rs2}]"),
+    "AND": "r[{rs1}] & r[{rs2}]",
+    "OR": "r[{rs1}] | r[{rs2}]",
+    "MUL": _WRAP.format("r[{rs1}] * r[{rs2}]"),
+    "SLT": "int(r[{rs1}] < r[{rs2}])",
+    "SLTU": f"int((r[{{rs1}}] & {MASK32:#x}) < (r[{{rs2}}] & {MASK32:#x}))",
+}
+
+# Ciclos perdidos por el flush de IF/ID cuando un salto se toma en EX, o
+# solo de IF cuando se resuelve en ID (early_branch_resolution).
+TAKEN_BRANCH_FLUSH = 2
+EARLY_TAKEN_BRANCH_FLUSH = 1
+
+
+def program_fingerprint(instruction_memory):
+    """
+    Huella del programa: cambia si cambia cualquier instrucción.
+    """
+    return tuple(tuple(sorted(instr.items())) for instr in instruction_memory)
+
+
+def _reg(name):
+    return int(name[1:])
+
+
+class BasicBlock:
+    """
+    Bloque básico traducido: instrucciones [start, end) y su función compilada.
+
+    La función recibe (registros, memoria) y retorna (siguiente_pc, tomado).
+    """
+
+    def __init__(self, start, end, instructions, source, func):
+        self.start = start
+        self.end = end
+        self.instructions = instructions
+        self.source = source
+        self.func = func
+        self.exec_count = 0
+        self._costs = {}   # (pred_start, forwarding, prediction, early) -> (ciclos, stalls de datos, de salto)
+
+    @property
+    def branch(self):
+        last = self.instructions[-1]
+        return last if last.get("op") in BRANCH_OPS else None
+
+
+class BlockTranslator:
+    """
+    Traduce y ejecuta un programa bloque a bloque.
+
+    Args:
+        instruction_memory (list[dict]): Programa ya parseado.
+        memory_size (int): Cantidad de palabras de la memoria de datos.
+    """
+
+    def __init__(self, instruction_memory, memory_size=64):
+        self.memory_size = memory_size
+        self.instruction_memory = []
+        self.fingerprint = None
+        self.leaders = []
+        self.blocks = {}
+        self.load_program(instruction_memory)
+
+    # ----------------------------------------------------------------------
+    # Caché de bloques
+    # ----------------------------------------------------------------------
+
+    def load_program(self, instruction_memory):
+        """
+        Carga un programa. Si difiere del anterior se invalida la caché.
+        """
+        fingerprint = program_fingerprint(instruction_memory or [])
+        if fingerprint == self.fingerprint:
+            return
+        self.instruction_memory = list(instruction_memory or [])
+        self.fingerprint = fingerprint
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Descarta todos los bloques traducidos y recalcula los líderes.
+        """
+        self.blocks = {}
+        self.leaders = self._find_leaders()
+
+    def _find_leaders(self):
+        """
+        Un líder es: la primera instrucción, el destino de un salto y la
+        instrucción que sigue a un salto.
+        """
+        n = len(self.instruction_memory)
+        leaders = {0} if n else set()
+        for pc, instr in enumerate(self.instruction_memory):
+            if instr.get("op") in BRANCH_OPS:
+                target = pc + instr.get("imm", 0)
+                if 0 <= target < n:
+                    leaders.add(target)
+                if pc + 1 < n:
+                    leaders.add(pc + 1)
+        return sorted(leaders)
+
+    def get_block(self, pc):
+        """
+        Retorna el bloque que empieza en pc, traduciéndolo si hace falta.
+        """
+        block = self.blocks.get(pc)
+        if block is None:
+            block = self._translate(pc)
+            self.blocks[pc] = block
+        return block
+
+    # ----------------------------------------------------------------------
+    # Traducción
+    # ----------------------------------------------------------------------
+
+    def _block_end(self, start):
+        n = len(self.instruction_memory)
+        for pc in range(start, n):
+            if self.instruction_memory[pc].get("op") in BRANCH_OPS:
+                return pc + 1
+            if pc + 1 in self.leaders:
+                return pc + 1
+        return n
+
+    def _translate(self, start):
+        end = self._block_end(start)
+        instructions = self.instruction_memory[start:end]
+        n = len(self.instruction_memory)
+        size = self.memory_size
+
+        lines = [f"def block_{start}(r, m):"]
+        result = f"    return {end}, False"
+
+        for offset, instr in enumerate(instructions):
+            pc = start + offset
+            op = instr.get("op")
+
+            if op in R_TYPE_OPS:
+                rd = _reg(instr["rd"])
+                if rd != 0:
+                    expr = _R_TYPE_EXPR[op].format(rs1=_reg(instr["rs1"]), rs2=_reg(instr["rs2"]))
+                    lines.append(f"    r[{rd}] = {expr}")
+
+            elif op == "ADDI":
+                rd = _reg(instr["rd"])
+                if rd != 0:
+                    expr = _WRAP.format(f"r[{_reg(instr['rs1'])}] + {instr['imm']}")
+                    lines.append(f"    r[{rd}] = {expr}")
+
+            elif op == "LW":
+                rd = _reg(instr["rd"])
+                if rd != 0:
+                    lines.append(f"    a = r[{_reg(instr['rs1'])}] + {instr['imm']}")
+                    lines.append(f"    r[{rd}] = m[a] if 0 <= a < {size} else 0")
+
+            elif op == "SW":
+                lines.append(f"    a = r[{_reg(instr['rs1'])}] + {instr['imm']}")
+                lines.append(f"    if 0 <= a < {size}:")
+                lines.append(f"        m[a] = r[{_reg(instr['rs2'])}]")
+
+            elif op in BRANCH_OPS:
+                # Igual que Pipeline: un destino fuera del programa lo termina.
+                target = pc + instr.get("imm", 0)
+                if not 0 <= target < n:
+                    target = n
+                cmp = "==" if op == "BEQ" else "!="
+                rs1, rs2 = _reg(instr["rs1"]), _reg(instr["rs2"])
+                result = f"    return ({target}, True) if r[{rs1}] {cmp} r[{rs2}] else ({end}, False)"
+
+        lines.append(result)
+        source = "\n".join(lines) + "\n"
+
+        namespace = {}
+        exec(compile(source, f"<block_{start}>", "exec"), namespace)
+        return BasicBlock(start, end, instructions, source, namespace[f"block_{start}"])
+
+    # ----------------------------------------------------------------------
+    # Estimación de costo por bloque
+    # ----------------------------------------------------------------------
+
+    def block_cost(self, block, hazard_unit, pred=None):
+        """
+        Estima ciclos y stalls de un bloque (sin contar el resultado del salto).
+
+        Reutiliza HazardUnit.detect_hazard sobre una ventana EX/MEM/WB sintética,
+        insertando burbujas mientras la unidad pida stall. La ventana de entrada
+        se toma del bloque predecesor para capturar dependencias entre bloques.
+
+        Returns:
+            tuple[int, int, int]: (ciclos, stalls de datos, stalls de salto)
+        """
+        key = (pred.start if pred else None,
+               hazard_unit.enable_forwarding,
+               hazard_unit.enable_branch_prediction,
+               hazard_unit.early_branch_resolution)
+        cost = block._costs.get(key)
+        if cost is not None:
+            return cost
+
+        window = [None, None, None]   # EX, MEM, WB
+        if pred is not None:
+            tail = pred.instructions[-3:]
+            for instr in tail:
+                window = [instr] + window[:2]
+
+        cycles = stalls = branch_stalls = 0
+        for instr in block.instructions:
+            while True:
+                stages = {"EX": window[0], "MEM": window[1], "WB": window[2]}
+                hazard = hazard_unit.detect_hazard(stages, instr)
+                if not hazard.get("stall"):
+                    break
+                stalls += 1
+                cycles += 1
+                window = [None] + window[:2]
+            cycles += 1
+            window = [instr] + window[:2]
+
+        if block.branch is not None and not hazard_unit.enable_branch_prediction:
+            # Sin predicción cada salto paga un ciclo extra.
+            branch_stalls += 1
+            cycles += 1
+
+        block._costs[key] = (cycles, stalls, branch_stalls)
+        return cycles, stalls, branch_stalls
+
+    # ----------------------------------------------------------------------
+    # Ejecución funcional
+    # ----------------------------------------------------------------------
+
+    def run(self, registers, memory, hazard_unit=None, pc=0, max_blocks=1_000_000, fill=True,
+            pred=None):
+        """
+        Ejecuta el programa bloque a bloque sobre registers/memory (in situ).
+
+        Args:
+            registers (array | list[int]): Banco de registros (se modifica).
+            memory (array | list[int]): Memoria de datos (se modifica).
+            hazard_unit (HazardUnit, optional): Configuración para el costo estimado.
+            pc (int): PC inicial.
+            max_blocks (int): Límite de bloques para cortar bucles infinitos.
+            fill (bool): Sumar los ciclos de llenado del pipeline (False al
+                continuar una corrida funcional anterior).
+            pred (BasicBlock, optional): Último bloque de esa corrida anterior
+                (el 'last_block' que retornó), para el costo entre bloques.
+
+        Returns:
+            dict: pc final, bloques ejecutados, último bloque, instrucciones
+            retiradas y la estimación de ciclos/stalls del modelo de tiempo. El ciclo en que
+            el pipeline queda vacío se suma solo si el programa terminó.
+        """
+        hazard_unit = hazard_unit or HazardUnit(enable_forwarding=True)
+        n = len(self.instruction_memory)
+        taken_flush = (EARLY_TAKEN_BRANCH_FLUSH if hazard_unit.early_branch_resolution
+                       else TAKEN_BRANCH_FLUSH)
+
+        # Llenado del pipeline: la primera instrucción sale de WB en el ciclo 5.
+        cycles = 4 if n and fill and 0 <= pc < n else 0
+        data_stalls = branch_stalls = flushes = 0
+        retired = 0
+        executed = 0
+
+        while 0 <= pc < n and executed < max_blocks:
+            block = self.get_block(pc)
+            block.exec_count += 1
+            pc, taken = block.func(registers, memory)
+            registers[0] = 0
+
+            block_cycles, block_data, block_branch = self.block_cost(block, hazard_unit, pred)
+            cycles += block_cycles
+            data_stalls += block_data
+            branch_stalls += block_branch
+            if taken:
+                cycles += taken_flush
+                flushes += 1
+
+            retired += block.end - block.start
+            executed += 1
+            pred = block
+
+        finished = not 0 <= pc < n
+        return {
+            "pc": pc,
+            "finished": finished,
+            "blocks": executed,
+            "last_block": pred,
+            "instructions": retired,
+            "cycles": cycles + (1 if finished and retired else 0),
+            "stalls": data_stalls + branch_stalls,
+            "data_stalls": data_stalls,
+            "branch_stalls": branch_stalls,
+            "flushes": flushes,
+        }
+
+
+# Caché de traductores por programa: ambos procesadores comparten la traducción.
+_translators = {}
+_MAX_TRANSLATORS = 8
+
+
+def get_translator(instruction_memory, memory_size=64):
+    """
+    Retorna un BlockTranslator para el programa, reutilizándolo si ya existe.
+    """
+    key = (program_fingerprint(instruction_memory or []), memory_size)
+    translator = _translators.get(key)
+    if translator is None:
+        if len(_translators) >= _MAX_TRANSLATORS:
+            _translators.pop(next(iter(_translators)))
+        translator = BlockTranslator(instruction_memory, memory_size)
+        _translators[key] = translator
+    return translator
@@ -0,0 +1,305 @@
+import heapq
+import re
+
+from .ooo_core import OutOfOrderCore
+from .parser import PROGRAM_SEPARATOR, parse_riscv_line
+
+"""
+Breakpoints y watchpoints para Pipeline, MultithreadedPipeline y
+OutOfOrderCore.
+
+Formato de cada breakpoint (texto):
+    pc 12                   la instrucción en pc 12 se retira (también "pc == 12")
+    cycle 5000              se llega al ciclo 5000 (también "cycle == / >= 5000")
+    x5                      se escribe x5 (retiro, o llegada de un LW)
+    x5 == 42                ... y el valor escrito cumple la comparación
+    mem[8]                  un SW a la dirección 8 se retira (watchpoint)
+    mem[8] > 100            ... y el valor guardado cumple la comparación
+    <cualquiera> if x3 > 2 and cycle >= 100     condición adicional
+
+Comparaciones: == != < <= > >=. Las condiciones usan cycle, xN y mem[N],
+unidas con and/or. En el editor (o en un .s) se marcan con comentarios:
+"ADD x1, x2, x3  # @break" pone un breakpoint en esa instrucción (con
+"# @break if x1 > 3" lleva condición) y una línea "# @break mem[8]" agrega
+el breakpoint tal cual. Con varios hilos los registros son los del banco
+físico (x{32 * hilo + n}) y "pc N" se aplica a todos los hilos.
+
+Cada condición se compila una sola vez a una función de Python. Los
+breakpoints se indexan por pc, registro y dirección (diccionarios; los de
+igualdad, por (registro, valor) y (dirección, valor)) y los de ciclo en un
+heap, así que el costo por ciclo no depende de cuántos haya.
+Sin breakpoints no se engancha nada: Pipeline.step queda intacto.
+"""
+
+DIRECTIVE = "@break"
+
+_COMPARISON = r"(?:==|!=|<=|>=|<|>)"
+_TERM = r"(?:cycle|x\d+|mem\[\d+\])"
+_CONDITION_RE = re.compile(
+    rf"^\s*{_TERM}\s*{_COMPARISON}\s*-?\d+\s*(?:(?:and|or)\s+{_TERM}\s*{_COMPARISON}\s*-?\d+\s*)*$")
+_OPERAND_RE = re.compile(r"x(\d+)|mem\[(\d+)\]")
+_TRIGGER_RE = re.compile(
+    rf"^\s*(?P<kind>pc|cycle|x(?P<reg>\d+)|mem\[(?P<addr>\d+)\])"
+    rf"\s*(?:(?P<op>{_COMPARISON}|=)?\s*(?P<value>-?\d+))?\s*$")
+
+
+def _term_source(match):
+    term = match.group(0)
+    if term == "cycle":
+        return "cycle"
+    if term.startswith("x"):
+        return f"r[{int(term[1:])}]"
+    return f"m[{int(term[4:-1])}]"
+
+
+def compile_condition(text):
+    """
+    Compila una condición ("x3 > 2 and cycle >= 100") a una función
+    f(registers, memory, cycle) -> bool.
+    """
+    if not _CONDITION_RE.match(text):
+        raise ValueError(f"Condición inválida: {text!r}")
+    source = re.sub(_TERM, _term_source, text.strip())
+    return eval(compile(f"lambda r, m, cycle: bool({source})", "<breakpoint>", "eval"), {})
+
+
+def _compile_check(op, value):
+    """
+    Comparación del valor observado (registro escrito o dato del SW).
+    """
+    if op is None:
+        return None
+    return eval(compile(f"lambda v: v {op} {value}", "<breakpoint>", "eval"), {})
+
+
+class Breakpoint:
+    """
+    Un breakpoint ya compilado.
+
+    Args:
+        spec (str): Texto del breakpoint (ver el formato del módulo).
+    """
+
+    def __init__(self, spec):
+        self.spec = spec.strip()
+        self.equals = None
+        trigger, _, condition = self.spec.partition(" if ")
+        match = _TRIGGER_RE.match(trigger)
+        if not match:
+            raise ValueError(f"Breakpoint inválido: {spec!r}")
+
+        op = match.group("op")
+        op = "==" if op == "=" else op
+        value = match.group("value")
+        kind = match.group("kind")
+        if kind in ("pc", "cycle"):
+            if value is None:
+                raise ValueError(f"'{kind}' necesita un número: {spec!r}")
+            # Llegar al ciclo N ya es "cycle >= N"; un pc es un punto exacto.
+            if op not in ((None, "==", ">=") if kind == "cycle" else (None, "==")):
+                raise ValueError(f"'{kind}' no admite '{op}': {spec!r}")
+            self.kind, self.key, self.check = kind, int(value), None
+        else:
+            if match.group("reg") is not None:
+                self.kind, self.key = "reg", int(match.group("reg"))
+            else:
+                self.kind, self.key = "mem", int(match.group("addr"))
+            op = op or "=="
+            # Las igualdades se resuelven con el índice (clave, valor).
+            self.equals = int(value) if value is not None and op == "==" else None
+            self.check = _compile_check(op, value) if value is not None and op != "==" else None
+
+        self.condition = compile_condition(condition) if condition else None
+        self.hits = 0
+
+        # Registros y direcciones que usa (disparo y condición), para validarlos
+        # contra el procesador en BreakpointSet.add.
+        self.registers = set()
+        self.addresses = set()
+        if self.kind == "reg":
+            self.registers.add(self.key)
+        elif self.kind == "mem":
+            self.addresses.add(self.key)
+        for reg, addr in _OPERAND_RE.findall(condition):
+            if reg:
+                self.registers.add(int(reg))
+            else:
+                self.addresses.add(int(addr))
+
+    def __repr__(self):
+        return f"Breakpoint({self.spec!r})"
+
+
+def breakpoints_from_source(text):
+    """
+    Breakpoints marcados con "# @break" en un texto ensamblador.
+    """
+    specs = []
+    pc = 0
+    for line in text.splitlines():
+        if line.strip() == PROGRAM_SEPARATOR:
+            pc = 0
+            continue
+        code, _, comment = line.partition("#")
+        directive = comment.strip()
+        is_instruction = parse_riscv_line(code) is not None
+        if directive.startswith(DIRECTIVE):
+            rest = directive[len(DIRECTIVE):].strip()
+            if is_instruction:
+                specs.append(f"pc {pc} {rest}".strip())
+            elif rest:
+                specs.append(rest)
+        if is_instruction:
+            pc += 1
+    return specs
+
+
+class BreakpointSet:
+    """
+    Breakpoints de un procesador. attach() reemplaza proc.step en la
+    instancia por una versión que revisa los índices después de cada ciclo;
+    hits queda con lo que se disparó en el último ciclo (lista vacía si nada).
+
+    Args:
+        proc: Pipeline, MultithreadedPipeline u OutOfOrderCore.
+        specs (iterable[str | Breakpoint]): Breakpoints iniciales.
+    """
+
+    def __init__(self, proc, specs=()):
+        self.proc = proc
+        self.by_pc = {}
+        self.by_reg = {}
+        self.by_addr = {}
+        self.by_reg_value = {}
+        self.by_addr_value = {}
+        self._cycles = []     # heap (ciclo, orden, Breakpoint)
+        self.breakpoints = []
+        self.hits = []
+        self._step = None
+        self._saved_step = None
+        # OutOfOrderCore deja en WB la instrucción que confirmó en este ciclo;
+        # Pipeline la retira desde WB al empezar el ciclo siguiente.
+        self._commit_view = isinstance(proc, OutOfOrderCore)
+        # Con sistema de memoria el Pipeline escribe el LW al llegar el dato.
+        self._deferred_loads = (not self._commit_view
+                                and getattr(proc, "memory_system", None) is not None)
+        for spec in specs:
+            self.add(spec)
+
+    def __len__(self):
+        return len(self.breakpoints)
+
+    def add(self, spec):
+        """
+        Agrega un breakpoint. ValueError si usa un registro o una dirección
+        que el procesador no tiene (nunca se dispararía, o fallaría al evaluarse).
+        """
+        bp = spec if isinstance(spec, Breakpoint) else Breakpoint(spec)
+        registers, words = len(self.proc.registers), len(self.proc.memory)
+        invalid = ([f"x{reg}" for reg in sorted(bp.registers) if reg >= registers]
+                   + [f"mem[{addr}]" for addr in sorted(bp.addresses) if addr >= words])
+        if invalid:
+            raise ValueError(f"Fuera de rango en {bp.spec!r}: {', '.join(invalid)} "
+                             f"(hay {registers} registros y {words} palabras de memoria)")
+        if bp.kind == "cycle":
+            heapq.heappush(self._cycles, (bp.key, len(self.breakpoints), bp))
+        elif bp.equals is not None:
+            index = self.by_reg_value if bp.kind == "reg" else self.by_addr_value
+            index.setdefault((bp.key, bp.equals), []).append(bp)
+        else:
+            index = {"pc": self.by_pc, "reg": self.by_reg, "mem": self.by_addr}[bp.kind]
+            index.setdefault(bp.key, []).append(bp)
+        self.breakpoints.append(bp)
+        return bp
+
+    # ----------------------------------------------------------------------
+    # Enganche en el procesador
+    # ----------------------------------------------------------------------
+
+    def attach(self):
+        """
+        Engancha el chequeo solo si hay breakpoints (sin ellos, costo cero).
+        """
+        if self.breakpoints and self._step is None:
+            self._saved_step = self.proc.__dict__.get("step")
+            self._step = self.proc.step
+            self.proc.step = self.step
+        self.proc.breakpoints = self
+        return self
+
+    def detach(self):
+        if self._step is not None:
+            if self._saved_step is None:
+                del self.proc.step
+            else:
+                self.proc.step = self._saved_step
+            self._step = None
+        self.proc.breakpoints = None
+
+    # ----------------------------------------------------------------------
+    # Chequeo por ciclo
+    # ----------------------------------------------------------------------
+
+    def _fire(self, bp, value, instr):
+        proc = self.proc
+        if bp.check is not None and not bp.check(value):
+            return
+        if bp.condition is not None and not bp.condition(proc.registers, proc.memory, proc.cycle):
+            return
+        bp.hits += 1
+        self.hits.append({"breakpoint": bp.spec, "cycle": proc.cycle,
+                          "pc": instr.get("pc") if instr else None, "value": value})
+
+    def _written(self, reg, instr):
+        value = self.proc.registers[reg]
+        for bp in self.by_reg.get(reg, ()):
+            self._fire(bp, value, instr)
+        for bp in self.by_reg_value.get((reg, value), ()):
+            self._fire(bp, value, instr)
+
+    def step(self):
+        proc = self.proc
+        retiring = proc.pipeline["WB"]
+        retired = proc.stats["instructions"]
+        hazard_info = self._step()
+        if self.hits:
+            self.hits = []
+
+        if proc.stats["instructions"] != retired:
+            instr = proc.pipeline["WB"] if self._commit_view else retiring
+            bps = self.by_pc.get(instr["pc"])
+            if bps:
+                for bp in bps:
+                    self._fire(bp, None, instr)
+            if "rd2" in instr:
+                # Micro-op fusionado: retira también la segunda instrucción
+                # (su propio pc) y el rd2 de la primera.
+                for bp in self.by_pc.get(instr["tail"]["pc"], ()):
+                    self._fire(bp, None, instr)
+                if (self.by_reg or self.by_reg_value) and instr["rd2"] != instr.get("rd"):
+                    self._written(int(instr["rd2"][1:]), instr)
+            rd = instr.get("rd")
+            if rd:
+                if (self.by_reg or self.by_reg_value) and (instr["op"] != "LW" or not self._deferred_loads):
+                    self._written(int(rd[1:]), instr)
+            elif instr["op"] == "SW" and (self.by_addr or self.by_addr_value):
+                addr, value = instr.get("addr"), instr["store_value"]
+                for bp in self.by_addr.get(addr, ()):
+                    self._fire(bp, value, instr)
+                for bp in self.by_addr_value.get((addr, value), ()):
+                    self._fire(bp, value, instr)
+
+        arrived = getattr(proc, "_arrived", None)
+        if arrived and (self.by_reg or self.by_reg_value):
+            for rd in arrived:
+                self._written(int(rd[1:]), None)
+
+        while self._cycles and self._cycles[0][0] <= proc.cycle:
+            _, _, bp = heapq.heappop(self._cycles)
+            self._fire(bp, proc.cycle, None)
+        return hazard_info
+
+
+def describe_hit(hit):
+    where = f" pc {hit['pc']}" if hit["pc"] is not None else ""
+    return f"{hit['breakpoint']} (ciclo {hit['cycle']}{where})"
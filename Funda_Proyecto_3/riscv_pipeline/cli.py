@@ -0,0 +1,305 @@
+import argparse
+import json
+import time
+
+from .breakpoints import Breakpoint, BreakpointSet, breakpoints_from_source, describe_hit
+from .fusion import FusionUnit, parse_pairs
+from .memory_system import MemorySystem
+from .multithreading import FETCH_POLICIES
+from .parser import load_assembly_programs
+from .processors import MODE_KEYS, create_multithreaded, create_processor, processor_result
+from .steady_state import enable_fast_forward
+from .vector_unit import LANES, VLEN, VectorUnit, has_vector_ops
+
+"""
+Runner sin interfaz gráfica para uso en scripts y corridas por lotes.
+
+Uso:
+    riscv-pipeline programa.s
+    riscv-pipeline programa.s --config hazard --config ooo --json
+    riscv-pipeline programa.s --functional --timing
+    riscv-pipeline programa.s --mem-latency 20 --mem-banks 4 --store-buffer 4
+    riscv-pipeline programa.s --config hazard --early-branch
+    riscv-pipeline hilo0.s hilo1.s --fetch-policy icount
+    riscv-pipeline programa.s --fast-forward
+    riscv-pipeline programa.s --break "mem[8] > 100" --break "pc 4 if x1 == 0"
+    riscv-pipeline programa.s --fusion                 # pares por defecto (ver fusion.py)
+    riscv-pipeline programa.s --fusion ADDI+LW,SLT+BNE
+    riscv-pipeline vectorial.s --vlen 256 --lanes 4 --no-chaining
+
+Con varios programas (varios archivos, o bloques separados por "---") cada
+uno corre en un hilo de hardware del mismo pipeline, y se compara contra
+correrlos solos uno detrás de otro.
+
+Los breakpoints (--break y los "# @break" del programa) detienen la
+simulación en el ciclo en que se disparan; ver breakpoints.py.
+
+Los programas con instrucciones vectoriales (ver vector_unit.py) corren solo
+en Pipeline, ciclo a ciclo (sin núcleo fuera de orden ni modo funcional).
+
+Con --fusion cada configuración en orden corre con fusión de macro-ops y se
+compara contra la misma configuración sin fusión (solo reenvío/predicción).
+Si un breakpoint detuvo la corrida no hay comparación: los ciclos de una
+corrida a medias no dicen cuánto ahorra la fusión.
+
+No importa pygame ni tkinter, así que arranca en pocos milisegundos.
+"""
+
+
+def run_cycles(proc, max_cycles, breakpoints=()):
+    """
+    Avanza ciclo a ciclo hasta terminar, llegar a max_cycles o disparar un
+    breakpoint (quedan en proc.breakpoints.hits).
+    """
+    if not breakpoints:
+        while not proc.finished and proc.cycle < max_cycles:
+            proc.step()
+        return
+    watch = BreakpointSet(proc, breakpoints).attach()
+    while not proc.finished and proc.cycle < max_cycles:
+        proc.step()
+        if watch.hits:
+            break
+
+
+def run_program(program, mode_key, functional=False, max_cycles=1_000_000, memory_system=None,
+                early_branch=False, fast_forward=False, breakpoints=(), fusion=None,
+                vector_unit=None):
+    """
+    Ejecuta el programa completo en una configuración.
+
+    Retorna:
+        El procesador en su estado final (o detenido en un breakpoint).
+
+    Breakpoints con modo funcional o avance rápido dan ValueError: los dos
+    saltan ciclos que los breakpoints necesitan ver.
+    """
+    if breakpoints and (functional or fast_forward):
+        option = "--functional" if functional else "--fast-forward"
+        raise ValueError(f"{option} no admite breakpoints (--break o \"# @break\" en el programa)")
+    proc = create_processor(mode_key, program, memory_system, early_branch, fusion, vector_unit)
+    if fast_forward:
+        # Solo Pipeline sin sistema de memoria; el resto corre ciclo a ciclo.
+        enable_fast_forward(proc, max_cycles)
+    if functional and mode_key != "ooo" and proc.vector_unit is None:
+        proc.run_functional()
+    else:
+        run_cycles(proc, max_cycles, breakpoints)
+    return proc
+
+
+def run_threads(programs, mode_key, fetch_policy="round_robin", max_cycles=1_000_000,
+                memory_system=None, early_branch=False, breakpoints=()):
+    """
+    Ejecuta varios programas como hilos de un mismo pipeline.
+
+    Retorna:
+        MultithreadedPipeline en su estado final.
+    """
+    proc = create_multithreaded(mode_key, programs, fetch_policy, memory_system, early_branch)
+    run_cycles(proc, max_cycles, breakpoints)
+    return proc
+
+
+def main(argv=None):
+    # CPU usado hasta aquí: arranque del intérprete más los imports.
+    startup = time.process_time()
+
+    parser = argparse.ArgumentParser(description="Simulador de pipeline RISC-V sin interfaz.")
+    parser.add_argument("program", nargs="+",
+                        help="Archivo ensamblador (.s); con varios programas, un hilo por programa")
+    parser.add_argument("--config", action="append", choices=MODE_KEYS,
+                        help="Configuración a simular (se puede repetir; por defecto todas)")
+    parser.add_argument("--functional", action="store_true",
+                        help="Usar el motor de bloques traducidos (ciclos estimados)")
+    parser.add_argument("--max-cycles", type=int, default=1_000_000)
+    parser.add_argument("--mem-latency", type=int, default=None,
+                        help="Activa el modelo de memoria principal con esta latencia")
+    parser.add_argument("--mem-banks", type=int, default=4)
+    parser.add_argument("--bank-busy", type=int, default=None, help="Ciclos de ocupación de banco")
+    parser.add_argument("--store-buffer", type=int, default=4, help="Entradas del buffer de escritura")
+    parser.add_argument("--max-loads", type=int, default=2, help="Cargas en vuelo permitidas")
+    parser.add_argument("--early-branch", action="store_true",
+                        help="Resolver BEQ/BNE en ID (comparador y reenvío desde EX/MEM)")
+    parser.add_argument("--fast-forward", action="store_true",
+                        help="Avanzar bucles en régimen estacionario sin simular cada ciclo")
+    parser.add_argument("--break", dest="breakpoints", action="append", default=[], metavar="SPEC",
+                        help='Breakpoint o watchpoint, p. ej. "pc 4", "x5 == 3", "mem[8] if cycle > 100"')
+    parser.add_argument("--fusion", nargs="?", const="default", default=None, metavar="PARES",
+                        help="Fusión de macro-ops en ID (ej. ADDI+LW,SLT+BNE; sin valor, los "
+                             "pares por defecto)")
+    parser.add_argument("--vlen", type=int, default=VLEN, help="Bits por registro vectorial")
+    parser.add_argument("--lanes", type=int, default=LANES,
+                        help="Elementos por ciclo de las unidades vectoriales")
+    parser.add_argument("--no-chaining", action="store_true",
+                        help="Sin encadenamiento entre instrucciones vectoriales")
+    parser.add_argument("--fetch-policy", choices=FETCH_POLICIES, default="round_robin",
+                        help="Política de búsqueda con varios hilos")
+    parser.add_argument("--registers", action="store_true", help="Mostrar registros finales")
+    parser.add_argument("--json", action="store_true", help="Salida en JSON")
+    parser.add_argument("--timing", action="store_true", help="Mostrar tiempos de arranque y simulación")
+    args = parser.parse_args(argv)
+
+    programs = [program for path in args.program for program in load_assembly_programs(path)]
+    breakpoints = list(args.breakpoints)
+    for path in args.program:
+        with open(path, "r") as f:
+            breakpoints += breakpoints_from_source(f.read())
+    try:
+        breakpoints = [Breakpoint(spec) for spec in breakpoints]
+    except ValueError as e:
+        parser.error(str(e))
+    if breakpoints and (args.functional or args.fast_forward):
+        option = "--functional" if args.functional else "--fast-forward"
+        parser.error(f"{option} no admite breakpoints (--break o \"# @break\" en el programa): "
+                     "saltea ciclos que los breakpoints necesitan ver")
+    programs = programs or [[]]
+    threaded = len(programs) > 1
+    configs = args.config or MODE_KEYS
+    if threaded:
+        if args.functional or (args.config and "ooo" in args.config):
+            parser.error("con varios hilos no hay modo funcional ni núcleo fuera de orden")
+        configs = [mode_key for mode_key in configs if mode_key != "ooo"]
+    vector = any(has_vector_ops(program) for program in programs)
+    if vector:
+        if threaded or (args.config and "ooo" in args.config):
+            parser.error("las instrucciones vectoriales solo corren en Pipeline de un hilo")
+        if args.vlen < 32 or args.vlen % 32:
+            parser.error("--vlen debe ser un múltiplo de 32")
+        configs = [mode_key for mode_key in configs if mode_key != "ooo"]
+    fusion_pairs = None
+    if args.fusion is not None:
+        if threaded or args.functional:
+            parser.error("--fusion no aplica con varios hilos ni en modo funcional")
+        fusion_pairs = parse_pairs(args.fusion)
+        try:
+            FusionUnit(fusion_pairs)
+        except ValueError as e:
+            parser.error(str(e))
+    if breakpoints:
+        # Registros y direcciones de los breakpoints contra un procesador de prueba.
+        probe = (create_multithreaded(configs[0], programs) if threaded
+                 else create_processor(configs[0], programs[0]))
+        try:
+            BreakpointSet(probe, breakpoints)
+        except ValueError as e:
+            parser.error(str(e))
+
+    def new_vector_unit():
+        if not vector:
+            return None
+        return VectorUnit(args.vlen, args.lanes, not args.no_chaining)
+
+    def new_memory_system():
+        if args.mem_latency is None:
+            return None
+        return MemorySystem(args.mem_latency, args.mem_banks, args.bank_busy,
+                            args.store_buffer, args.max_loads)
+
+    results = []
+    start = time.perf_counter()
+    for mode_key in configs:
+        if threaded:
+            proc = run_threads(programs, mode_key, args.fetch_policy, args.max_cycles,
+                               new_memory_system(), args.early_branch, breakpoints)
+        else:
+            fusion = FusionUnit(fusion_pairs) if fusion_pairs and mode_key != "ooo" else None
+            proc = run_program(programs[0], mode_key, args.functional, args.max_cycles,
+                               new_memory_system(), args.early_branch, args.fast_forward,
+                               breakpoints, fusion, new_vector_unit())
+        result = processor_result(proc, mode_key)
+        result["finished"] = proc.finished
+        watch = getattr(proc, "breakpoints", None)
+        if watch is not None and watch.hits:
+            result["breakpoint"] = watch.hits
+        if getattr(proc, "memory_system", None) is not None:
+            result["memory"] = dict(proc.memory_system.stats)
+        if threaded:
+            # Referencia: cada programa solo en el mismo pipeline, uno detrás de otro.
+            isolated = [run_program(program, mode_key, max_cycles=args.max_cycles,
+                                    memory_system=new_memory_system(),
+                                    early_branch=args.early_branch)
+                        for program in programs]
+            result["isolated_cycles"] = sum(p.cycle for p in isolated)
+            result["isolated_stalls"] = sum(p.stats["stalls"] for p in isolated)
+        if getattr(proc, "fusion", None) is not None:
+            fused = result["fused"]
+            result["fusion"] = {
+                "pairs": list(fusion_pairs),
+                "rate": 2 * fused / result["instructions"] if result["instructions"] else 0.0,
+            }
+            if "breakpoint" not in result:
+                # Referencia: la misma configuración sin fusión, corrida completa.
+                baseline = run_program(programs[0], mode_key, max_cycles=args.max_cycles,
+                                       memory_system=new_memory_system(),
+                                       early_branch=args.early_branch,
+                                       vector_unit=new_vector_unit())
+                result["fusion"].update(baseline_cycles=baseline.cycle,
+                                        baseline_stalls=baseline.stats["stalls"],
+                                        cycles_saved=baseline.cycle - proc.cycle)
+        if args.registers:
+            if threaded:
+                result["registers"] = [list(proc.thread_registers(t)) for t in range(len(programs))]
+            else:
+                result["registers"] = list(proc.registers)
+        results.append(result)
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        output = {"program": args.program, "results": results}
+        if args.timing:
+            output["startup_ms"] = startup * 1000
+            output["simulation_ms"] = elapsed * 1000
+        print(json.dumps(output, indent=2))
+        return 0
+
+    for result in results:
+        ipc = result["instructions"] / result["cycles"] if result["cycles"] else 0.0
+        state = "" if result["finished"] else "  (sin terminar)"
+        if "breakpoint" in result:
+            state = "  (detenido en " + "; ".join(describe_hit(hit) for hit in result["breakpoint"]) + ")"
+        print(f"{result['config']:<14} ciclos {result['cycles']:>10,} | "
+              f"instr {result['instructions']:>10,} | stalls {result['stalls']:>8,} | "
+              f"IPC {ipc:.3f}{state}")
+        if "fast_forward" in result:
+            ff = result["fast_forward"]
+            print(f"    avance rápido: {ff['iterations']:,} iteraciones, {ff['cycles']:,} ciclos"
+                  f" en {ff['fast_forwards']} tramos")
+        if "fusion" in result:
+            fusion = result["fusion"]
+            line = f"    fusión: {result['fused']:,} pares ({fusion['rate']:.1%} de las instrucciones) | "
+            if "baseline_cycles" in fusion:
+                line += (f"sin fusión {fusion['baseline_cycles']:,} ciclos, {fusion['baseline_stalls']:,} "
+                         f"stalls -> {fusion['cycles_saved']:,} ciclos ahorrados")
+            else:
+                line += "sin comparación (detenido en un breakpoint)"
+            print(line)
+        if "vector" in result:
+            print("    vector: " + ", ".join(f"{k} {v}" for k, v in result["vector"].items())
+                  + f", vector_stalls {result['vector_stalls']}")
+        if "memory" in result:
+            print("    memoria: " + ", ".join(f"{k} {v}" for k, v in result["memory"].items())
+                  + f", memory_stalls {result['memory_stalls']}")
+        for thread in result.get("threads", []):
+            finish = thread["finish_cycle"] if thread["finish_cycle"] is not None else "-"
+            print(f"    T{thread['tid']:<3} instr {thread['instructions']:>8,} | "
+                  f"stalls datos {thread['data_stalls']:>6,} saltos {thread['branch_stalls']:>6,} | "
+                  f"cambios {thread['switches']:>5,} | fin {finish:>8} | IPC {thread['ipc']:.3f}")
+        if "isolated_cycles" in result:
+            saved = result["isolated_cycles"] - result["cycles"]
+            print(f"    {result['fetch_policy']}: solos {result['isolated_cycles']:,} ciclos, "
+                  f"{result['isolated_stalls']:,} stalls -> {saved:,} ciclos ahorrados, "
+                  f"{result['isolated_stalls'] - result['stalls']:,} stalls ocultos")
+        if args.registers:
+            banks = result["registers"] if threaded else [result["registers"]]
+            for tid, regs in enumerate(banks):
+                prefix = f"T{tid} " if threaded else ""
+                for i in range(0, 32, 8):
+                    print(f"    {prefix}" + "  ".join(f"x{j:02d}={regs[j]}" for j in range(i, i + 8)))
+    if args.timing:
+        print(f"arranque {startup * 1000:.1f} ms (CPU) | simulación {elapsed * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
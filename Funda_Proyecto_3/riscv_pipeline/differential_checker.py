@@ -0,0 +1,292 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .fusion import FusionUnit
+from .golden_model import GoldenModel
+from .hazard_unit import HazardUnit
+from .memory_system import MemorySystem
+from .processors import create_processor
+from .program_generator import generate_program, program_text
+from .steady_state import enable_fast_forward
+
+"""
+Pruebas diferenciales: ejecuta programas aleatorios en Pipeline con cada
+configuración de HazardUnit y compara el estado final (registers/memory)
+contra GoldenModel.
+
+Uso:
+    riscv-pipeline-check --programs 5000 --workers 4
+    python -m riscv_pipeline.differential_checker --programs 500 --length 40 --ooo
+    riscv-pipeline-check --memory      # también con el modelo de memoria ("hazard+mem", ...)
+    riscv-pipeline-check --early-branch   # también con saltos resueltos en ID ("hazard+early", ...)
+    riscv-pipeline-check --fast-forward   # también con avance rápido de bucles ("hazard+ff", ...)
+    riscv-pipeline-check --fusion         # también con fusión de macro-ops ("hazard+fusion", ...)
+    riscv-pipeline-check --vector-rate 0.2   # programas con instrucciones vectoriales
+
+Los casos que fallan se minimizan quitando instrucciones mientras el fallo
+se mantenga, y se imprimen como texto ensamblador listo para el editor.
+Cualquier optimización de Pipeline.step o HazardUnit debería pasar este
+chequeo sin diferencias.
+"""
+
+CONFIGS = list(HazardUnit.MODES)
+
+# Tope de ciclos por instrucción ejecutada en el modelo de referencia; si el
+# procesador no termina antes se reporta como bloqueo.
+CYCLES_PER_INSTRUCTION = 20
+MAX_GOLDEN_STEPS = 20_000
+
+# Sistema de memoria de las configuraciones "<modo>+mem": latencia alta y
+# pocos recursos para provocar conflictos de banco y congelamientos de MEM.
+MEMORY_CONFIG = {"latency": 8, "banks": 2, "bank_busy": 4, "store_buffer_size": 2,
+                 "max_outstanding": 2}
+
+
+# ----------------------------------------------------------------------
+# Ejecución de un programa
+# ----------------------------------------------------------------------
+
+def run_golden(program):
+    """
+    Retorna el GoldenModel ejecutado, o None si el programa no termina.
+    """
+    model = GoldenModel(program)
+    if not model.run(MAX_GOLDEN_STEPS):
+        return None
+    return model
+
+
+def _create(config, program):
+    mode_key, *options = config.split("+")
+    proc = create_processor(mode_key, program,
+                            MemorySystem(**MEMORY_CONFIG) if "mem" in options else None,
+                            early_branch="early" in options,
+                            fusion=FusionUnit() if "fusion" in options else None)
+    if "ff" in options:
+        enable_fast_forward(proc)
+    return proc
+
+
+def _timing(proc):
+    return (proc.cycle,) + tuple(sorted(proc.stats.items()))
+
+
+def compare(program, config, golden):
+    """
+    Ejecuta el programa en una configuración y lo compara con el golden model.
+
+    Retorna:
+        dict o None: Descripción de la diferencia, o None si coinciden.
+    """
+    proc = _create(config, program)
+    max_cycles = (golden.steps + 10) * CYCLES_PER_INSTRUCTION
+    try:
+        while not proc.finished and proc.cycle < max_cycles:
+            proc.step()
+    except Exception as e:
+        return {"config": config, "error": f"{type(e).__name__}: {e}"}
+
+    if not proc.finished:
+        return {"config": config, "error": f"no terminó en {max_cycles} ciclos"}
+
+    registers = {f"x{i}": (golden.registers[i], proc.registers[i])
+                 for i in range(32) if golden.registers[i] != proc.registers[i]}
+    memory = {addr: (golden.memory[addr], proc.memory[addr])
+              for addr in range(len(golden.memory)) if golden.memory[addr] != proc.memory[addr]}
+    vector = {}
+    if golden.vector is not None:
+        vector = {f"v{i}": (list(expected), list(got))
+                  for i, (expected, got) in enumerate(zip(golden.vector.registers,
+                                                          proc.vector_unit.registers))
+                  if expected != got}
+    if registers or memory or vector:
+        return {"config": config, "registers": registers, "memory": memory, "vector": vector}
+
+    if "+ff" in config:
+        # El avance rápido tiene que dar exactamente los mismos ciclos y contadores.
+        reference = _create(config.replace("+ff", ""), program)
+        while not reference.finished and reference.cycle < max_cycles:
+            reference.step()
+        if _timing(reference) != _timing(proc):
+            return {"config": config, "error": f"tiempo {_timing(proc)} != {_timing(reference)}"}
+    return None
+
+
+def check_program(program, configs=CONFIGS):
+    """
+    Compara el programa en todas las configuraciones.
+
+    Retorna:
+        list[dict]: Diferencias encontradas (vacía si todo coincide).
+    """
+    golden = run_golden(program)
+    if golden is None:
+        return []
+    if golden.vector is not None:
+        # El núcleo fuera de orden no tiene extensión vectorial.
+        configs = [config for config in configs if config != "ooo"]
+    mismatches = []
+    for config in configs:
+        mismatch = compare(program, config, golden)
+        if mismatch:
+            mismatches.append(mismatch)
+    return mismatches
+
+
+# ----------------------------------------------------------------------
+# Minimización
+# ----------------------------------------------------------------------
+
+def minimize(program, config):
+    """
+    Reduce un programa que falla en 'config' quitando bloques de instrucciones
+    (primero grandes, luego de a una) mientras el fallo se mantenga.
+    """
+    def fails(candidate):
+        golden = run_golden(candidate)
+        return golden is not None and compare(candidate, config, golden) is not None
+
+    chunk = max(1, len(program) // 2)
+    while True:
+        i = 0
+        while i < len(program):
+            candidate = program[:i] + program[i + chunk:]
+            if candidate and fails(candidate):
+                program = candidate
+            else:
+                i += chunk
+        if chunk == 1:
+            return program
+        chunk //= 2
+
+
+# ----------------------------------------------------------------------
+# Corrida en paralelo
+# ----------------------------------------------------------------------
+
+def check_seed(args):
+    """
+    Tarea del pool: genera el programa del seed y lo compara.
+    """
+    seed, length, options, configs = args
+    program = generate_program(seed, length, **options)
+    return [{"seed": seed, "mismatch": mismatch, "program": program}
+            for mismatch in check_program(program, configs)]
+
+
+def minimize_failure(failure):
+    """
+    Tarea del pool: minimiza un fallo y recalcula su diferencia.
+    """
+    reduced = minimize(failure["program"], failure["mismatch"]["config"])
+    golden = run_golden(reduced)
+    return dict(failure,
+                mismatch=compare(reduced, failure["mismatch"]["config"], golden),
+                original_length=len(failure["program"]),
+                program=reduced)
+
+
+def run_checks(programs, seed=0, length=24, workers=None, configs=CONFIGS,
+               max_minimized=10, **options):
+    """
+    Ejecuta 'programs' programas aleatorios repartidos en un pool de procesos.
+
+    Solo se minimizan los primeros max_minimized fallos de cada configuración
+    (suelen repetir la misma causa y minimizar es lo más caro).
+
+    Retorna:
+        tuple: (fallos minimizados, cantidad total de fallos por configuración)
+    """
+    tasks = [(s, length, options, configs) for s in range(seed, seed + programs)]
+    counts = {config: 0 for config in configs}
+    selected = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for result in pool.map(check_seed, tasks, chunksize=32):
+            for failure in result:
+                config = failure["mismatch"]["config"]
+                counts[config] += 1
+                if counts[config] <= max_minimized:
+                    selected.append(failure)
+        minimized = list(pool.map(minimize_failure, selected))
+    return minimized, counts
+
+
+def _print_failure(failure):
+    mismatch = failure["mismatch"]
+    print(f"--- seed {failure['seed']} | config {mismatch['config']} "
+          f"| {failure['original_length']} -> {len(failure['program'])} instrucciones")
+    if "error" in mismatch:
+        print(f"    {mismatch['error']}")
+    for reg, (expected, got) in mismatch.get("registers", {}).items():
+        print(f"    {reg}: esperado {expected}, obtenido {got}")
+    for addr, (expected, got) in mismatch.get("memory", {}).items():
+        print(f"    mem[{addr}]: esperado {expected}, obtenido {got}")
+    for reg, (expected, got) in mismatch.get("vector", {}).items():
+        print(f"    {reg}: esperado {expected}, obtenido {got}")
+    print(program_text(failure["program"]))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pruebas diferenciales contra el golden model.")
+    parser.add_argument("--programs", type=int, default=2000, help="Cantidad de programas")
+    parser.add_argument("--seed", type=int, default=0, help="Primer seed")
+    parser.add_argument("--length", type=int, default=24, help="Largo aproximado de cada programa")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Procesos del pool")
+    parser.add_argument("--dependency-density", type=float, default=0.5)
+    parser.add_argument("--load-use-rate", type=float, default=0.5)
+    parser.add_argument("--branch-rate", type=float, default=0.1)
+    parser.add_argument("--loop-rate", type=float, default=0.05)
+    parser.add_argument("--vector-rate", type=float, default=0.0,
+                        help="Probabilidad de instrucciones vectoriales en los programas")
+    parser.add_argument("--max-loop-iterations", type=int, default=4,
+                        help="Iteraciones máximas de cada bucle (más para ejercitar --fast-forward)")
+    parser.add_argument("--minimize", type=int, default=10,
+                        help="Fallos a minimizar por configuración")
+    parser.add_argument("--ooo", action="store_true", help="Incluir también OutOfOrderCore")
+    parser.add_argument("--memory", action="store_true",
+                        help="Incluir también cada configuración con el sistema de memoria")
+    parser.add_argument("--early-branch", action="store_true",
+                        help="Incluir también cada configuración con saltos resueltos en ID")
+    parser.add_argument("--fast-forward", action="store_true",
+                        help="Incluir también cada configuración con avance rápido de bucles")
+    parser.add_argument("--fusion", action="store_true",
+                        help="Incluir también cada configuración con fusión de macro-ops")
+    args = parser.parse_args(argv)
+
+    configs = CONFIGS + (["ooo"] if args.ooo else [])
+    if args.memory:
+        configs += [f"{config}+mem" for config in CONFIGS]
+    if args.early_branch:
+        configs += [f"{config}+early" for config in CONFIGS]
+        if args.memory:
+            configs += [f"{config}+early+mem" for config in CONFIGS]
+    if args.fast_forward:
+        configs += [f"{config}+ff" for config in CONFIGS]
+        if args.early_branch:
+            configs += [f"{config}+early+ff" for config in CONFIGS]
+    if args.fusion:
+        configs += [f"{config}+fusion" for config in CONFIGS]
+        if args.early_branch:
+            configs += [f"{config}+early+fusion" for config in CONFIGS]
+        if args.memory:
+            configs += [f"{config}+fusion+mem" for config in CONFIGS]
+    failures, counts = run_checks(args.programs, args.seed, args.length, args.workers,
+                                  configs, args.minimize,
+                                  dependency_density=args.dependency_density,
+                                  load_use_rate=args.load_use_rate,
+                                  branch_rate=args.branch_rate,
+                                  loop_rate=args.loop_rate,
+                                  vector_rate=args.vector_rate,
+                                  max_loop_iterations=args.max_loop_iterations)
+
+    for failure in failures:
+        _print_failure(failure)
+    print(f"{args.programs} programas x {len(configs)} configuraciones")
+    for config, count in counts.items():
+        print(f"    {config:<24} {count} diferencias")
+    return 1 if any(counts.values()) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
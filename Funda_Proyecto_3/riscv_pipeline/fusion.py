@@ -0,0 +1,116 @@
+from .alu import R_TYPE_OPS, execute
+
+"""
+Fusión de macro-operaciones en ID (macro-op fusion).
+
+Cuando la instrucción en ID y la que acaba de entrar a IF forman un par
+configurado y la segunda usa el resultado de la primera, el decodificador las
+junta en un solo micro-op que recorre EX/MEM/WB ocupando un único slot:
+
+    ADDI x5, x5, 4  +  LW x6, 0(x5)     dirección con el puntero recién calculado
+    SLT x7, x1, x2  +  BNE x7, x0, -3   salto sobre el resultado de la comparación
+    ADD x5, x5, x3  +  SW x6, 0(x5)     incremento de puntero y escritura
+
+En EX se calcula primero la instrucción de cabeza y su resultado alimenta a
+la segunda sin pasar por el reenvío: desaparecen el riesgo RAW interno (o el
+stall de salto en ID) y el slot que ocupaba la segunda instrucción, y IF
+vuelve a buscar en el mismo ciclo.
+
+El micro-op es la segunda instrucción (su 'op' decide MEM y el salto) con:
+    pc, seq        los de la primera instrucción
+    rs1, rs2       las fuentes externas del par (a lo sumo dos)
+    rd2, result2   destino y resultado de la primera instrucción
+    head, tail     las dos instrucciones originales
+HazardUnit trata rd2 como un destino más. Solo en Pipeline con programa en
+memoria (ni traza, ni multihilo, ni fuera de orden); el modo funcional no
+modela la fusión.
+"""
+
+DEFAULT_PAIRS = ("ADDI+LW", "ADD+LW", "SLT+BNE", "SLT+BEQ", "SLTU+BNE", "SLTU+BEQ",
+                 "ADD+SW", "ADDI+SW")
+
+HEAD_OPS = tuple(R_TYPE_OPS) + ("ADDI",)
+TAIL_OPS = ("LW", "SW", "BEQ", "BNE")
+
+
+def parse_pairs(text):
+    """
+    "ADDI+LW,SLT+BNE" (o "default") -> tupla de pares.
+    """
+    if text in (None, "", "default"):
+        return DEFAULT_PAIRS
+    return tuple(pair.strip().upper() for pair in text.split(",") if pair.strip())
+
+
+class FusionUnit:
+    """
+    Reconoce los pares fusionables y ejecuta el micro-op resultante.
+
+    Args:
+        pairs (iterable[str]): Pares "CABEZA+COLA" (ver DEFAULT_PAIRS). La cabeza
+            es una operación de la ALU y la cola LW, SW, BEQ o BNE.
+    """
+
+    def __init__(self, pairs=DEFAULT_PAIRS):
+        self.pairs = set()
+        for pair in pairs:
+            head, _, tail = pair.partition("+")
+            if head not in HEAD_OPS or tail not in TAIL_OPS:
+                raise ValueError(f"Par de fusión inválido: {pair!r}")
+            self.pairs.add((head, tail))
+
+    def fuse(self, head, tail):
+        """
+        Micro-op fusionado de head + tail, o None si no se pueden fusionar.
+        """
+        if (head.get("op"), tail.get("op")) not in self.pairs or "head" in head:
+            return None
+        rd = head.get("rd")
+        tail_sources = [tail.get(src) for src in ("rs1", "rs2") if tail.get(src)]
+        if not rd or rd == "x0" or rd not in tail_sources:
+            return None     # Solo pares dependientes
+
+        # Fuentes externas: las de la cabeza (valor previo) y las de la cola que
+        # no produce la cabeza.
+        sources = []
+        for reg in [head.get("rs1"), head.get("rs2")] + [reg for reg in tail_sources if reg != rd]:
+            if reg and reg != "x0" and reg not in sources:
+                sources.append(reg)
+        if len(sources) > 2:
+            return None
+
+        fused = dict(tail)
+        fused.pop("rs1", None)
+        fused.pop("rs2", None)
+        fused.update(zip(("rs1", "rs2"), sources))
+        fused.update(pc=head["pc"], seq=head["seq"], rd2=rd, head=head, tail=tail)
+        return fused
+
+    def execute(self, instr, a, b):
+        """
+        Etapa EX del micro-op: a y b son los valores (ya reenviados) de sus
+        rs1/rs2. Deja result2 y addr/store_value en el registro.
+
+        Retorna:
+            bool o None: Si la cola es un salto, si se toma; si no, None.
+        """
+        head, tail = instr["head"], instr["tail"]
+        values = {"x0": 0}
+        if instr.get("rs1"):
+            values[instr["rs1"]] = a
+        if instr.get("rs2"):
+            values[instr["rs2"]] = b
+
+        second = head["imm"] if head["op"] == "ADDI" else values[head["rs2"]]
+        instr["result2"] = execute(head["op"], values[head["rs1"]], second)
+        # La cola ve el resultado de la cabeza (dependencia interna del par).
+        values[head["rd"]] = instr["result2"]
+
+        op = tail["op"]
+        if op in ("LW", "SW"):
+            instr["addr"] = values[tail["rs1"]] + tail["imm"]
+            if op == "SW":
+                instr["store_value"] = values[tail["rs2"]]
+            return None
+        equal = values[tail["rs1"]] == values[tail["rs2"]]
+        return equal if op == "BEQ" else not equal
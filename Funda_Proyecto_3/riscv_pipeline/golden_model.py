@@ -0,0 +1,113 @@
+from .alu import R_TYPE_OPS, execute
+from .state import int32_array
+from .vector_unit import VECTOR_OPS, VLEN, VectorRegisters, has_vector_ops
+
+"""
+Modelo funcional de referencia (golden model) del ISA soportado.
+
+Intérprete secuencial, una instrucción a la vez y sin ningún detalle de
+tiempo: sirve como verdad de referencia para comparar el estado final
+(registers/memory) de Pipeline y de los demás modelos.
+
+Semántica (la misma que usa Pipeline):
+    - Memoria direccionada por palabra; accesos fuera de rango se ignoran
+      (LW devuelve 0, SW no escribe).
+    - x0 siempre vale 0.
+    - Registros y memoria de 32 bits con signo; la aritmética desborda en
+      complemento a dos (alu.wrap32).
+    - BEQ/BNE saltan a pc + imm (en instrucciones); un destino fuera del
+      programa lo termina.
+    - Las instrucciones vectoriales usan vector_unit.VectorRegisters
+      (self.vector, solo si el programa tiene alguna).
+"""
+
+
+class GoldenModel:
+    def __init__(self, instruction_memory, memory_size=64, vlen=VLEN):
+        """
+        Args:
+            instruction_memory (list[dict]): Programa ya parseado.
+            memory_size (int): Palabras de la memoria de datos.
+            vlen (int): Bits por registro vectorial.
+        """
+        self.instruction_memory = instruction_memory or []
+        self.registers = int32_array(32)
+        self.memory = int32_array(memory_size)
+        self.vector = VectorRegisters(vlen) if has_vector_ops(self.instruction_memory) else None
+        self.pc = 0
+        self.steps = 0
+
+    @property
+    def finished(self):
+        return not 0 <= self.pc < len(self.instruction_memory)
+
+    def _reg(self, name):
+        return self.registers[int(name[1:])]
+
+    def step(self):
+        """
+        Ejecuta la instrucción en pc.
+
+        Retorna:
+            dict o None: Copia de la instrucción con 'pc' y, según el caso,
+            'taken' (saltos) y 'addr' (LW/SW). None si el programa terminó.
+        """
+        if self.finished:
+            return None
+
+        instr = dict(self.instruction_memory[self.pc])
+        instr["pc"] = self.pc
+        op = instr["op"]
+        next_pc = self.pc + 1
+        value = None
+
+        if op in R_TYPE_OPS:
+            value = execute(op, self._reg(instr["rs1"]), self._reg(instr["rs2"]))
+
+        elif op == "ADDI":
+            value = execute(op, self._reg(instr["rs1"]), instr["imm"])
+
+        elif op == "LW":
+            addr = self._reg(instr["rs1"]) + instr["imm"]
+            instr["addr"] = addr
+            value = self.memory[addr] if 0 <= addr < len(self.memory) else 0
+
+        elif op == "SW":
+            addr = self._reg(instr["rs1"]) + instr["imm"]
+            instr["addr"] = addr
+            if 0 <= addr < len(self.memory):
+                self.memory[addr] = self._reg(instr["rs2"])
+
+        elif op in ["BEQ", "BNE"]:
+            equal = self._reg(instr["rs1"]) == self._reg(instr["rs2"])
+            taken = equal if op == "BEQ" else not equal
+            instr["taken"] = taken
+            if taken:
+                next_pc = self.pc + instr["imm"]
+
+        elif op in VECTOR_OPS:
+            self.vector.execute(instr, self._reg(instr["rs1"]) if "rs1" in instr else 0)
+            if op == "VSETVLI":
+                value = instr["result"]
+            else:
+                self.vector.apply(instr, self.memory)
+
+        if value is not None:
+            rd = int(instr["rd"][1:])
+            if rd != 0:
+                self.registers[rd] = value
+
+        self.pc = next_pc
+        self.steps += 1
+        return instr
+
+    def run(self, max_steps=100_000):
+        """
+        Ejecuta hasta terminar o hasta max_steps instrucciones.
+
+        Retorna:
+            bool: True si el programa terminó.
+        """
+        while not self.finished and self.steps < max_steps:
+            self.step()
+        return self.finished
@@ -0,0 +1,4 @@
+"""
+Interfaz gráfica (pygame). Ejecutar con `riscv-pipeline-gui` o
+`python -m riscv_pipeline.gui`.
+"""
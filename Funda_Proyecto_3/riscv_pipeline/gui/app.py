@@ -0,0 +1,901 @@
+import argparse
+import time
+
+import pygame
+
+from ..ooo_core import OutOfOrderCore
+from .render_pipeline import draw_pipeline
+from .render_hazard_unit import draw_hazard_info
+from .render_pipeline_diagram import draw_pipeline_diagram, follow_position, export_png
+from ..pipeline_diagram import PipelineDiagram, export_svg
+from ..multithreading import FETCH_POLICIES, MultithreadedPipeline
+from ..fusion import DEFAULT_PAIRS
+from ..parser import parse_programs
+from ..breakpoints import BreakpointSet, breakpoints_from_source, describe_hit
+from ..processors import MODE_KEYS, ProcessorGroup
+from .text_editor import TextEditor
+from .frame_profiler import FrameProfiler
+from .input_script import InputRecorder
+from ..results_store import DEFAULT_DB_PATH, ResultsStore
+
+"""
+Interfaz gráfica: varios procesadores lado a lado con editor, diagramas e historial.
+
+Cada procesador es una configuración (panel "Configuración de procesadores",
+con + / - para agregar o quitar). Todos comparten el programa decodificado
+una sola vez (ProcessorGroup) y avanzan juntos en cada ciclo; los paneles se
+generan según la cantidad: con uno o dos, columnas completas; con más, una
+grilla de celdas compactas. Clic sobre un procesador muestra sus registros.
+
+Importar este módulo no abre ninguna ventana: pygame, la pantalla, las fuentes
+y el historial se crean en main(). tkinter solo se carga cuando hace falta
+mostrar un cuadro de diálogo.
+
+Los comentarios "# @break ..." del editor ponen breakpoints y watchpoints
+(ver breakpoints.py): en modo automático o completo la simulación se pausa
+al dispararse uno y el panel de información dice cuál fue.
+
+F7 muestra el overlay de perfilado (tiempo de cuadro, fps y secciones más
+lentas); gui.benchmark corre la misma interfaz sin ventana.
+"""
+
+# Estado de la interfaz (se inicializa en main()).
+screen = None
+clock = None
+font = small_font = tiny_font = None
+tk_root = None
+
+programs = []      # Programa cargado: uno por hilo (bloques "---" del editor)
+
+editor = None
+
+# Configuración de cada procesador; group se reconstruye al cargar el programa.
+config_modes = ["hazard", "hazard_branch"]
+group = ProcessorGroup(config_modes, [[]])
+processors = group.processors
+selected = 0            # Procesador cuyos registros se muestran primero
+mode = None
+program_loaded = False
+execution_active = False
+execution_finished = False
+execution_start_time = 0
+execution_elapsed = 0
+breakpoint_message = None   # Último breakpoint disparado (panel de información)
+start_time = None
+running = True
+
+# Historial persistente: solo se mantiene en memoria la página visible.
+results_store = None
+
+# Diagrama de tiempo (F2 alterna la vista, F3 exporta SVG/PNG)
+show_diagram = False
+diagrams = [PipelineDiagram() for _ in processors]
+diagram_scroll = None   # None = seguir los últimos ciclos; si no, (fila, ciclo)
+history_offset = 0
+history_column = 0      # Primer procesador con columna visible (Shift + rueda)
+history_page = []
+
+# F4: modelo de memoria principal (DRAM con bancos) para la próxima corrida.
+memory_model = False
+
+# F5: saltos resueltos en ID (comparador en ID) para la próxima corrida.
+early_branch = False
+
+# F6: política de búsqueda cuando el editor tiene varios programas ("---").
+fetch_policy = FETCH_POLICIES[0]
+
+# F7: overlay con los tiempos por cuadro. El perfilador mide siempre.
+show_profiler = False
+profiler = FrameProfiler()
+frame = 0
+
+# F8: fusión de macro-ops (pares por defecto) para la próxima corrida.
+fusion = False
+
+LATENCIES = {"IF": 0.1, "ID": 0.15, "EX": 0.2, "MEM": 0.25, "WB": 0.1}
+
+CLOCK_FREQUENCY_HZ = 1_000_000_000  # 1 GHz
+CYCLE_DURATION_NS = 1_000_000_000 / CLOCK_FREQUENCY_HZ  # 1 ns por ciclo
+
+
+def calculate_simulated_time_ns(cycles):
+    return cycles * CYCLE_DURATION_NS
+
+
+def format_time_ns(nanoseconds):
+    if nanoseconds < 1_000:
+        return f"{nanoseconds:.0f} ns"
+    elif nanoseconds < 1_000_000:
+        return f"{nanoseconds / 1_000:.2f} μs"
+    elif nanoseconds < 1_000_000_000:
+        return f"{nanoseconds / 1_000_000:.2f} ms"
+    else:
+        return f"{nanoseconds / 1_000_000_000:.2f} s"
+
+
+# Etiquetas cortas de los botones de configuración (una fila por procesador).
+MODE_LABELS = {
+    "no_hazard": "Sin UR",
+    "hazard": "UR",
+    "branch": "Pred.",
+    "hazard_branch": "UR+Pred.",
+    "ooo": "OoO",
+}
+
+CONFIG_ROW_H = 26
+COMPACT_CELL_W = 170            # Ancho mínimo de una celda de la grilla
+COMPACT_PIPELINE_H = 130        # Alto del panel de pipeline en la grilla
+HISTORY_COLUMN_W = 88           # Ancho de la columna de cada procesador en el historial
+
+
+def get_mode_description(mode_key):
+    return {
+        "no_hazard": "Sin Unidad de Riesgos",
+        "hazard": "Unidad de Riesgos",
+        "branch": "Predicción de Saltos",
+        "hazard_branch": "Riesgos + Predicción",
+        "ooo": "Fuera de Orden (Tomasulo)"
+    }.get(mode_key, "Desconocido")
+
+
+def run_functional(proc, budget=100_000):
+    """
+    Modo funcional: traducción por bloques en Pipeline. El núcleo fuera de
+    orden, el pipeline multihilo y los programas vectoriales no tienen
+    modelo por bloques, así que avanzan ciclos en lote.
+    """
+    if isinstance(proc, (OutOfOrderCore, MultithreadedPipeline)) or proc.vector_unit is not None:
+        for _ in range(budget):
+            if proc.step() is None:
+                break
+    else:
+        proc.run_functional(max_blocks=budget)
+
+
+def step_processors():
+    """
+    Avanza un ciclo todos los procesadores y agrega la columna a sus diagramas.
+    """
+    group.step()
+    for proc, diagram in zip(processors, diagrams):
+        diagram.record(proc.pipeline, proc.cycle)
+
+
+def reset_processors(programs=((),), source=""):
+    """
+    Crea un procesador por configuración (todos con el mismo programa) y sus
+    diagramas, y engancha los breakpoints marcados en el editor.
+    """
+    global group, processors, diagrams, diagram_scroll, selected
+    new_group = ProcessorGroup(config_modes, programs, memory_model, early_branch, fetch_policy,
+                               DEFAULT_PAIRS if fusion else None)
+    # Primero los breakpoints: si alguno es inválido (ValueError) no se toca el estado.
+    specs = breakpoints_from_source(source)
+    watches = [BreakpointSet(proc, specs) for proc in new_group.processors]
+    for watch in watches:
+        watch.attach()
+    group = new_group
+    processors = group.processors
+    diagrams = [PipelineDiagram() for _ in processors]
+    diagram_scroll = None
+    selected = min(selected, len(processors) - 1)
+
+
+def breakpoint_hit():
+    """
+    Texto con los breakpoints que se dispararon en el último ciclo (None si
+    ninguno).
+    """
+    parts = []
+    for processor_id, proc in enumerate(processors, 1):
+        watch = getattr(proc, "breakpoints", None)
+        if watch is not None and watch.hits:
+            parts.append(f"P{processor_id}: " + "; ".join(describe_hit(hit) for hit in watch.hits))
+    return " | ".join(parts) or None
+
+
+def diagram_rect(cell):
+    """
+    Área del diagrama de tiempo: el panel del pipeline o, en la grilla
+    compacta, la celda completa.
+    """
+    x, y, w, h = cell["pipeline"]
+    if COMPACT_CELLS:
+        h = cell["memory"][1] + cell["memory"][3] - y
+        return (x + 5, y + 22, w - 10, h - 27)
+    return (x + 10, y + 30, w - 20, h - 40)
+
+
+def export_diagrams():
+    for processor_id, diagram in enumerate(diagrams, 1):
+        export_svg(diagram, f"diagrama_p{processor_id}.svg")
+        export_png(diagram, f"diagrama_p{processor_id}.png")
+    show_message("showinfo", "Diagrama", f"Exportado a diagrama_p1..p{len(diagrams)} (.svg y .png)")
+
+
+def show_message(kind, title, text):
+    """
+    Muestra un cuadro de diálogo de tkinter.messagebox ("showinfo", "showerror").
+    """
+    global tk_root
+    import tkinter as tk
+    from tkinter import messagebox
+
+    if tk_root is None:
+        tk_root = tk.Tk()
+        tk_root.withdraw()
+    getattr(messagebox, kind)(title, text)
+
+
+def refresh_history():
+    global history_page
+    history_page = results_store.page(history_offset, HISTORY_ROWS)
+
+
+def record_run():
+    """
+    Guarda la corrida terminada y vuelve a la primera página del historial.
+    """
+    global history_offset
+    results_store.record_run(programs, group.results())
+    history_offset = 0
+    refresh_history()
+
+
+#  PANELES (dashboard))
+
+def draw_panel(x, y, w, h, title=None):
+    pygame.draw.rect(screen, (40, 40, 40), (x, y, w, h), border_radius=10)
+    pygame.draw.rect(screen, (100, 100, 100), (x, y, w, h), 2, border_radius=10)
+    if title:
+        txt = small_font.render(title, True, (255, 255, 0))
+        screen.blit(txt, (x + 10, y + 5))
+
+
+# Layout base
+
+def init_layout(width, height):
+    """
+    Calcula la posición de los paneles según el tamaño de la pantalla.
+    """
+    global WIDTH, HEIGHT, EDITOR_PANEL_X, EDITOR_PANEL_Y, EDITOR_PANEL_W, EDITOR_PANEL_H
+    global INFO_PANEL_X, INFO_PANEL_Y, INFO_PANEL_W, INFO_PANEL_H, CONTROLS_PANEL_X
+    global CONTROLS_PANEL_Y, CONTROLS_PANEL_W, CONTROLS_PANEL_H, CONFIG_PANEL_X
+    global CONFIG_PANEL_Y, CONFIG_PANEL_W, CONFIG_PANEL_H, METRICS_PANEL_X, METRICS_PANEL_Y
+    global METRICS_PANEL_W, METRICS_PANEL_H, HISTORY_ROWS, MAX_PROCESSORS
+    WIDTH, HEIGHT = width, height
+
+    EDITOR_PANEL_X = 40
+    EDITOR_PANEL_Y = 20
+    EDITOR_PANEL_W = WIDTH // 2 - 40
+    EDITOR_PANEL_H = 320
+
+    INFO_PANEL_X = WIDTH // 2 + 20
+    INFO_PANEL_Y = 20
+    INFO_PANEL_W = WIDTH - INFO_PANEL_X - 20
+    INFO_PANEL_H = 90
+
+    CONTROLS_PANEL_X = 40
+    CONTROLS_PANEL_Y = EDITOR_PANEL_Y + EDITOR_PANEL_H + 10
+    CONTROLS_PANEL_W = 200
+    CONTROLS_PANEL_H = 310
+
+    CONFIG_PANEL_X = CONTROLS_PANEL_X + CONTROLS_PANEL_W + 20
+    CONFIG_PANEL_Y = CONTROLS_PANEL_Y 
+    CONFIG_PANEL_W = (WIDTH // 2 + 20) - CONFIG_PANEL_X - 20
+    CONFIG_PANEL_H = 310
+    # Una fila de botones por procesador más la fila de + / -.
+    MAX_PROCESSORS = (CONFIG_PANEL_H - 30 - 40) // CONFIG_ROW_H
+
+    # BAJO un poco el panel de métricas
+    METRICS_PANEL_X = 40
+    METRICS_PANEL_Y = CONTROLS_PANEL_Y + CONTROLS_PANEL_H + 10
+    METRICS_PANEL_W = WIDTH // 2 - 40
+    METRICS_PANEL_H = HEIGHT - METRICS_PANEL_Y - 40
+    HISTORY_ROWS = max(1, min(20, (METRICS_PANEL_H - 50) // 16))
+
+    layout_processors(len(config_modes))
+
+
+def layout_processors(count):
+    """
+    Genera los paneles de cada procesador (pipeline arriba, memoria abajo)
+    en el área de la derecha. Con uno o dos procesadores, columnas completas;
+    con más, una grilla de celdas compactas.
+    """
+    global PROCESSORS_AREA, PROCESSOR_CELLS, COMPACT_CELLS
+    area_x = WIDTH // 2 + 20
+    area_y = 130
+    area_w = WIDTH - area_x - 20
+    area_h = HEIGHT - area_y - 40
+    PROCESSORS_AREA = (area_x, area_y, area_w, area_h)
+
+    COMPACT_CELLS = count > 2
+    if COMPACT_CELLS:
+        gap = 10
+        cols = min(count, max(2, (area_w + gap) // (COMPACT_CELL_W + gap)))
+        pipeline_h = COMPACT_PIPELINE_H
+    else:
+        gap = 20
+        cols = max(count, 1)
+        pipeline_h = 320   # panel pipelines
+    rows = -(-count // cols)
+    cell_w = (area_w - gap * (cols - 1)) // cols
+    cell_h = (area_h - gap * (rows - 1)) // max(rows, 1)
+
+    PROCESSOR_CELLS = []
+    for i in range(count):
+        x = area_x + (i % cols) * (cell_w + gap)
+        y = area_y + (i // cols) * (cell_h + gap)
+        PROCESSOR_CELLS.append({
+            "pipeline": (x, y, cell_w, pipeline_h),
+            "memory": (x, y + pipeline_h + gap, cell_w, cell_h - pipeline_h - gap),
+        })
+
+
+#  Info en paneles 
+
+def draw_info(panel_x, panel_y):
+    y0 = panel_y + 25
+    x0 = panel_x + 10
+
+    info1 = font.render(f"Ciclo actual: {max(proc.cycle for proc in processors)}", True, (255, 255, 255))
+    if len(processors) <= 2:
+        info2 = font.render(" | ".join(f"PC{i}: {proc.pc}" for i, proc in enumerate(processors, 1)),
+                            True, (255, 255, 255))
+    else:
+        info2 = small_font.render("PC: " + " ".join(str(proc.pc) for proc in processors),
+                                  True, (255, 255, 255))
+    screen.blit(info1, (x0, y0))
+    screen.blit(info2, (x0, y0 + 22))
+
+    mem_desc = "Memoria: DRAM (F4)" if memory_model else "Memoria: 1 ciclo (F4)"
+    mem_txt = small_font.render(mem_desc, True, (200, 200, 200))
+    screen.blit(mem_txt, (x0 + 320, y0))
+
+    branch_desc = "Saltos: ID (F5)" if early_branch else "Saltos: EX (F5)"
+    branch_desc += " | Fusión: sí (F8)" if fusion else " | Fusión: no (F8)"
+    branch_txt = small_font.render(branch_desc, True, (200, 200, 200))
+    screen.blit(branch_txt, (x0 + 320, y0 + 22))
+
+    policy_txt = small_font.render(f"Hilos: {fetch_policy} (F6)", True, (200, 200, 200))
+    screen.blit(policy_txt, (x0 + 320, y0 + 44))
+
+    if breakpoint_message:
+        bp_txt = small_font.render(f"Breakpoint {breakpoint_message}", True, (255, 140, 0))
+        screen.blit(bp_txt, (x0, y0 + 45))
+    elif execution_active:
+        elapsed = time.time() - execution_start_time
+        time_txt = small_font.render(f"Tiempo transcurrido: {elapsed:.2f} s", True, (255, 255, 0))
+        screen.blit(time_txt, (x0, y0 + 45))
+    elif execution_finished:
+        time_txt = small_font.render(f"Tiempo total: {execution_elapsed:.2f} s", True, (0, 255, 0))
+        screen.blit(time_txt, (x0, y0 + 45))
+
+
+def history_columns():
+    """
+    Procesadores de la corrida más grande de la página y cuántas columnas entran.
+    """
+    count = max((len(run["results"]) for run in history_page), default=0)
+    fit = max(1, (METRICS_PANEL_W - 70) // HISTORY_COLUMN_W)
+    return count, min(count, fit)
+
+
+def draw_metric_history(panel_x, panel_y):
+    base_y = panel_y + 30
+    base_x = panel_x + 10
+
+    # Una columna "ciclos/stalls" por procesador; si no entran todas, Shift +
+    # rueda desplaza las columnas.
+    count, visible = history_columns()
+    first = min(history_column, count - visible)
+    shown = range(first, first + visible)
+    labels = ["Run"] + [f"P{i + 1} ciclos/st" for i in shown]
+    column_xs = [base_x] + [base_x + 50 + i * HISTORY_COLUMN_W for i in range(visible)]
+    for label, x in zip(labels, column_xs):
+        txt = tiny_font.render(label, True, (200, 200, 200))
+        screen.blit(txt, (x, base_y))
+
+    # Página actual (rueda del ratón sobre el panel para desplazarse)
+    total = results_store.count_runs()
+    if total:
+        last = min(history_offset + len(history_page), total)
+        text = f"{history_offset + 1}-{last} de {total}"
+        if visible < count:
+            text += f" | P{first + 1}-P{first + visible} de {count}"
+        pos = tiny_font.render(text, True, (150, 150, 150))
+        screen.blit(pos, (panel_x + METRICS_PANEL_W - pos.get_width() - 10, base_y - 18))
+
+    for idx, run in enumerate(history_page):
+        values = [str(run["id"])]
+        values += [f"{result['cycles']}/{result['stalls']}"
+                   for result in run["results"][first:first + visible]]
+        for val, x in zip(values, column_xs):
+            txt = tiny_font.render(val, True, (180, 180, 180))
+            screen.blit(txt, (x, base_y + 18 + idx * 16))
+
+
+def draw_memory_content(memory, x, y, last_write_addr=None, width=None, height=None):
+    # 4 columnas (o las que entren en 'width'); solo las filas que entran en 'height'
+    header = tiny_font.render("Memoria (dirección : valor)", True, (255, 255, 255))
+    screen.blit(header, (x, y))
+
+    col_width = 80
+    row_step = 16
+    columnas = 4 if width is None else max(1, min(4, width // col_width))
+    filas_por_col = (len(memory) + columnas - 1) // columnas
+    filas_visibles = filas_por_col if height is None else max(0, (height - 20) // row_step)
+
+    for i in range(len(memory)):
+        col = i // filas_por_col
+        row = i % filas_por_col
+        if row >= filas_visibles:
+            continue
+        value = memory[i]
+
+        val_color = (255, 80, 80) if last_write_addr == i else (255, 255, 0)
+
+        addr_text = tiny_font.render(f"{i:04d}:", True, (180, 180, 180))
+        val_text = tiny_font.render(str(value), True, val_color)
+
+        dx = x + col * col_width
+        dy = y + 20 + row * row_step
+
+        screen.blit(addr_text, (dx, dy))
+        screen.blit(val_text, (dx + 42, dy))
+
+
+def draw_config_buttons(panel_x, panel_y, panel_w):
+    """
+    Una fila por procesador con un botón por configuración, y abajo los
+    botones para agregar o quitar procesadores.
+
+    Retorna:
+        list[dict]: Botones con su rectángulo y acción (ver check_button_click).
+    """
+    label_w = 34
+    btn_w = (panel_w - 20 - label_w) // len(MODE_KEYS)
+    buttons_local = []
+
+    for p, selected_mode in enumerate(config_modes):
+        row_y = panel_y + 30 + p * CONFIG_ROW_H
+        label = small_font.render(f"P{p + 1}", True, (255, 255, 255))
+        screen.blit(label, (panel_x + 10, row_y + 3))
+        for i, mode_key in enumerate(MODE_KEYS):
+            rect = (panel_x + 10 + label_w + i * btn_w, row_y, btn_w - 4, CONFIG_ROW_H - 4)
+            color = (100, 200, 100) if selected_mode == mode_key else (60, 60, 60)
+            pygame.draw.rect(screen, color, rect, border_radius=6)
+            rendered_text = tiny_font.render(MODE_LABELS[mode_key], True, (255, 255, 255))
+            screen.blit(rendered_text, rendered_text.get_rect(center=pygame.Rect(rect).center))
+            buttons_local.append({"rect": rect, "mode": f"config:{p}:{mode_key}"})
+
+    bottom_y = panel_y + CONFIG_PANEL_H - 36
+    for i, (text, action, enabled) in enumerate((
+            ("+ Procesador", "processor:add", len(config_modes) < MAX_PROCESSORS),
+            ("- Procesador", "processor:remove", len(config_modes) > 1))):
+        rect = (panel_x + 10 + i * 130, bottom_y, 120, 28)
+        enabled = enabled and not program_loaded
+        pygame.draw.rect(screen, (100, 100, 200) if enabled else (80, 80, 80), rect, border_radius=6)
+        rendered_text = tiny_font.render(text, True, (255, 255, 255) if enabled else (120, 120, 120))
+        screen.blit(rendered_text, rendered_text.get_rect(center=pygame.Rect(rect).center))
+        buttons_local.append({"rect": rect, "mode": action})
+    return buttons_local
+
+
+def draw_buttons(panel_x, panel_y):
+    btn_width = 160
+    btn_height = 40
+    start_y = panel_y + 35
+    start_x = panel_x + 10
+
+    button_labels = [
+        ("Run", "load"),
+        ("Paso a Paso", "step"),
+        ("Auto", "auto"),
+        ("Completa", "fast"),
+        ("Funcional", "functional"),
+    ]
+
+    buttons_local = []
+    for i, (text, mode_label) in enumerate(button_labels):
+        y = start_y + i * 50
+        color = (100, 100, 200) if program_loaded else (80, 80, 80)
+        pygame.draw.rect(screen, color, (start_x+10, y, btn_width, btn_height), border_radius=6)
+        label_color = (255, 255, 255) if program_loaded else (120, 120, 120)
+        rendered_text = small_font.render(text, True, label_color)
+        text_rect = rendered_text.get_rect(center=(start_x + btn_width // 2, y + btn_height // 2))
+        screen.blit(rendered_text, text_rect)
+        buttons_local.append({"label": text, "x": start_x, "y": y, "mode": mode_label})
+
+    quit_button = {"label": "Salir", "x": WIDTH - 75, "y": 5, "mode": "quit"}
+    pygame.draw.rect(screen, (200, 50, 50), (quit_button["x"], quit_button["y"], 70, 40), border_radius=6)
+    label = font.render(quit_button["label"], True, (255, 255, 255))
+    screen.blit(label, (quit_button["x"] + 10, quit_button["y"] + 10))
+
+    buttons_local.append(quit_button)
+    return buttons_local
+
+
+def check_button_click(pos, buttons_list, config_buttons=()):
+    for b in buttons_list:
+        w = 180 if b["mode"] != "quit" else 100
+        h = 40
+        rect = pygame.Rect(b["x"], b["y"], w, h)
+        if rect.collidepoint(pos):
+            return b["mode"]
+
+    for b in config_buttons:
+        if pygame.Rect(b["rect"]).collidepoint(pos):
+            return b["mode"]
+
+    for proc_id, cell in enumerate(PROCESSOR_CELLS):
+        if (pygame.Rect(cell["pipeline"]).collidepoint(pos)
+                or pygame.Rect(cell["memory"]).collidepoint(pos)):
+            return f"select:{proc_id}"
+    return None
+
+
+def draw_processor_status(proc, x, y, processor_id, compact=False):
+    # Estado del procesador (dentro del panel de MEMORIA)
+    font_status = tiny_font
+
+    if compact:
+        # Dos líneas: ciclo/PC y stalls/IPC.
+        ipc = proc.stats["instructions"] / proc.cycle if proc.cycle else 0.0
+        state = " (fin)" if proc.finished else ""
+        for i, text in enumerate((f"Ciclo {proc.cycle}  PC {proc.pc}{state}",
+                                  f"Stalls {proc.stats['stalls']}  IPC {ipc:.2f}")):
+            screen.blit(font_status.render(text, True, (255, 255, 255)), (x, y + i * 14))
+        return
+
+    title = font_status.render(f"Estado P{processor_id}", True, (255, 255, 0))
+    screen.blit(title, (x, y))
+
+    y += 16
+    cycle_text = font_status.render(f"Ciclo: {proc.cycle}", True, (255, 255, 255))
+    screen.blit(cycle_text, (x, y))
+
+    y += 16
+    sim_time = calculate_simulated_time_ns(proc.cycle)
+    time_text = font_status.render(f"Tiempo sim.: {format_time_ns(sim_time)}", True, (255, 255, 255))
+    screen.blit(time_text, (x, y))
+
+    y += 16
+    if isinstance(proc, MultithreadedPipeline):
+        # IPC agregado y, por hilo, PC e IPC propio sobre los ciclos totales.
+        ipc = proc.stats["instructions"] / proc.cycle if proc.cycle else 0.0
+        pc_desc = f"IPC total {ipc:.2f}  " + "  ".join(
+            f"T{t['tid']} pc {t['pc']} IPC {t['ipc']:.2f}" for t in proc.thread_results())
+    else:
+        pc_desc = f"PC: {proc.pc}"
+    pc_text = font_status.render(pc_desc, True, (255, 255, 255))
+    screen.blit(pc_text, (x, y))
+
+
+def draw_registers(proc, x, y, processor_id):
+    """
+    Ahora se dibujan dentro del panel de métricas:
+    - fuente pequeña 
+    - posición ajustada para no salir del contenedor
+    """
+    font_status = tiny_font
+    registers = proc.registers
+    label = f"Registros P{processor_id}:"
+    if isinstance(proc, MultithreadedPipeline):
+        registers = proc.thread_registers(0)
+        label = f"Registros P{processor_id} (hilo T0):"
+    title = font_status.render(label, True, (200, 200, 200))
+    screen.blit(title, (x, y))
+    line_height = 14
+    for i in range(0, 32, 4):
+        row_text = "  ".join([f"x{j:02d}: {registers[j]}" for j in range(i, i + 4)])
+        y += line_height
+        reg_line = font_status.render(row_text, True, (180, 255, 180))
+        screen.blit(reg_line, (x, y))
+
+
+#  BUCLE PRINCIPAL 
+
+def init_display(size=None, db_path=DEFAULT_DB_PATH):
+    """
+    Inicializa pygame, la pantalla, las fuentes, el editor y el historial.
+
+    Args:
+        size (tuple, optional): (ancho, alto); por defecto, toda la pantalla.
+        db_path (str): Base de datos del historial.
+    """
+    global screen, clock, font, small_font, tiny_font, editor, results_store
+
+    pygame.init()
+    pygame.key.set_repeat(300, 30)
+
+    if size is None:
+        info = pygame.display.Info()
+        size = (info.current_w, info.current_h)
+    init_layout(*size)
+    screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
+    pygame.display.set_caption("Simulador Pipeline RISC-V")
+    clock = pygame.time.Clock()
+
+    # Fuentes
+    font = pygame.font.SysFont("consolas", 18)
+    small_font = pygame.font.SysFont("consolas", 14)
+    tiny_font = pygame.font.SysFont("consolas", 12)   # para historial y registros
+
+    editor = TextEditor(50, 60, WIDTH // 2 - 60, 270, font)
+    results_store = ResultsStore(db_path)
+    refresh_history()
+    reset_processors()
+
+
+def next_events(replay=None, recorder=None):
+    """
+    Eventos del cuadro actual: los de pygame o, al reproducir un guion, los
+    grabados para este cuadro.
+    """
+    events = pygame.event.get()
+    if replay is not None:
+        # La cola real se vacía igual para que SDL no se bloquee.
+        events = replay.events(frame)
+    if recorder is not None:
+        recorder.record(frame, events)
+    return events
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulador de pipeline RISC-V (interfaz gráfica).")
+    parser.add_argument("--record-input", metavar="ARCHIVO",
+                        help="Grabar la entrada en un guion JSON para gui.benchmark")
+    parser.add_argument("--profile", action="store_true", help="Empezar con el overlay de perfilado (F7)")
+    args = parser.parse_args(argv)
+
+    global show_profiler
+    show_profiler = args.profile
+    recorder = InputRecorder(args.record_input) if args.record_input else None
+    run(recorder=recorder)
+    if recorder is not None:
+        recorder.save()
+
+
+def run(size=None, db_path=DEFAULT_DB_PATH, replay=None, recorder=None, max_frames=None,
+        frame_rate=60):
+    """
+    Bucle principal de la interfaz.
+
+    Args:
+        size (tuple, optional): Tamaño de la ventana (ver init_display).
+        db_path (str): Base de datos del historial.
+        replay (InputReplay, optional): Guion de entrada en lugar del teclado y el ratón.
+        recorder (InputRecorder, optional): Graba los eventos de cada cuadro.
+        max_frames (int, optional): Corta después de esta cantidad de cuadros.
+        frame_rate (int): Límite de fps (0 = sin límite).
+    """
+    global programs, diagram_scroll, mode, selected
+    global program_loaded, execution_active, execution_finished, execution_start_time
+    global execution_elapsed, running, show_diagram, history_offset, history_column, memory_model
+    global early_branch, fetch_policy, fusion, show_profiler, frame
+    global breakpoint_message
+
+    init_display(size, db_path)
+
+    while running:
+        profiler.begin_frame()
+        screen.fill((50, 100, 200))
+
+        # Paneles
+        draw_panel(EDITOR_PANEL_X, EDITOR_PANEL_Y, EDITOR_PANEL_W, EDITOR_PANEL_H, "Editor de instrucciones")
+        draw_panel(INFO_PANEL_X, INFO_PANEL_Y, INFO_PANEL_W, INFO_PANEL_H, "Información general")
+        draw_panel(CONTROLS_PANEL_X, CONTROLS_PANEL_Y, CONTROLS_PANEL_W, CONTROLS_PANEL_H, "Funcionalidades")
+        draw_panel(CONFIG_PANEL_X, CONFIG_PANEL_Y, CONFIG_PANEL_W, CONFIG_PANEL_H, "Configuración de procesadores")
+        draw_panel(METRICS_PANEL_X, METRICS_PANEL_Y, METRICS_PANEL_W, METRICS_PANEL_H, "Historial de métricas")
+        for i, cell in enumerate(PROCESSOR_CELLS):
+            if COMPACT_CELLS:
+                draw_panel(*cell["pipeline"], f"P{i + 1} {MODE_LABELS[group.mode_keys[i]]}")
+                draw_panel(*cell["memory"])
+            else:
+                draw_panel(*cell["pipeline"], f"Pipeline P{i + 1}")
+                draw_panel(*cell["memory"], f"Memoria P{i + 1}")
+        profiler.lap("panels")
+
+        # Editor
+        editor.draw(screen)
+        profiler.lap("editor")
+
+        # Controles & paneles de info
+        buttons = draw_buttons(CONTROLS_PANEL_X, CONTROLS_PANEL_Y)
+        config_buttons = draw_config_buttons(CONFIG_PANEL_X, CONFIG_PANEL_Y, CONFIG_PANEL_W)
+        draw_info(INFO_PANEL_X, INFO_PANEL_Y)
+        profiler.lap("controls")
+
+        # Historial
+        draw_metric_history(METRICS_PANEL_X, METRICS_PANEL_Y)
+        profiler.lap("history")
+
+        # REGISTROS DENTRO DEL PANEL DE MÉTRICAS
+        # x a la derecha pero dentro del borde; y un poco más arriba para no salirse
+        regs_x = METRICS_PANEL_X + 460
+        regs_y_p1 = METRICS_PANEL_Y + 20
+        # 8 líneas de registros + título ≈ 9*14px -> calculo altura para la segunda tabla
+        regs_y_p2 = regs_y_p1 + 9 * 14 + 20
+
+        # El procesador seleccionado (clic en su celda) y el siguiente.
+        draw_registers(processors[selected], regs_x, regs_y_p1, processor_id=selected + 1)
+        if len(processors) > 1:
+            other = (selected + 1) % len(processors)
+            draw_registers(processors[other], regs_x, regs_y_p2, processor_id=other + 1)
+        profiler.lap("registers")
+
+        # Eventos
+        for event in next_events(replay, recorder):
+            editor.handle_event(event)
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F2:
+                show_diagram = not show_diagram
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                export_diagrams()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4 and not program_loaded:
+                memory_model = not memory_model
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F5 and not program_loaded:
+                early_branch = not early_branch
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F6 and not program_loaded:
+                index = FETCH_POLICIES.index(fetch_policy)
+                fetch_policy = FETCH_POLICIES[(index + 1) % len(FETCH_POLICIES)]
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F7:
+                show_profiler = not show_profiler
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F8 and not program_loaded:
+                fusion = not fusion
+            elif event.type == pygame.MOUSEWHEEL:
+                metrics_rect = pygame.Rect(METRICS_PANEL_X, METRICS_PANEL_Y, METRICS_PANEL_W, METRICS_PANEL_H)
+                pipelines_rect = pygame.Rect(PROCESSORS_AREA)
+                if metrics_rect.collidepoint(pygame.mouse.get_pos()):
+                    # Rueda: corridas; Shift + rueda: procesadores
+                    if pygame.key.get_mods() & pygame.KMOD_SHIFT:
+                        count, visible = history_columns()
+                        history_column = min(max(0, history_column - event.y), count - visible)
+                    else:
+                        max_offset = max(0, results_store.count_runs() - HISTORY_ROWS)
+                        history_offset = min(max(0, history_offset - event.y * 3), max_offset)
+                        refresh_history()
+                elif show_diagram and pipelines_rect.collidepoint(pygame.mouse.get_pos()):
+                    # Rueda: filas; Shift + rueda: ciclos
+                    first_row, first_cycle = diagram_scroll or follow_position(
+                        diagrams[0], diagram_rect(PROCESSOR_CELLS[0]))
+                    if pygame.key.get_mods() & pygame.KMOD_SHIFT:
+                        first_cycle = max(1, first_cycle - event.y * 5)
+                    else:
+                        first_row = max(0, first_row - event.y * 3)
+                    diagram_scroll = (first_row, first_cycle)
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                clicked_mode = check_button_click(event.pos, buttons, config_buttons)
+                if clicked_mode == "quit":
+                    running = False
+                elif clicked_mode and clicked_mode.startswith("config") and not program_loaded:
+                    _, proc_id, mode_val = clicked_mode.split(":")
+                    config_modes[int(proc_id)] = mode_val
+                elif clicked_mode and clicked_mode.startswith("processor") and not program_loaded:
+                    if clicked_mode == "processor:add" and len(config_modes) < MAX_PROCESSORS:
+                        config_modes.append(MODE_KEYS[len(config_modes) % len(MODE_KEYS)])
+                    elif clicked_mode == "processor:remove" and len(config_modes) > 1:
+                        config_modes.pop()
+                    layout_processors(len(config_modes))
+                    reset_processors()
+                elif clicked_mode and clicked_mode.startswith("select"):
+                    selected = int(clicked_mode.split(":")[1])
+                elif clicked_mode == "load":
+                    try:
+                        source = editor.get_text()
+                        loaded = parse_programs(source)
+                        if not loaded:
+                            raise ValueError("No se detectaron instrucciones válidas.")
+
+                        # Varios programas separados por "---": un hilo por programa.
+                        reset_processors(loaded, source)
+                        programs = loaded
+                        program_loaded = True
+                        execution_finished = False
+                        execution_elapsed = 0
+                        breakpoint_message = None
+                    except Exception as e:
+                        show_message("showerror", "Error de sintaxis", str(e))
+                elif clicked_mode in ("step", "auto", "fast", "functional") and program_loaded:
+                    mode = clicked_mode
+                    breakpoint_message = None
+                    execution_active = True
+                    execution_start_time = time.time()
+        profiler.lap("events")
+
+        # Modos de ejecución
+        if mode in ("auto", "fast") and not group.finished:
+            if mode == "auto":
+                pygame.time.delay(400)
+            step_processors()
+            breakpoint_message = breakpoint_hit()
+            if breakpoint_message:
+                mode = None     # Pausa: cualquier modo continúa desde aquí
+        elif mode == "functional":
+            # Traducción por bloques: sin etapas, costo estimado por bloque.
+            for proc in processors:
+                run_functional(proc)
+            group.refresh()
+        elif mode == "step":
+            step_processors()
+            breakpoint_message = breakpoint_hit()
+            if group.finished:
+                record_run()
+                program_loaded = False
+                execution_active = False
+                execution_elapsed = time.time() - execution_start_time
+            mode = None
+
+        if group.finished and mode is not None:
+            record_run()
+            mode = None
+            program_loaded = False
+            execution_active = False
+            execution_elapsed = time.time() - execution_start_time
+        profiler.lap("step")
+
+        #  Pipelines (solo las etapas) 
+        cells = list(zip(processors, PROCESSOR_CELLS))
+        if show_diagram:
+            for diagram, cell in zip(diagrams, PROCESSOR_CELLS):
+                rect = diagram_rect(cell)
+                first_row, first_cycle = diagram_scroll or follow_position(diagram, rect)
+                draw_pipeline_diagram(screen, diagram, rect, first_row, first_cycle)
+        else:
+            for i, (proc, cell) in enumerate(cells):
+                x, y, w, _ = cell["pipeline"]
+                draw_pipeline(screen, proc.pipeline, x + 10, y + 25, processor_id=i + 1,
+                              compact=COMPACT_CELLS, width=w - 20)
+        profiler.lap("pipeline")
+
+        # En la grilla compacta el diagrama ocupa la celda completa.
+        if COMPACT_CELLS and show_diagram:
+            cells = []
+
+        #  Hazard + ESTADO DENTRO DE MEMORIA DE CADA PROCESADOR
+        # Desplazamientos dentro del panel: riesgos, estado y memoria.
+        hazard_dy, status_dy, memory_dy = (22, 40, 72) if COMPACT_CELLS else (30, 110, 170)
+
+        # Última detección del propio procesador (el núcleo fuera de orden no tiene).
+        for i, (proc, cell) in enumerate(cells):
+            x, y = cell["memory"][:2]
+            draw_hazard_info(screen, getattr(proc, "hazard_info", None), x + 10, y + hazard_dy, processor_id=i + 1,
+                             mode_desc=get_mode_description(group.mode_keys[i]), compact=COMPACT_CELLS)
+        profiler.lap("hazard_info")
+
+        for i, (proc, cell) in enumerate(cells):
+            x, y = cell["memory"][:2]
+            draw_processor_status(proc, x + 10, y + status_dy, processor_id=i + 1, compact=COMPACT_CELLS)
+        profiler.lap("status")
+
+        for proc, cell in cells:
+            x, y, w, h = cell["memory"]
+            if COMPACT_CELLS:
+                draw_memory_content(proc.memory, x + 10, y + memory_dy, proc.last_mem_write,
+                                    width=w - 20, height=h - memory_dy - 5)
+            else:
+                draw_memory_content(proc.memory, x + 10, y + memory_dy, proc.last_mem_write)
+        profiler.lap("memory")
+
+        if show_profiler:
+            profiler.draw_overlay(screen, tiny_font, WIDTH - 300, 55, clock.get_fps())
+            profiler.lap("overlay")
+
+        pygame.display.flip()
+        profiler.lap("flip")
+        profiler.end_frame()
+        clock.tick(frame_rate)
+
+        frame += 1
+        if (replay is not None and replay.finished(frame)) or (max_frames and frame >= max_frames):
+            running = False
+
+    results_store.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
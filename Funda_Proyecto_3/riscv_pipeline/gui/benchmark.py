@@ -0,0 +1,156 @@
+import argparse
+import json
+import os
+
+"""
+Benchmark de la interfaz sin ventana.
+
+Corre la interfaz completa con SDL_VIDEODRIVER=dummy, reproduce un guion de
+entrada (grabado con `riscv-pipeline-gui --record-input guion.json`, o el
+guion por defecto: escribir un bucle en el editor, cargarlo, avanzar paso a
+paso y terminarlo en modo "Completa" con y sin diagrama) y reporta los
+percentiles del tiempo de cuadro y el costo de cada sección.
+
+Uso:
+    riscv-pipeline-gui-bench
+    riscv-pipeline-gui-bench --input guion.json --json
+    riscv-pipeline-gui-bench --program programa.s --size 1280x720
+    riscv-pipeline-gui-bench --processors 8
+
+Sin límite de fps y con el historial en memoria (no toca resultados.db).
+"""
+
+DEFAULT_PROGRAM = """\
+ADDI x1, x0, 40
+ADDI x2, x0, 0
+LW x3, 0(x2)
+ADD x4, x4, x3
+SW x4, 1(x2)
+ADDI x2, x2, 1
+ADDI x1, x1, -1
+BNE x1, x0, -5
+"""
+
+DEFAULT_SIZE = (1600, 900)
+CHARS_PER_FRAME = 4     # Escritura en el editor del guion por defecto
+TAIL_FRAMES = 30
+
+
+def _key(frame, key, unicode=""):
+    return {"frame": frame, "type": "KEYDOWN", "key": key, "unicode": unicode, "mod": 0}
+
+
+def _click(frame, pos):
+    return [{"frame": frame, "type": "MOUSEBUTTONDOWN", "pos": list(pos), "button": 1},
+            {"frame": frame + 1, "type": "MOUSEBUTTONUP", "pos": list(pos), "button": 1}]
+
+
+def default_script(program_text, app, steps=20, fast_frames=600):
+    """
+    Guion por defecto. Las posiciones de los botones salen del layout de la
+    interfaz, así que init_layout ya tiene que haberse llamado.
+    """
+    import pygame
+
+    def button(index):
+        # Mismo cálculo que draw_buttons.
+        return (app.CONTROLS_PANEL_X + 20, app.CONTROLS_PANEL_Y + 35 + index * 50 + 20)
+
+    entries = []
+    frame = 0
+    entries += _click(frame, (app.EDITOR_PANEL_X + 40, app.EDITOR_PANEL_Y + 50))
+    frame += 2
+    for i, char in enumerate(program_text):
+        if char == "\n":
+            entries.append(_key(frame, pygame.K_RETURN, "\r"))
+        else:
+            entries.append(_key(frame, 0, char))
+        if i % CHARS_PER_FRAME == CHARS_PER_FRAME - 1:
+            frame += 1
+
+    frame += 2
+    entries += _click(frame, button(0))           # Run (cargar)
+    frame += 3
+    for _ in range(steps):
+        entries += _click(frame, button(1))       # Paso a paso
+        frame += 2
+
+    entries += _click(frame, button(3))           # Completa
+    frame += fast_frames // 2
+    entries.append(_key(frame, pygame.K_F2))      # Diagrama de tiempo
+    frame += fast_frames // 2
+    entries.append(_key(frame, pygame.K_F2))
+    return entries
+
+
+def parse_size(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def print_report(summary):
+    print(f"{summary['frames']} cuadros, {summary['total_ms'] / 1000:.2f} s de trabajo"
+          f" ({1000 / summary['mean_ms'] if summary['mean_ms'] else 0:.0f} fps sin límite)")
+    print("  tiempo de cuadro (ms): "
+          f"media {summary['mean_ms']:.2f} | p50 {summary['p50_ms']:.2f} | "
+          f"p90 {summary['p90_ms']:.2f} | p95 {summary['p95_ms']:.2f} | "
+          f"p99 {summary['p99_ms']:.2f} | máx {summary['max_ms']:.2f}")
+    print(f"  {'sección':<15}{'media ms':>10}{'p95 ms':>10}{'%':>7}")
+    for name, section in summary["sections"].items():
+        print(f"  {name:<15}{section['mean_ms']:>10.3f}{section['p95_ms']:>10.3f}"
+              f"{section['share'] * 100:>7.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de la interfaz sin ventana.")
+    parser.add_argument("--input", metavar="ARCHIVO", help="Guion grabado con --record-input")
+    parser.add_argument("--program", metavar="ARCHIVO",
+                        help="Programa .s para el guion por defecto")
+    parser.add_argument("--size", type=parse_size, default=DEFAULT_SIZE, help="Ventana, p. ej. 1600x900")
+    parser.add_argument("--processors", type=int, default=None,
+                        help="Cantidad de procesadores (configuraciones rotando entre las disponibles)")
+    parser.add_argument("--max-frames", type=int, default=None)
+    parser.add_argument("--overlay", action="store_true", help="Dibujar también el overlay (F7)")
+    parser.add_argument("--json", action="store_true", help="Salida en JSON")
+    args = parser.parse_args(argv)
+
+    # Antes de que app inicialice pygame.
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+    from . import app
+    from .frame_profiler import FrameProfiler
+    from .input_script import InputReplay, load_script
+    from ..processors import MODE_KEYS
+
+    if args.processors:
+        app.config_modes = [MODE_KEYS[i % len(MODE_KEYS)] for i in range(args.processors)]
+
+    if args.input:
+        entries = load_script(args.input)
+    else:
+        program_text = DEFAULT_PROGRAM
+        if args.program:
+            with open(args.program, "r", encoding="utf-8") as f:
+                program_text = f.read()
+        app.init_layout(*args.size)
+        entries = default_script(program_text, app)
+
+    app.profiler = FrameProfiler(window=None)
+    app.show_profiler = args.overlay
+    app.run(size=args.size, db_path=":memory:", replay=InputReplay(entries, TAIL_FRAMES),
+            max_frames=args.max_frames, frame_rate=0)
+
+    summary = app.profiler.summary()
+    summary["size"] = list(args.size)
+    summary["processors"] = len(app.config_modes)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_report(summary)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
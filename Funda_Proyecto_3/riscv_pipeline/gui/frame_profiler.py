@@ -0,0 +1,145 @@
+import time
+from collections import deque
+
+import pygame
+
+"""
+Perfilado de tiempo por cuadro de la interfaz.
+
+El bucle principal marca el final de cada sección con lap(nombre) y el
+perfilador acumula cuánto tardó cada una desde la marca anterior (paneles,
+editor, registros, memoria, detección de riesgos, paso de simulación, ...).
+Las marcas son dos llamadas a perf_counter, así que se dejan siempre
+activas; el overlay (F7) solo decide si se dibuja el resumen en pantalla.
+"""
+
+OVERLAY_SECTIONS = 6    # Secciones más lentas que muestra el overlay
+RECENT_FRAMES = 60      # Cuadros que promedia el overlay
+
+
+def percentile(values, p):
+    """
+    Percentil p (0-100) por rango más cercano; 0.0 si no hay valores.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * p // 100))
+    return ordered[min(int(rank), len(ordered)) - 1]
+
+
+class FrameProfiler:
+    """
+    Tiempos por cuadro y por sección, en milisegundos.
+
+    Args:
+        window (int, optional): Cuadros que se guardan (None = todos, como en
+            el benchmark).
+    """
+
+    def __init__(self, window=600):
+        self.window = window
+        self.frames = deque(maxlen=window)
+        self.sections = {}
+        self.frame_count = 0
+        self._current = {}
+        self._start = self._last = None
+
+    def begin_frame(self):
+        self._start = self._last = time.perf_counter()
+        self._current = {}
+
+    def lap(self, name):
+        """
+        Atribuye a 'name' el tiempo desde la marca anterior.
+        """
+        now = time.perf_counter()
+        self._current[name] = self._current.get(name, 0.0) + (now - self._last) * 1000
+        self._last = now
+
+    def end_frame(self):
+        if self._start is None:
+            return
+        self.frames.append((time.perf_counter() - self._start) * 1000)
+        for name, elapsed in self._current.items():
+            if name not in self.sections:
+                # Los cuadros anteriores no pasaron por esta sección.
+                history = deque(maxlen=self.window)
+                history.extend([0.0] * (len(self.frames) - 1))
+                self.sections[name] = history
+        for name, history in self.sections.items():
+            history.append(self._current.get(name, 0.0))
+        self.frame_count += 1
+        self._start = None
+
+    # ----------------------------------------------------------------------
+    # Resúmenes
+    # ----------------------------------------------------------------------
+
+    def slowest(self, count=OVERLAY_SECTIONS, recent=RECENT_FRAMES):
+        """
+        Las 'count' secciones con mayor promedio en los últimos 'recent'
+        cuadros: lista de (nombre, ms).
+        """
+        averages = []
+        for name, history in self.sections.items():
+            last = list(history)[-recent:]
+            if last:
+                averages.append((name, sum(last) / len(last)))
+        averages.sort(key=lambda item: item[1], reverse=True)
+        return averages[:count]
+
+    def summary(self):
+        """
+        Percentiles del tiempo de cuadro y promedio/p95/porcentaje de cada
+        sección sobre todos los cuadros guardados.
+        """
+        frames = list(self.frames)
+        total = sum(frames)
+        result = {
+            "frames": len(frames),
+            "total_ms": total,
+            "mean_ms": total / len(frames) if frames else 0.0,
+            "p50_ms": percentile(frames, 50),
+            "p90_ms": percentile(frames, 90),
+            "p95_ms": percentile(frames, 95),
+            "p99_ms": percentile(frames, 99),
+            "max_ms": max(frames) if frames else 0.0,
+            "sections": {},
+        }
+        for name, history in sorted(self.sections.items(), key=lambda item: -sum(item[1])):
+            values = list(history)
+            spent = sum(values)
+            result["sections"][name] = {
+                "mean_ms": spent / len(values) if values else 0.0,
+                "p95_ms": percentile(values, 95),
+                "share": spent / total if total else 0.0,
+            }
+        return result
+
+    # ----------------------------------------------------------------------
+    # Overlay
+    # ----------------------------------------------------------------------
+
+    def draw_overlay(self, screen, font, x, y, fps=None):
+        """
+        Dibuja el tiempo del último cuadro, el p95 reciente, los fps y las
+        secciones más lentas en un recuadro semitransparente.
+        """
+        recent = list(self.frames)[-RECENT_FRAMES:]
+        last = recent[-1] if recent else 0.0
+        lines = [f"cuadro {last:5.1f} ms  p95 {percentile(recent, 95):5.1f} ms"]
+        if fps is not None:
+            lines[0] += f"  {fps:4.0f} fps"
+        for name, elapsed in self.slowest():
+            lines.append(f"  {name:<14}{elapsed:6.2f} ms")
+
+        line_height = font.get_linesize()
+        width = max(font.size(line)[0] for line in lines) + 16
+        height = line_height * len(lines) + 10
+        background = pygame.Surface((width, height), pygame.SRCALPHA)
+        background.fill((0, 0, 0, 190))
+        screen.blit(background, (x, y))
+        for i, line in enumerate(lines):
+            color = (255, 255, 0) if i == 0 else (220, 220, 220)
+            screen.blit(font.render(line, True, color), (x + 8, y + 5 + i * line_height))
@@ -0,0 +1,100 @@
+"""
+Buffer con hueco (gap buffer) de líneas para el editor de texto.
+
+Cada elemento es una línea (str). Las inserciones y borrados se hacen en la
+posición del hueco, que se mueve hacia donde está el cursor; pegar miles de
+líneas seguidas cuesta O(1) amortizado por línea en lugar de reconstruir
+todo el texto.
+"""
+
+
+class LineGapBuffer:
+    def __init__(self, text="", initial_gap=64):
+        self._initial_gap = initial_gap
+        self.set_text(text)
+
+    # ----------------------------------------------------------------------
+    # Manejo del hueco
+    # ----------------------------------------------------------------------
+
+    def _gap_size(self):
+        return self._gap_end - self._gap_start
+
+    def _move_gap(self, index):
+        """
+        Mueve el hueco para que empiece en la línea 'index'.
+        """
+        if index < self._gap_start:
+            count = self._gap_start - index
+            self._buf[self._gap_end - count:self._gap_end] = self._buf[index:self._gap_start]
+            self._gap_start -= count
+            self._gap_end -= count
+        elif index > self._gap_start:
+            count = index - self._gap_start
+            self._buf[self._gap_start:self._gap_start + count] = \
+                self._buf[self._gap_end:self._gap_end + count]
+            self._gap_start += count
+            self._gap_end += count
+
+    def _grow(self, needed):
+        # Duplicar el hueco para que las inserciones sigan siendo amortizadas.
+        extra = max(needed, len(self._buf), self._initial_gap)
+        self._buf[self._gap_end:self._gap_end] = [None] * extra
+        self._gap_end += extra
+
+    # ----------------------------------------------------------------------
+    # Interfaz de lista de líneas
+    # ----------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self._buf) - self._gap_size()
+
+    def _physical(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return index if index < self._gap_start else index + self._gap_size()
+
+    def __getitem__(self, index):
+        return self._buf[self._physical(index)]
+
+    def __setitem__(self, index, line):
+        self._buf[self._physical(index)] = line
+
+    def insert(self, index, lines):
+        """
+        Inserta una o varias líneas antes de la línea 'index'.
+        """
+        if isinstance(lines, str):
+            lines = [lines]
+        self._move_gap(index)
+        if self._gap_size() < len(lines):
+            self._grow(len(lines))
+        self._buf[self._gap_start:self._gap_start + len(lines)] = lines
+        self._gap_start += len(lines)
+
+    def delete(self, index, count=1):
+        """
+        Borra 'count' líneas a partir de 'index'.
+        """
+        self._move_gap(index)
+        for i in range(self._gap_end, self._gap_end + count):
+            self._buf[i] = None
+        self._gap_end += count
+
+    def lines(self, start=0, stop=None):
+        """
+        Líneas [start, stop) sin copiar el resto del buffer.
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        return [self[i] for i in range(max(0, start), stop)]
+
+    def get_text(self):
+        return "\n".join(self.lines())
+
+    def set_text(self, text):
+        lines = text.split("\n")
+        self._buf = lines + [None] * self._initial_gap
+        self._gap_start = len(lines)
+        self._gap_end = len(self._buf)
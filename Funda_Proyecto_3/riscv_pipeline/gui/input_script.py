@@ -0,0 +1,106 @@
+import json
+
+import pygame
+
+"""
+Grabación y reproducción de la entrada de la interfaz, cuadro a cuadro.
+
+Un guion es una lista JSON de eventos con el número de cuadro en que
+ocurrieron:
+
+    [{"frame": 0, "type": "KEYDOWN", "key": 0, "unicode": "A", "mod": 0},
+     {"frame": 40, "type": "MOUSEBUTTONDOWN", "pos": [60, 395], "button": 1}, ...]
+
+`riscv-pipeline-gui --record-input guion.json` graba una sesión real y el
+benchmark (gui.benchmark) la reproduce sin ventana. La reproducción no mueve
+el puntero, así que la rueda del ratón actúa donde esté el cursor.
+"""
+
+# Eventos que se graban y los atributos que se guardan de cada uno.
+EVENT_FIELDS = {
+    "KEYDOWN": ("key", "unicode", "mod"),
+    "KEYUP": ("key", "mod"),
+    "MOUSEBUTTONDOWN": ("pos", "button"),
+    "MOUSEBUTTONUP": ("pos", "button"),
+    "MOUSEMOTION": ("pos", "rel", "buttons"),
+    "MOUSEWHEEL": ("x", "y"),
+    "QUIT": (),
+}
+
+
+def _event_types():
+    return {name: getattr(pygame, name) for name in EVENT_FIELDS}
+
+
+def event_to_dict(event, frame):
+    """
+    Evento de pygame a dict serializable (None si no se graba).
+    """
+    names = {value: name for name, value in _event_types().items()}
+    name = names.get(event.type)
+    if name is None:
+        return None
+    entry = {"frame": frame, "type": name}
+    for field in EVENT_FIELDS[name]:
+        value = getattr(event, field, None)
+        entry[field] = list(value) if isinstance(value, tuple) else value
+    return entry
+
+
+def event_from_dict(entry):
+    attrs = {}
+    for field in EVENT_FIELDS[entry["type"]]:
+        if field in entry:
+            value = entry[field]
+            attrs[field] = tuple(value) if isinstance(value, list) else value
+    return pygame.event.Event(_event_types()[entry["type"]], attrs)
+
+
+def load_script(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class InputRecorder:
+    """
+    Acumula los eventos de cada cuadro y los guarda al cerrar la interfaz.
+
+    Args:
+        path (str): Archivo JSON de salida.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = []
+
+    def record(self, frame, events):
+        for event in events:
+            entry = event_to_dict(event, frame)
+            if entry is not None:
+                self.entries.append(entry)
+
+    def save(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=1)
+
+
+class InputReplay:
+    """
+    Entrega los eventos de un guion en el cuadro en que se grabaron.
+
+    Args:
+        entries (list[dict]): Guion (ver load_script).
+        tail_frames (int): Cuadros extra después del último evento.
+    """
+
+    def __init__(self, entries, tail_frames=0):
+        self.by_frame = {}
+        for entry in entries:
+            self.by_frame.setdefault(entry["frame"], []).append(event_from_dict(entry))
+        self.last_frame = max(self.by_frame, default=-1) + tail_frames
+
+    def events(self, frame):
+        return self.by_frame.get(frame, [])
+
+    def finished(self, frame):
+        return frame > self.last_frame
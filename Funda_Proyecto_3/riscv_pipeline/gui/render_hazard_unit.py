@@ -1,7 +1,29 @@
 import pygame
 
-def draw_hazard_info(screen, hazard_info, pos_x, pos_y, processor_id=1, mode_desc=""):
-    font = pygame.font.SysFont("consolas", 16)
+_fonts = {}
+
+
+def _get_font(size):
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.SysFont("consolas", size)
+    return font
+
+
+def draw_hazard_info(screen, hazard_info, pos_x, pos_y, processor_id=1, mode_desc="", compact=False):
+    if compact:
+        # Una sola línea: stall y fuente de cada operando.
+        if hazard_info is None:
+            text, color = "Sin datos", (200, 200, 200)
+        else:
+            stall = hazard_info.get("stall")
+            text = (("STALL" if stall else "Sin STALL") + f"  A:{hazard_info.get('forwardA', 'NO')}"
+                    f"  B:{hazard_info.get('forwardB', 'NO')}")
+            color = (255, 0, 0) if stall else (0, 200, 0)
+        screen.blit(_get_font(12).render(text, True, color), (pos_x, pos_y))
+        return
+
+    font = _get_font(16)
 
     # Encabezado del procesador y configuración seleccionada
     title = font.render(f"Procesador {processor_id}: {mode_desc}", True, (255, 255, 0))
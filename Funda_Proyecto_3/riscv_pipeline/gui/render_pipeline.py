@@ -0,0 +1,83 @@
+import pygame
+
+from ..parser import format_instruction
+
+# Etapas del pipeline segmentado RISC-V
+STAGES = ["IF", "ID", "EX", "MEM", "WB"]
+
+# Colores utilizados en la interfaz gráfica
+COLOR_BG = (20, 20, 20)
+COLOR_TEXT = (255, 255, 255)
+COLOR_STAGE = (100, 100, 255)
+COLOR_BOX = (80, 80, 80)
+
+_fonts = {}
+
+"""
+Dibuja visualmente el estado actual del pipeline para un procesador RISC-V.
+
+Esta función recorre las cinco etapas del pipeline segmentado ('IF', 'ID', 'EX', 'MEM', 'WB')
+y muestra en pantalla qué instrucción se encuentra en cada etapa, con un formato legible,
+resaltando la operación y sus operandos.
+
+Con compact=True (grilla de muchos procesadores) se omite el título y se usan
+una fuente y filas más chicas, con la caja ajustada al ancho de la celda.
+"""
+
+
+def _get_font(size):
+    # Crear la fuente en cada cuadro cuesta más que dibujar el pipeline.
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.SysFont("consolas", size)
+    return font
+
+
+def draw_pipeline(screen, pipeline_dict, pos_x, pos_y, processor_id=1, compact=False, width=300):
+    if compact:
+        font = _get_font(12)
+        first_y, row_h, label_w = 0, 20, 36
+        box_w, box_h = width - label_w, 18
+    else:
+        font = _get_font(16)
+        first_y, row_h, label_w = 30, 40, 60
+        # Caja más angosta para que no ocupe todo el panel.
+        # Antes: ancho 300; ahora 240.
+        box_w, box_h = 240, 30
+
+        # Título del pipeline.
+        title = font.render(f"Procesador {processor_id}: Pipeline", True, COLOR_STAGE)
+        screen.blit(title, (pos_x, pos_y))
+
+    # Recorrer cada etapa del pipeline y dibujar su contenido.
+    for idx, stage in enumerate(STAGES):
+        y = pos_y + first_y + idx * row_h
+
+        # Nombre de la etapa (ej. "IF", "ID", ...).
+        label = font.render(stage, True, COLOR_TEXT)
+
+        box_x = pos_x + label_w
+        box_y = y - (2 if compact else 5)
+        pygame.draw.rect(screen, COLOR_BOX, (box_x, box_y, box_w, box_h))
+
+        screen.blit(label, (pos_x + (0 if compact else 10), y))
+
+        # Obtener la instrucción correspondiente a la etapa.
+        instr = pipeline_dict.get(stage)
+
+        if instr:
+            # Con varios hilos el texto incluye el hilo ("T1 ADD x5, ...").
+            text = format_instruction(instr)
+            # Resultado que transportan los latches EX/MEM y MEM/WB.
+            if stage in ("MEM", "WB") and "result" in instr:
+                text += f" = {instr['result']}"
+        else:
+            text = "--"
+
+        instr_text = font.render(text, True, COLOR_TEXT)
+        if compact:
+            # Recortado al ancho de la celda.
+            screen.blit(instr_text, (box_x + 4, y), (0, 0, box_w - 6, box_h))
+        else:
+            # Un poco de margen a la izquierda dentro de la caja angosta
+            screen.blit(instr_text, (box_x + 8, y))
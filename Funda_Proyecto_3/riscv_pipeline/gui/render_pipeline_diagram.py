@@ -0,0 +1,113 @@
+import pygame
+
+from ..pipeline_diagram import CODE_COLORS, CODE_LABELS, EMPTY
+
+"""
+Dibuja el diagrama de tiempo del pipeline (instrucción x ciclo) con
+desplazamiento virtualizado: solo se recorren y dibujan las filas y columnas
+visibles, así que el costo por cuadro no depende del largo de la corrida.
+"""
+
+ROW_H = 16
+COL_W = 34
+LABEL_W = 150
+
+COLOR_BG = (30, 30, 30)
+COLOR_GRID = (60, 60, 60)
+COLOR_TEXT = (255, 255, 255)
+
+_font = None
+_label_cache = {}
+
+
+def _get_font():
+    global _font
+    if _font is None:
+        _font = pygame.font.SysFont("consolas", 11)
+    return _font
+
+
+def _render_label(text, color):
+    # Las etiquetas de celda se repiten mucho: se renderizan una sola vez.
+    key = (text, color)
+    surface = _label_cache.get(key)
+    if surface is None:
+        surface = _get_font().render(text, True, color)
+        _label_cache[key] = surface
+    return surface
+
+
+def visible_size(rect):
+    """
+    Cantidad de (filas, columnas) que caben en el rectángulo.
+    """
+    rows = max(0, (rect[3] - ROW_H) // ROW_H)
+    cols = max(0, (rect[2] - LABEL_W) // COL_W)
+    return rows, cols
+
+
+def follow_position(diagram, rect):
+    """
+    Posición de desplazamiento que muestra las últimas filas y ciclos.
+    """
+    rows, cols = visible_size(rect)
+    first_row = max(0, len(diagram.rows) - rows)
+    first_cycle = max(1, diagram.last_cycle - cols + 1)
+    return first_row, first_cycle
+
+
+def draw_pipeline_diagram(screen, diagram, rect, first_row=0, first_cycle=1):
+    """
+    Dibuja la ventana [first_row, first_cycle] del diagrama dentro de rect.
+
+    Args:
+        screen (pygame.Surface): Superficie destino.
+        diagram (PipelineDiagram): Diagrama acumulado.
+        rect (tuple): (x, y, ancho, alto) del área disponible.
+        first_row (int): Primera fila (instrucción dinámica) visible.
+        first_cycle (int): Primer ciclo visible.
+    """
+    x, y, w, h = rect
+    rows, cols = visible_size(rect)
+    font = _get_font()
+
+    pygame.draw.rect(screen, COLOR_BG, rect)
+
+    # Encabezado con el número de ciclo de cada columna visible.
+    for col in range(cols):
+        cx = x + LABEL_W + col * COL_W
+        screen.blit(font.render(str(first_cycle + col), True, COLOR_TEXT), (cx + 2, y + 2))
+
+    last_cycle = first_cycle + cols
+    for i, row in enumerate(diagram.visible_rows(first_row, rows)):
+        ry = y + ROW_H * (i + 1)
+        label = font.render(f"{row.seq}: {row.label}"[:24], True, COLOR_TEXT)
+        screen.blit(label, (x + 2, ry + 2))
+
+        start = max(row.start_cycle, first_cycle)
+        end = min(row.end_cycle, last_cycle)
+        for cycle in range(start, end):
+            code = row.get(cycle)
+            if code == EMPTY:
+                continue
+            cx = x + LABEL_W + (cycle - first_cycle) * COL_W
+            pygame.draw.rect(screen, CODE_COLORS[code], (cx, ry, COL_W - 1, ROW_H - 1))
+            screen.blit(_render_label(CODE_LABELS[code], (0, 0, 0)), (cx + 2, ry + 2))
+
+    pygame.draw.rect(screen, COLOR_GRID, rect, 1)
+
+
+def export_png(diagram, path, first_row=0, max_rows=200, first_cycle=1, max_cycles=None):
+    """
+    Exporta una ventana del diagrama a PNG usando una superficie fuera de pantalla.
+    """
+    rows = diagram.visible_rows(first_row, max_rows)
+    if max_cycles is None:
+        last = max((row.end_cycle for row in rows), default=first_cycle)
+        max_cycles = max(1, last - first_cycle)
+
+    width = LABEL_W + max_cycles * COL_W
+    height = (len(rows) + 1) * ROW_H
+    surface = pygame.Surface((width, height))
+    draw_pipeline_diagram(surface, diagram, (0, 0, width, height), first_row, first_cycle)
+    pygame.image.save(surface, path)
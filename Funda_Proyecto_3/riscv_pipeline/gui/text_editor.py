@@ -0,0 +1,374 @@
+import pygame
+from collections import OrderedDict
+
+from .gap_buffer import LineGapBuffer
+
+"""
+Editor de texto en Pygame respaldado por un gap buffer de líneas.
+
+Soporta:
+    - Escritura normal con cursor real (flechas, Inicio/Fin, RePág/AvPág)
+    - Enter, Backspace, Supr, Tab
+    - Selección con Shift + flechas o arrastrando con el ratón
+    - Ctrl + A: seleccionar todo
+    - Ctrl + C / Ctrl + X: copiar / cortar la selección (o todo si no hay)
+    - Ctrl + V: pegar desde portapapeles (reemplaza la selección)
+    - Desplazamiento con la rueda del ratón
+
+Solo se dibujan las líneas visibles y cada línea renderizada se guarda en
+una caché indexada por su texto, así que una línea solo se vuelve a
+renderizar cuando se edita.
+"""
+
+LINE_HEIGHT = 20
+PADDING = 5
+SURFACE_CACHE_SIZE = 512
+
+
+def _clipboard():
+    # pyperclip solo se importa la primera vez que se usa el portapapeles.
+    import pyperclip
+    return pyperclip
+
+
+class TextEditor:
+    def __init__(self, x, y, w, h, font):
+        self.rect = pygame.Rect(x, y, w, h)
+        self.font = font
+        self.buffer = LineGapBuffer()
+        self.cursor_line = 0
+        self.cursor_col = 0
+        self.anchor = None          # (línea, columna) donde empezó la selección
+        self.scroll_line = 0        # Primera línea visible
+        self.cursor_visible = True
+        self.cursor_counter = 0
+        self.active = True
+        self.placeholder = "Escriba instrucciones aquí"
+        self._surface_cache = OrderedDict()
+        self._dragging = False
+
+    # ----------------------------------------------------------------------
+    # Texto completo (compatibilidad con la interfaz anterior)
+    # ----------------------------------------------------------------------
+
+    @property
+    def text(self):
+        return self.buffer.get_text()
+
+    @text.setter
+    def text(self, value):
+        self.buffer.set_text(value)
+        self.cursor_line = len(self.buffer) - 1
+        self.cursor_col = len(self.buffer[self.cursor_line])
+        self.anchor = None
+        self._ensure_cursor_visible()
+
+    def get_text(self):
+        return self.text.strip()
+
+    def clear(self):
+        self.text = ""
+
+    # ----------------------------------------------------------------------
+    # Cursor y selección
+    # ----------------------------------------------------------------------
+
+    def _visible_lines(self):
+        return max(1, (self.rect.h - 2 * PADDING) // LINE_HEIGHT)
+
+    def _ensure_cursor_visible(self):
+        visible = self._visible_lines()
+        if self.cursor_line < self.scroll_line:
+            self.scroll_line = self.cursor_line
+        elif self.cursor_line >= self.scroll_line + visible:
+            self.scroll_line = self.cursor_line - visible + 1
+
+    def _selection(self):
+        """
+        Retorna ((línea, col) inicio, (línea, col) fin) ordenados, o None.
+        """
+        if self.anchor is None:
+            return None
+        cursor = (self.cursor_line, self.cursor_col)
+        if self.anchor == cursor:
+            return None
+        return (min(self.anchor, cursor), max(self.anchor, cursor))
+
+    def _selected_text(self):
+        selection = self._selection()
+        if selection is None:
+            return ""
+        (l1, c1), (l2, c2) = selection
+        if l1 == l2:
+            return self.buffer[l1][c1:c2]
+        parts = [self.buffer[l1][c1:]]
+        parts += self.buffer.lines(l1 + 1, l2)
+        parts.append(self.buffer[l2][:c2])
+        return "\n".join(parts)
+
+    def _delete_selection(self):
+        selection = self._selection()
+        self.anchor = None
+        if selection is None:
+            return False
+        (l1, c1), (l2, c2) = selection
+        self.buffer[l1] = self.buffer[l1][:c1] + self.buffer[l2][c2:]
+        if l2 > l1:
+            self.buffer.delete(l1 + 1, l2 - l1)
+        self.cursor_line, self.cursor_col = l1, c1
+        return True
+
+    def _move_cursor(self, line, col, extend):
+        """
+        Mueve el cursor; con extend=True (Shift) extiende la selección.
+        """
+        if extend and self.anchor is None:
+            self.anchor = (self.cursor_line, self.cursor_col)
+        elif not extend:
+            self.anchor = None
+        line = max(0, min(line, len(self.buffer) - 1))
+        col = max(0, min(col, len(self.buffer[line])))
+        self.cursor_line, self.cursor_col = line, col
+        self._ensure_cursor_visible()
+
+    def _position_from_mouse(self, pos):
+        line = self.scroll_line + (pos[1] - self.rect.y - PADDING) // LINE_HEIGHT
+        line = max(0, min(line, len(self.buffer) - 1))
+        text = self.buffer[line]
+        x = pos[0] - self.rect.x - PADDING
+        col = 0
+        while col < len(text) and self.font.size(text[:col + 1])[0] <= x:
+            col += 1
+        return line, col
+
+    # ----------------------------------------------------------------------
+    # Edición
+    # ----------------------------------------------------------------------
+
+    def insert_text(self, text):
+        """
+        Inserta texto en el cursor (reemplazando la selección si la hay).
+        """
+        self._delete_selection()
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+        parts = text.split("\n")
+        line = self.buffer[self.cursor_line]
+        before, after = line[:self.cursor_col], line[self.cursor_col:]
+
+        if len(parts) == 1:
+            self.buffer[self.cursor_line] = before + text + after
+            self.cursor_col += len(text)
+        else:
+            self.buffer[self.cursor_line] = before + parts[0]
+            middle = parts[1:-1] + [parts[-1] + after]
+            self.buffer.insert(self.cursor_line + 1, middle)
+            self.cursor_line += len(parts) - 1
+            self.cursor_col = len(parts[-1])
+        self._ensure_cursor_visible()
+
+    def _backspace(self):
+        if self._delete_selection():
+            return
+        if self.cursor_col > 0:
+            line = self.buffer[self.cursor_line]
+            self.buffer[self.cursor_line] = line[:self.cursor_col - 1] + line[self.cursor_col:]
+            self.cursor_col -= 1
+        elif self.cursor_line > 0:
+            previous = self.buffer[self.cursor_line - 1]
+            self.buffer[self.cursor_line - 1] = previous + self.buffer[self.cursor_line]
+            self.buffer.delete(self.cursor_line)
+            self.cursor_line -= 1
+            self.cursor_col = len(previous)
+        self._ensure_cursor_visible()
+
+    def _delete_forward(self):
+        if self._delete_selection():
+            return
+        line = self.buffer[self.cursor_line]
+        if self.cursor_col < len(line):
+            self.buffer[self.cursor_line] = line[:self.cursor_col] + line[self.cursor_col + 1:]
+        elif self.cursor_line + 1 < len(self.buffer):
+            self.buffer[self.cursor_line] = line + self.buffer[self.cursor_line + 1]
+            self.buffer.delete(self.cursor_line + 1)
+
+    # ----------------------------------------------------------------------
+    # Eventos
+    # ----------------------------------------------------------------------
+
+    def handle_event(self, event):
+        if not self.active:
+            return
+
+        if event.type == pygame.MOUSEWHEEL:
+            if self.rect.collidepoint(pygame.mouse.get_pos()):
+                max_scroll = max(0, len(self.buffer) - self._visible_lines())
+                self.scroll_line = max(0, min(self.scroll_line - event.y * 3, max_scroll))
+            return
+
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.rect.collidepoint(event.pos):
+                line, col = self._position_from_mouse(event.pos)
+                self._move_cursor(line, col, extend=False)
+                self.anchor = (line, col)
+                self._dragging = True
+            return
+
+        if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self._dragging = False
+            return
+
+        if event.type == pygame.MOUSEMOTION and self._dragging:
+            line, col = self._position_from_mouse(event.pos)
+            self._move_cursor(line, col, extend=True)
+            return
+
+        if event.type != pygame.KEYDOWN:
+            return
+
+        mods = pygame.key.get_mods()
+        ctrl = mods & pygame.KMOD_CTRL
+        shift = bool(mods & pygame.KMOD_SHIFT)
+
+        # SELECCIONAR TODO: Ctrl + A
+        if ctrl and event.key == pygame.K_a:
+            last = len(self.buffer) - 1
+            self.anchor = (0, 0)
+            self.cursor_line, self.cursor_col = last, len(self.buffer[last])
+            return
+
+        # Copiar: Ctrl + C (la selección, o todo el texto si no hay)
+        if ctrl and event.key == pygame.K_c:
+            text = self._selected_text() or self.text
+            if text:
+                _clipboard().copy(text)
+            return
+
+        # Pegar: Ctrl + V
+        if ctrl and event.key == pygame.K_v:
+            paste_text = _clipboard().paste()
+            if paste_text:
+                self.insert_text(paste_text)
+            return
+
+        # Cortar: Ctrl + X (la selección, o todo el texto si no hay)
+        if ctrl and event.key == pygame.K_x:
+            text = self._selected_text()
+            if text:
+                _clipboard().copy(text)
+                self._delete_selection()
+            elif self.text:
+                _clipboard().copy(self.text)
+                self.clear()
+            return
+
+        # Navegación
+        line, col = self.cursor_line, self.cursor_col
+        if event.key == pygame.K_LEFT:
+            if col > 0:
+                self._move_cursor(line, col - 1, shift)
+            elif line > 0:
+                self._move_cursor(line - 1, len(self.buffer[line - 1]), shift)
+        elif event.key == pygame.K_RIGHT:
+            if col < len(self.buffer[line]):
+                self._move_cursor(line, col + 1, shift)
+            elif line + 1 < len(self.buffer):
+                self._move_cursor(line + 1, 0, shift)
+        elif event.key == pygame.K_UP:
+            self._move_cursor(line - 1, col, shift)
+        elif event.key == pygame.K_DOWN:
+            self._move_cursor(line + 1, col, shift)
+        elif event.key == pygame.K_HOME:
+            self._move_cursor(0 if ctrl else line, 0, shift)
+        elif event.key == pygame.K_END:
+            last = len(self.buffer) - 1 if ctrl else line
+            self._move_cursor(last, len(self.buffer[last]), shift)
+        elif event.key == pygame.K_PAGEUP:
+            self._move_cursor(line - self._visible_lines(), col, shift)
+        elif event.key == pygame.K_PAGEDOWN:
+            self._move_cursor(line + self._visible_lines(), col, shift)
+
+        # Teclas de edición
+        elif event.key == pygame.K_BACKSPACE:
+            self._backspace()
+        elif event.key == pygame.K_DELETE:
+            self._delete_forward()
+        elif event.key == pygame.K_RETURN:
+            self.insert_text("\n")
+        elif event.key == pygame.K_TAB:
+            self.insert_text("    ")
+        elif event.key == pygame.K_ESCAPE:
+            # Ignorar ESC
+            pass
+        elif event.unicode and not ctrl:
+            # Caracter normal
+            self.insert_text(event.unicode)
+
+    # ----------------------------------------------------------------------
+    # Dibujo
+    # ----------------------------------------------------------------------
+
+    def _line_surface(self, line, color):
+        key = (line, color)
+        surface = self._surface_cache.get(key)
+        if surface is None:
+            surface = self.font.render(line, True, color)
+            self._surface_cache[key] = surface
+            if len(self._surface_cache) > SURFACE_CACHE_SIZE:
+                self._surface_cache.popitem(last=False)
+        else:
+            self._surface_cache.move_to_end(key)
+        return surface
+
+    def draw(self, screen):
+        # Fondo
+        pygame.draw.rect(screen, (50, 50, 50), self.rect)
+        pygame.draw.rect(screen, (200, 200, 200), self.rect, 2)
+
+        previous_clip = screen.get_clip()
+        screen.set_clip(self.rect.inflate(-4, -4))
+
+        x0 = self.rect.x + PADDING
+        y0 = self.rect.y + PADDING
+        first = self.scroll_line
+        visible = self.buffer.lines(first, first + self._visible_lines())
+        empty = len(self.buffer) == 1 and not self.buffer[0].strip()
+
+        if empty:
+            # Placeholder
+            screen.blit(self._line_surface(self.placeholder, (150, 150, 150)), (x0, y0))
+        else:
+            selection = self._selection()
+            for i, line in enumerate(visible):
+                index = first + i
+                y = y0 + i * LINE_HEIGHT
+
+                if selection is not None:
+                    (l1, c1), (l2, c2) = selection
+                    if l1 <= index <= l2:
+                        start = c1 if index == l1 else 0
+                        end = c2 if index == l2 else len(line)
+                        sx = x0 + self.font.size(line[:start])[0]
+                        sw = max(4, self.font.size(line[start:end])[0])
+                        pygame.draw.rect(screen, (70, 90, 150), (sx, y, sw, LINE_HEIGHT - 2))
+
+                if line:
+                    screen.blit(self._line_surface(line, (255, 255, 255)), (x0, y))
+
+        # Cursor intermitente SIEMPRE (aunque esté vacío)
+        if self.active and self.cursor_visible:
+            row = self.cursor_line - first
+            if 0 <= row < self._visible_lines():
+                line = self.buffer[self.cursor_line]
+                cursor_x = x0 + self.font.size(line[:self.cursor_col])[0]
+                cursor_y = y0 + row * LINE_HEIGHT
+                pygame.draw.line(screen, (255, 255, 255),
+                                 (cursor_x, cursor_y),
+                                 (cursor_x, cursor_y + 18), 2)
+
+        screen.set_clip(previous_clip)
+
+        # Parpadeo del cursor
+        self.cursor_counter += 1
+        if self.cursor_counter >= 30:
+            self.cursor_visible = not self.cursor_visible
+            self.cursor_counter = 0
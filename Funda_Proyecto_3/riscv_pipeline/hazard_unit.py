@@ -0,0 +1,179 @@
+"""
+Clase que representa la unidad de Riesgos (Hazard Unit) en un procesador segmentado.
+
+Esta unidad es responsable de detectar posibles riesgos de datos en el pipeline y aplicar
+políticas como stalling o reenvío (forwarding) para resolverlos.
+
+Atributos:
+    enable_forwarding (bool): Indica si el reenvío está habilitado.
+    enable_branch_prediction (bool): Indica si la predicción de saltos está habilitada
+        (se usa como flag para el procesador; aquí solo manejamos riesgos de datos).
+    early_branch_resolution (bool): BEQ/BNE se resuelven en ID con un comparador
+        propio, alimentado desde el banco de registros y desde EX/MEM.
+
+Un micro-op fusionado (ver fusion) escribe dos registros: rd y rd2 (el de su
+primera instrucción, un resultado de la ALU aunque la segunda sea un LW).
+"""
+
+class HazardUnit:
+    """
+    Inicializa la unidad de riesgos.
+
+    Args:
+        enable_forwarding (bool): Activa el reenvío de datos si es True.
+        enable_branch_prediction (bool): Activa la predicción de saltos si es True.
+        early_branch_resolution (bool): Resuelve los saltos en ID en lugar de EX.
+    """
+
+    def __init__(self, enable_forwarding=True, enable_branch_prediction=False,
+                 early_branch_resolution=False):
+        self.enable_forwarding = enable_forwarding
+        self.enable_branch_prediction = enable_branch_prediction
+        self.early_branch_resolution = early_branch_resolution
+
+    # Configuraciones de la interfaz: clave -> (forwarding, predicción de saltos)
+    MODES = {
+        "no_hazard": (False, False),
+        "hazard": (True, False),
+        "branch": (False, True),
+        "hazard_branch": (True, True),
+    }
+
+    @classmethod
+    def from_mode(cls, mode_key, early_branch_resolution=False):
+        """
+        Crea la unidad para una clave de configuración ("hazard", "branch", ...).
+        """
+        forwarding, prediction = cls.MODES[mode_key]
+        return cls(forwarding, prediction, early_branch_resolution)
+
+    @staticmethod
+    def _writes(instr, reg):
+        """
+        True si instr escribe reg (rd, o rd2 si es un micro-op fusionado).
+        """
+        return reg is not None and (instr.get("rd") == reg or instr.get("rd2") == reg)
+
+    def detect_hazard(self, pipeline, id_instr, pending_loads=None, cycle=0):
+        """
+        Detecta posibles riesgos de datos en la etapa de ID del pipeline.
+
+        Analiza si las instrucciones en etapas posteriores (EX, MEM, WB) tienen conflictos
+        con la instrucción en la etapa de ID. Las etiquetas de reenvío indican en
+        qué slot estaba el productor al detectar; Pipeline las guarda en el
+        latch ID/EX y los multiplexores de EX toman el valor del latch que
+        corresponde un ciclo después ("EX" -> EX/MEM, "MEM" -> MEM/WB). Sin
+        forwarding las etiquetas quedan en "NO" y todo RAW con EX o MEM es stall.
+        x0 nunca genera dependencias.
+
+        Args:
+            pipeline (dict): Estado actual del pipeline con claves "IF", "ID", "EX", "MEM", "WB".
+            id_instr (dict or None): Instrucción actual en la etapa de decodificación (ID).
+            pending_loads (dict, optional): Cargas en vuelo del sistema de memoria
+                (registro destino -> ciclo en que llega el dato).
+            cycle (int): Ciclo actual (para comparar con pending_loads).
+
+        Returns:
+            dict: Diccionario con las claves:
+                - 'stall' (bool): True si requiere detener el pipeline (solo por datos).
+                - 'forwardA' (str): Fuente de reenvío para rs1 ("EX", "MEM", "WB", "NO").
+                - 'forwardB' (str): Fuente de reenvío para rs2 ("EX", "MEM", "WB", "NO").
+        """
+        if id_instr is None:
+            return {"stall": False, "forwardA": "NO", "forwardB": "NO"}
+
+        rs1 = id_instr.get("rs1")
+        rs2 = id_instr.get("rs2")
+        rs1 = None if rs1 == "x0" else rs1
+        rs2 = None if rs2 == "x0" else rs2
+
+        hazard = {"stall": False, "forwardA": "NO", "forwardB": "NO"}
+        early_branch = (self.early_branch_resolution and id_instr.get("op") in ("BEQ", "BNE")
+                        and "head" not in id_instr)
+
+        # ------------------------------------------------------------------
+        # Riesgo load-use: EX contiene LW y su resultado es usado de inmediato.
+        # Si hay LW en EX y su rd es igual a rs1/rs2 de la instrucción en ID,
+        # se genera un stall de un ciclo (incluso con forwarding).
+        # ------------------------------------------------------------------
+        ex_instr = pipeline.get("EX")
+        if ex_instr and ex_instr.get("op") == "LW" and ex_instr.get("rd"):
+            if ex_instr["rd"] == rs1 or ex_instr["rd"] == rs2:
+                hazard["stall"] = True
+                return hazard
+
+        # ------------------------------------------------------------------
+        # Cargas con latencia variable (sistema de memoria): si no se detiene,
+        # la instrucción en ID lee el banco de registros en el próximo ciclo y
+        # ejecuta EX dentro de dos. Con forwarding el dato puede llegar justo
+        # en ese EX (bypass desde la memoria); sin él, o si el salto se
+        # compara en ID, debe estar escrito antes de la lectura. Si escribe el
+        # mismo registro que una carga en vuelo (WAW), espera a que esa carga
+        # termine antes de llegar ella misma a MEM.
+        # ------------------------------------------------------------------
+        if pending_loads:
+            limit = cycle + 2 if self.enable_forwarding and not early_branch else cycle + 1
+            for reg in (rs1, rs2):
+                if reg in pending_loads and pending_loads[reg] > limit:
+                    hazard["stall"] = True
+                    return hazard
+            for rd in (id_instr.get("rd"), id_instr.get("rd2")):
+                if rd in pending_loads and pending_loads[rd] > cycle + 3:
+                    hazard["stall"] = True
+                    return hazard
+
+        # ------------------------------------------------------------------
+        # Salto resuelto en ID: el comparador trabaja mientras el productor de
+        # EX todavía calcula, y solo tiene reenvío desde EX/MEM para resultados
+        # de la ALU (un LW en MEM aún no tiene su dato).
+        # ------------------------------------------------------------------
+        mem_instr = pipeline.get("MEM")
+        if early_branch:
+            if ex_instr and (self._writes(ex_instr, rs1) or self._writes(ex_instr, rs2)):
+                hazard["stall"] = True
+                return hazard
+            if mem_instr and (self._writes(mem_instr, rs1) or self._writes(mem_instr, rs2)):
+                loaded = mem_instr.get("op") == "LW" and mem_instr.get("rd") in (rs1, rs2)
+                if loaded or not self.enable_forwarding:
+                    hazard["stall"] = True
+                    return hazard
+
+        # ------------------------------------------------------------------
+        # Riesgo de datos con EX (RAW) -> posible forwarding o stall
+        # ------------------------------------------------------------------
+        if ex_instr and (ex_instr.get("rd") or ex_instr.get("rd2")):
+            if self._writes(ex_instr, rs1):
+                hazard["forwardA"] = "EX" if self.enable_forwarding else "NO"
+                if not self.enable_forwarding:
+                    hazard["stall"] = True
+            if self._writes(ex_instr, rs2):
+                hazard["forwardB"] = "EX" if self.enable_forwarding else "NO"
+                if not self.enable_forwarding:
+                    hazard["stall"] = True
+
+        # ------------------------------------------------------------------
+        # Riesgo de datos con MEM -> forwarding desde MEM/WB, o stall sin
+        # forwarding (el productor escribe recién después de la lectura en ID)
+        # ------------------------------------------------------------------
+        if mem_instr and (mem_instr.get("rd") or mem_instr.get("rd2")):
+            if not self.enable_forwarding:
+                if self._writes(mem_instr, rs1) or self._writes(mem_instr, rs2):
+                    hazard["stall"] = True
+                return hazard
+            if self._writes(mem_instr, rs1) and hazard["forwardA"] == "NO":
+                hazard["forwardA"] = "MEM"
+            if self._writes(mem_instr, rs2) and hazard["forwardB"] == "NO":
+                hazard["forwardB"] = "MEM"
+
+        # ------------------------------------------------------------------
+        # Riesgo de datos con WB -> sin acción: escribe el banco de registros
+        # en el mismo ciclo en que ID lo lee (la etiqueta es solo informativa)
+        # ------------------------------------------------------------------
+        wb_instr = pipeline.get("WB")
+        if self.enable_forwarding and wb_instr:
+            if self._writes(wb_instr, rs1) and hazard["forwardA"] == "NO":
+                hazard["forwardA"] = "WB"
+            if self._writes(wb_instr, rs2) and hazard["forwardB"] == "NO":
+                hazard["forwardB"] = "WB"
+
+        return hazard
@@ -0,0 +1,262 @@
+import argparse
+import struct
+
+from .alu import R_TYPE_OPS
+from .golden_model import GoldenModel
+from .hazard_unit import HazardUnit
+from .parser import parse_riscv_line, format_instruction, load_assembly_file
+from .pipeline import Pipeline
+from .vector_unit import has_vector_ops
+
+"""
+Simulación guiada por trazas para flujos de instrucciones muy largos.
+
+Una traza es el flujo dinámico de instrucciones ya ejecutado, con el resultado
+de cada salto ('taken') y la dirección de cada LW/SW ('addr'). Pipeline la
+consume desde un iterador (instruction_stream), de modo que millones de
+instrucciones pasan por el modelo de tiempo con memoria acotada.
+
+Formatos soportados:
+    - Texto : una instrucción por línea, campos separados por tabulador:
+              pc <TAB> instrucción <TAB> T|N|- <TAB> dirección|-
+    - Binario: cabecera BINARY_MAGIC seguida de registros de tamaño fijo (RECORD).
+"""
+
+BINARY_MAGIC = b"RVTRACE1"
+
+# pc, código de operación, rd, rs1, rs2, flags, imm, dirección
+RECORD = struct.Struct("<IBbbbBii")
+
+# Los códigos nuevos se agregan al final para no cambiar los de trazas existentes.
+OPCODES = ["ADD", "SUB", "AND", "OR", "MUL", "SLT", "ADDI", "LW", "SW", "BEQ", "BNE", "SLTU"]
+OPCODE_INDEX = {op: i for i, op in enumerate(OPCODES)}
+
+FLAG_TAKEN = 1
+FLAG_HAS_ADDR = 2
+
+DEFAULT_CHUNK = 4096
+
+
+def _reg_num(name):
+    return int(name[1:]) if name else -1
+
+
+def _reg_name(num):
+    return f"x{num}" if num >= 0 else None
+
+
+# ----------------------------------------------------------------------
+# Lectura
+# ----------------------------------------------------------------------
+
+class TraceReader:
+    """
+    Lee una traza de forma perezosa, por bloques de chunk_size registros.
+
+    Es iterable varias veces: cada iteración vuelve a abrir el archivo.
+    """
+
+    def __init__(self, path, chunk_size=DEFAULT_CHUNK):
+        self.path = path
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        with open(self.path, "rb") as f:
+            binary = f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+        if binary:
+            return self._iter_binary()
+        return self._iter_text()
+
+    def _iter_binary(self):
+        with open(self.path, "rb") as f:
+            f.read(len(BINARY_MAGIC))
+            while True:
+                chunk = f.read(RECORD.size * self.chunk_size)
+                if not chunk:
+                    break
+                usable = len(chunk) - len(chunk) % RECORD.size
+                for fields in RECORD.iter_unpack(chunk[:usable]):
+                    yield _decode_binary(fields)
+
+    def _iter_text(self):
+        # readlines(hint) limita lo que se carga en memoria por bloque.
+        hint = self.chunk_size * 64
+        with open(self.path, "r") as f:
+            while True:
+                lines = f.readlines(hint)
+                if not lines:
+                    break
+                for line in lines:
+                    record = _decode_text(line)
+                    if record is not None:
+                        yield record
+
+
+def _decode_binary(fields):
+    pc, code, rd, rs1, rs2, flags, imm, addr = fields
+    op = OPCODES[code]
+    instr = {"op": op, "pc": pc}
+    if rd >= 0:
+        instr["rd"] = _reg_name(rd)
+    if rs1 >= 0:
+        instr["rs1"] = _reg_name(rs1)
+    if rs2 >= 0:
+        instr["rs2"] = _reg_name(rs2)
+    if op not in R_TYPE_OPS:
+        instr["imm"] = imm
+    if op in ["BEQ", "BNE"]:
+        instr["taken"] = bool(flags & FLAG_TAKEN)
+    if flags & FLAG_HAS_ADDR:
+        instr["addr"] = addr
+    return instr
+
+
+def _decode_text(line):
+    line = line.rstrip("\n")
+    if not line or line.startswith("#"):
+        return None
+    fields = line.split("\t")
+    instr = parse_riscv_line(fields[1])
+    if instr is None:
+        raise ValueError(f"Instrucción inválida en la traza: {line!r}")
+    instr["pc"] = int(fields[0])
+    if len(fields) > 2 and fields[2] in ("T", "N"):
+        instr["taken"] = fields[2] == "T"
+    if len(fields) > 3 and fields[3] != "-":
+        instr["addr"] = int(fields[3])
+    return instr
+
+
+# ----------------------------------------------------------------------
+# Escritura
+# ----------------------------------------------------------------------
+
+def functional_trace(instruction_memory, memory_size=64, max_instructions=None):
+    """
+    Ejecuta el programa de forma funcional y genera su flujo dinámico con
+    saltos resueltos y direcciones de memoria. Las trazas no representan
+    instrucciones vectoriales.
+    """
+    if has_vector_ops(instruction_memory):
+        raise ValueError("Las trazas no soportan instrucciones vectoriales.")
+    model = GoldenModel(instruction_memory, memory_size)
+    while max_instructions is None or model.steps < max_instructions:
+        instr = model.step()
+        if instr is None:
+            return
+        yield instr
+
+
+def write_trace(path, records, binary=False):
+    """
+    Escribe un flujo de instrucciones (iterable de dicts) en formato texto o binario.
+
+    Retorna:
+        int: Cantidad de registros escritos.
+    """
+    count = 0
+    if binary:
+        with open(path, "wb") as f:
+            f.write(BINARY_MAGIC)
+            buffer = bytearray()
+            for instr in records:
+                flags = (FLAG_TAKEN if instr.get("taken") else 0)
+                if "addr" in instr:
+                    flags |= FLAG_HAS_ADDR
+                buffer += RECORD.pack(
+                    instr["pc"], OPCODE_INDEX[instr["op"]],
+                    _reg_num(instr.get("rd")), _reg_num(instr.get("rs1")),
+                    _reg_num(instr.get("rs2")), flags,
+                    instr.get("imm", 0), instr.get("addr", 0))
+                count += 1
+                if len(buffer) >= RECORD.size * DEFAULT_CHUNK:
+                    f.write(buffer)
+                    buffer.clear()
+            f.write(buffer)
+    else:
+        with open(path, "w") as f:
+            for instr in records:
+                taken = "-"
+                if "taken" in instr:
+                    taken = "T" if instr["taken"] else "N"
+                addr = instr.get("addr", "-")
+                f.write(f"{instr['pc']}\t{format_instruction(instr)}\t{taken}\t{addr}\n")
+                count += 1
+    return count
+
+
+# ----------------------------------------------------------------------
+# Simulación
+# ----------------------------------------------------------------------
+
+def _report(proc, previous):
+    stats = proc.stats
+    cycles = proc.cycle - previous["cycle"]
+    instructions = stats["instructions"] - previous["instructions"]
+    return {
+        "cycle": proc.cycle,
+        "instructions": stats["instructions"],
+        "stalls": stats["stalls"],
+        "data_stalls": stats["data_stalls"],
+        "branch_stalls": stats["branch_stalls"],
+        "flushes": stats["flushes"],
+        "ipc": stats["instructions"] / proc.cycle if proc.cycle else 0.0,
+        "interval_ipc": instructions / cycles if cycles else 0.0,
+        "finished": proc.finished,
+    }
+
+
+def simulate_trace(records, hazard_unit=None, report_every=100_000):
+    """
+    Pasa un flujo de instrucciones por el modelo de tiempo de Pipeline.
+
+    Genera un reporte cada report_every ciclos y uno final al terminar.
+    """
+    proc = Pipeline([], hazard_unit, instruction_stream=records)
+    previous = {"cycle": 0, "instructions": 0}
+
+    while not proc.finished:
+        proc.step()
+        if proc.cycle % report_every == 0 or proc.finished:
+            report = _report(proc, previous)
+            previous = {"cycle": proc.cycle, "instructions": proc.stats["instructions"]}
+            yield report
+
+
+def _print_report(report):
+    state = "final" if report["finished"] else "parcial"
+    print(f"[{state}] ciclo {report['cycle']:>12,} | instr {report['instructions']:>12,} | "
+          f"stalls {report['stalls']:>10,} | IPC {report['ipc']:.3f} "
+          f"(intervalo {report['interval_ipc']:.3f})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulación guiada por trazas.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    record = sub.add_parser("record", help="Genera la traza de un programa .s")
+    record.add_argument("program")
+    record.add_argument("output")
+    record.add_argument("--binary", action="store_true", help="Formato binario")
+    record.add_argument("--max", type=int, default=None, help="Máximo de instrucciones")
+
+    simulate = sub.add_parser("simulate", help="Pasa una traza por el modelo de tiempo")
+    simulate.add_argument("trace")
+    simulate.add_argument("--config", default="hazard", choices=sorted(HazardUnit.MODES))
+    simulate.add_argument("--every", type=int, default=100_000, help="Ciclos entre reportes")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        program = load_assembly_file(args.program)
+        count = write_trace(args.output, functional_trace(program, max_instructions=args.max),
+                            binary=args.binary)
+        print(f"{count} instrucciones escritas en {args.output}")
+    else:
+        reader = TraceReader(args.trace)
+        for report in simulate_trace(reader, HazardUnit.from_mode(args.config), args.every):
+            _print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+from collections import deque
+
+"""
+Modelo de tiempo de la memoria principal detrás de la etapa MEM de Pipeline.
+
+    - DRAM con varios bancos (banco = dirección % banks). Cada acceso ocupa su
+      banco durante bank_busy ciclos; un acceso a un banco ocupado espera
+      (conflicto de banco) y esa espera se suma a su latencia.
+    - Buffer de escritura (store buffer): SW se retira sin esperar a la DRAM;
+      las escrituras se drenan en orden cuando su banco está libre. Un LW a una
+      dirección con escritura pendiente toma el valor del buffer en 1 ciclo.
+    - Cargas no bloqueantes: hasta max_outstanding LW en vuelo a la vez, así
+      que cargas independientes se solapan.
+
+La etapa MEM se congela solo si el buffer de escritura está lleno o si no
+quedan entradas para otra carga en vuelo.
+
+Los accesos vectoriales (VLE32/VSE32, ver vector_unit) usan los mismos
+bancos, un elemento por palabra y 'lanes' palabras por ciclo; no ocupan
+entradas de carga en vuelo y una escritura vectorial va directo a la DRAM
+una vez vacío el buffer de escritura (así el orden con los SW se mantiene).
+"""
+
+
+class MemorySystem:
+    def __init__(self, latency=10, banks=4, bank_busy=None, store_buffer_size=4,
+                 max_outstanding=2):
+        """
+        Args:
+            latency (int): Ciclos desde que un acceso empieza en su banco hasta
+                que el dato está disponible.
+            banks (int): Cantidad de bancos de la DRAM.
+            bank_busy (int, optional): Ciclos que un acceso ocupa su banco
+                (por defecto y como máximo, la latencia).
+            store_buffer_size (int): Entradas del buffer de escritura.
+            max_outstanding (int): Cargas en vuelo permitidas.
+        """
+        self.latency = max(1, latency)
+        self.banks = max(1, banks)
+        # La ocupación del banco no supera la latencia: así el ciclo de llegada
+        # de un LW que aún no se envió se puede acotar con precisión.
+        self.bank_busy = self.latency if bank_busy is None else min(max(1, bank_busy), self.latency)
+        self.store_buffer_size = store_buffer_size
+        self.max_outstanding = max_outstanding
+
+        self.memory = None
+        self.bank_free = [0] * self.banks   # Ciclo en que cada banco queda libre
+        self.store_buffer = deque()         # (dirección, valor) en orden de programa
+        self.in_flight = []                 # Ciclo de llegada de cada carga en vuelo
+        self.last_write = None
+
+        self.stats = {
+            "loads": 0,
+            "stores": 0,
+            "forwarded_loads": 0,   # Cargas servidas desde el buffer de escritura
+            "bank_conflicts": 0,
+            "conflict_cycles": 0,
+            "max_in_flight": 0,
+        }
+
+    def bind(self, memory):
+        """
+        Asocia la lista de palabras de memoria del procesador.
+        """
+        self.memory = memory
+
+    # ----------------------------------------------------------------------
+    # Bancos
+    # ----------------------------------------------------------------------
+
+    def _start_access(self, addr, cycle):
+        """
+        Reserva el banco de 'addr' y retorna el ciclo en que empieza el acceso.
+        """
+        bank = addr % self.banks
+        start = max(cycle, self.bank_free[bank])
+        if start > cycle:
+            self.stats["bank_conflicts"] += 1
+            self.stats["conflict_cycles"] += start - cycle
+        self.bank_free[bank] = start + self.bank_busy
+        return start
+
+    # ----------------------------------------------------------------------
+    # Interfaz con la etapa MEM
+    # ----------------------------------------------------------------------
+
+    def can_load(self, cycle):
+        self.in_flight = [ready for ready in self.in_flight if ready > cycle]
+        return len(self.in_flight) < self.max_outstanding
+
+    def can_store(self):
+        return len(self.store_buffer) < self.store_buffer_size
+
+    def load(self, addr, cycle):
+        """
+        Inicia un LW en el ciclo 'cycle'.
+
+        Retorna:
+            tuple: (valor, ciclo en que el dato está disponible).
+        """
+        self.stats["loads"] += 1
+        if not 0 <= addr < len(self.memory):
+            return 0, cycle + 1
+
+        # Escritura pendiente a la misma dirección: la más reciente gana.
+        for store_addr, value in reversed(self.store_buffer):
+            if store_addr == addr:
+                self.stats["forwarded_loads"] += 1
+                return value, cycle + 1
+
+        ready = self._start_access(addr, cycle) + self.latency
+        self.in_flight.append(ready)
+        self.stats["max_in_flight"] = max(self.stats["max_in_flight"], len(self.in_flight))
+        return self.memory[addr], ready
+
+    def store(self, addr, value):
+        """
+        Agrega un SW al buffer de escritura (las direcciones fuera de rango se ignoran).
+        """
+        self.stats["stores"] += 1
+        if 0 <= addr < len(self.memory):
+            self.store_buffer.append((addr, value))
+
+    def can_vector_store(self):
+        return not self.store_buffer
+
+    def vector_load(self, addr, count, cycle, lanes):
+        """
+        Carga vectorial de 'count' palabras desde addr, 'lanes' por ciclo a
+        partir de 'cycle'.
+
+        Retorna:
+            tuple: (valores, ciclo del primer elemento, ciclo del último).
+        """
+        values, readies = [], []
+        for i in range(count):
+            a, start = addr + i, cycle + i // lanes
+            value, ready = 0, start + 1
+            if 0 <= a < len(self.memory):
+                value = self.memory[a]
+                for store_addr, pending in reversed(self.store_buffer):
+                    if store_addr == a:
+                        value = pending
+                        self.stats["forwarded_loads"] += 1
+                        break
+                else:
+                    ready = self._start_access(a, start) + self.latency
+            values.append(value)
+            readies.append(ready)
+        self.stats["loads"] += count
+        if not readies:
+            return values, cycle + 1, cycle + 1
+        return values, readies[0], max(readies)
+
+    def vector_store(self, addr, values, cycle, lanes):
+        """
+        Escritura vectorial (con el buffer de escritura vacío).
+
+        Retorna:
+            int: Ciclo en que el último banco queda libre.
+        """
+        done = cycle + 1
+        for i, value in enumerate(values):
+            a = addr + i
+            if 0 <= a < len(self.memory):
+                start = self._start_access(a, cycle + i // lanes)
+                self.memory[a] = value
+                self.last_write = a
+                done = max(done, start + self.bank_busy)
+        self.stats["stores"] += len(values)
+        return done
+
+    def tick(self, cycle):
+        """
+        Drena la escritura más antigua del buffer si su banco está libre.
+        """
+        if not self.store_buffer:
+            return
+        addr, value = self.store_buffer[0]
+        if self.bank_free[addr % self.banks] <= cycle:
+            self.store_buffer.popleft()
+            self._start_access(addr, cycle)
+            self.memory[addr] = value
+            self.last_write = addr
+
+    def idle(self, cycle):
+        """
+        True si no quedan escrituras pendientes ni cargas en vuelo.
+        """
+        return not self.store_buffer and all(ready <= cycle for ready in self.in_flight)
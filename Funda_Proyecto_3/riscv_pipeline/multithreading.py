@@ -0,0 +1,258 @@
+from .pipeline import Pipeline
+from .state import int32_array
+from .vector_unit import has_vector_ops
+
+"""
+Multihilo de grano fino sobre Pipeline: varios hilos de hardware comparten
+las cinco etapas, cada uno con su PC y su banco de registros.
+
+    - El banco de registros físico tiene 32 entradas por hilo, indexadas por
+      (hilo, registro): al cargar los programas sus registros se renombran a
+      x{32 * tid + n} (x0 queda como x0). Así la HazardUnit, los
+      multiplexores de reenvío y las cargas en vuelo solo ven dependencias
+      dentro de un mismo hilo.
+    - La memoria de datos es compartida, como entre hilos de un proceso.
+    - Un salto tomado vacía solo las instrucciones de su propio hilo.
+    - Sin predicción, el ciclo extra de un salto solo detiene ID/IF si hay
+      instrucciones de ese hilo detrás; si no, el hilo pierde su próximo
+      turno de búsqueda y los demás siguen avanzando.
+
+Políticas de búsqueda (fetch_policy):
+    round_robin     : un hilo distinto en cada ciclo (barrel).
+    switch_on_stall : busca del mismo hilo hasta que su instrucción en ID pide
+                      stall; entonces la descarta junto con lo buscado detrás
+                      (se vuelve a buscar más tarde) y cambia de hilo.
+    icount          : el hilo con menos instrucciones en ID/EX (ICOUNT).
+"""
+
+FETCH_POLICIES = ("round_robin", "switch_on_stall", "icount")
+REGISTERS_PER_THREAD = 32
+
+
+def _physical(name, tid):
+    if name is None or name == "x0":
+        return name
+    return f"x{tid * REGISTERS_PER_THREAD + int(name[1:])}"
+
+
+class HardwareThread:
+    """
+    Contexto de un hilo de hardware: programa, PC y contadores propios.
+
+    Args:
+        tid (int): Identificador del hilo.
+        instruction_memory (list[dict]): Programa del hilo (registros arquitectónicos).
+    """
+
+    def __init__(self, tid, instruction_memory):
+        self.tid = tid
+        self.instruction_memory = instruction_memory or []
+        # Programa con los registros ya renombrados al banco físico.
+        self.decoded = []
+        for instr in self.instruction_memory:
+            renamed = dict(instr)
+            for field in ("rd", "rs1", "rs2"):
+                if field in renamed:
+                    renamed[field] = _physical(renamed[field], tid)
+            self.decoded.append(renamed)
+
+        self.pc = 0
+        self.blocked_until = 0     # Último ciclo en que no puede buscar
+        self.finish_cycle = 0 if not self.instruction_memory else None
+
+        self.stats = {
+            "instructions": 0,     # Retiradas en WB
+            "fetched": 0,          # Incluye las que se volvieron a buscar
+            "data_stalls": 0,      # Stalls del pipeline pedidos por este hilo
+            "branch_stalls": 0,
+            "flushes": 0,
+            "switches": 0,         # Cambios de hilo por switch_on_stall
+        }
+
+    @property
+    def fetch_done(self):
+        return self.pc >= len(self.instruction_memory)
+
+
+class MultithreadedPipeline(Pipeline):
+    """
+    Pipeline de 5 etapas compartido por varios hilos de hardware.
+
+    Args:
+        programs (list[list[dict]]): Un programa por hilo.
+        hazard_unit (HazardUnit, optional): Unidad de riesgos.
+        fetch_policy (str): Una de FETCH_POLICIES.
+        memory_system (MemorySystem, optional): Modelo de la memoria principal.
+    """
+
+    def __init__(self, programs, hazard_unit=None, fetch_policy="round_robin",
+                 memory_system=None):
+        if fetch_policy not in FETCH_POLICIES:
+            raise ValueError(f"Política de búsqueda desconocida: {fetch_policy}")
+        if any(has_vector_ops(program) for program in programs):
+            raise ValueError("El pipeline multihilo no soporta instrucciones vectoriales.")
+        super().__init__([], hazard_unit, memory_system=memory_system)
+        self.fetch_policy = fetch_policy
+        self.threads = [HardwareThread(tid, program) for tid, program in enumerate(programs)]
+        self.registers = int32_array(REGISTERS_PER_THREAD * len(self.threads))
+        self._next = 0    # Primer hilo a considerar en la próxima búsqueda
+
+    def thread_registers(self, tid):
+        """
+        Banco de registros arquitectónico (32 valores) del hilo tid.
+        """
+        base = tid * REGISTERS_PER_THREAD
+        return self.registers[base:base + REGISTERS_PER_THREAD]
+
+    def run_functional(self, max_blocks=1_000_000):
+        """
+        Sin modelo por bloques para varios hilos (ver Pipeline.run_functional).
+        """
+        raise ValueError("El modo funcional no soporta varios hilos.")
+
+    # ----------------------------------------------------------------------
+    # Búsqueda
+    # ----------------------------------------------------------------------
+
+    def _select_thread(self):
+        """
+        Elige el hilo que busca en este ciclo según fetch_policy (None si
+        ninguno puede).
+        """
+        count = len(self.threads)
+        ready = []
+        for i in range(count):
+            thread = self.threads[(self._next + i) % count]
+            if not thread.fetch_done and thread.blocked_until < self.cycle:
+                ready.append(thread)
+        if not ready:
+            return None
+
+        if self.fetch_policy == "icount":
+            in_flight = [0] * count
+            for stage in ("ID", "EX"):
+                instr = self.pipeline[stage]
+                if instr is not None:
+                    in_flight[instr["tid"]] += 1
+            # min() conserva el orden de rotación ante empates.
+            return min(ready, key=lambda thread: in_flight[thread.tid])
+        return ready[0]
+
+    def _fetch(self):
+        thread = self._select_thread()
+        if thread is None:
+            return None
+
+        instr = dict(thread.decoded[thread.pc])
+        instr["pc"] = thread.pc
+        instr["tid"] = thread.tid
+        instr["seq"] = self.fetched
+        self.fetched += 1
+        thread.pc += 1
+        thread.stats["fetched"] += 1
+
+        self.pc = thread.pc
+        if self.fetch_policy == "switch_on_stall":
+            self._next = thread.tid
+        else:
+            self._next = (thread.tid + 1) % len(self.threads)
+        return instr
+
+    # ----------------------------------------------------------------------
+    # Saltos y stalls por hilo
+    # ----------------------------------------------------------------------
+
+    def _flush_taken(self, branch, stages):
+        thread = self.threads[branch["tid"]]
+        target = branch["pc"] + branch.get("imm", 0)
+        if 0 <= target < len(thread.instruction_memory):
+            thread.pc = target
+        else:
+            # Si la dirección cae fuera, el hilo termina.
+            thread.pc = len(thread.instruction_memory)
+
+        for stage in stages:
+            instr = self.pipeline[stage]
+            if instr is not None and instr["tid"] == thread.tid:
+                self.pipeline[stage] = None
+        self.stats["flushes"] += 1
+        thread.stats["flushes"] += 1
+
+    def _branch_penalty(self, branch):
+        thread = self.threads[branch["tid"]]
+        for stage in ("IF", "ID"):
+            instr = self.pipeline[stage]
+            if instr is not None and instr["tid"] == thread.tid:
+                thread.stats["branch_stalls"] += 1
+                return True
+        # Nada del hilo detrás del salto: solo se salta su próximo turno.
+        thread.blocked_until = self.cycle + 1
+        return False
+
+    def _detect_hazards(self):
+        hazard_info = super()._detect_hazards()
+        if (hazard_info["stall"] and self.fetch_policy == "switch_on_stall"
+                and self._switch_thread()):
+            hazard_info["stall"] = False
+            hazard_info["thread_switch"] = True
+        return hazard_info
+
+    def _switch_thread(self):
+        """
+        switch_on_stall: descarta la instrucción detenida en ID (y lo buscado
+        detrás de ella en su hilo) y pasa la búsqueda al siguiente hilo.
+
+        Retorna:
+            bool: False si no hay otro hilo que pueda buscar (se hace el stall).
+        """
+        stalled = self.pipeline["ID"]
+        thread = self.threads[stalled["tid"]]
+        if not any(other is not thread and not other.fetch_done
+                   and other.blocked_until <= self.cycle for other in self.threads):
+            return False
+
+        for stage in ("ID", "IF"):
+            instr = self.pipeline[stage]
+            if instr is not None and instr["tid"] == thread.tid:
+                self.pipeline[stage] = None
+        thread.pc = stalled["pc"]
+        thread.stats["switches"] += 1
+        self._next = (thread.tid + 1) % len(self.threads)
+        return True
+
+    # ----------------------------------------------------------------------
+    # Ciclo y métricas
+    # ----------------------------------------------------------------------
+
+    def step(self):
+        if self.finished:
+            return None
+        retiring = self.pipeline["WB"]
+        retired = self.stats["instructions"]
+        data_stalls = self.stats["data_stalls"]
+
+        hazard_info = super().step()
+
+        if self.stats["instructions"] > retired:
+            thread = self.threads[retiring["tid"]]
+            thread.stats["instructions"] += 1
+            if thread.fetch_done and not any(
+                    instr is not None and instr["tid"] == thread.tid
+                    for instr in self.pipeline.values()):
+                thread.finish_cycle = self.cycle
+        if self.stats["data_stalls"] > data_stalls:
+            self.threads[self.pipeline["ID"]["tid"]].stats["data_stalls"] += 1
+        return hazard_info
+
+    def thread_results(self):
+        """
+        Métricas por hilo: contadores, ciclo en que terminó e IPC sobre los
+        ciclos totales del pipeline.
+        """
+        results = []
+        for thread in self.threads:
+            result = {"tid": thread.tid, "pc": thread.pc, "finish_cycle": thread.finish_cycle}
+            result.update(thread.stats)
+            result["ipc"] = thread.stats["instructions"] / self.cycle if self.cycle else 0.0
+            results.append(result)
+        return results
@@ -0,0 +1,427 @@
+from .alu import execute
+from .hazard_unit import HazardUnit
+from .state import int32_array
+from .vector_unit import has_vector_ops
+
+"""
+Procesador fuera de orden (algoritmo de Tomasulo con buffer de reordenamiento).
+
+Modelo alternativo a Pipeline con la misma interfaz (step, finished, registers,
+memory, pipeline, pc, cycle) para poder compararlo lado a lado con el
+procesador en orden:
+
+    - Estaciones de reserva por clase de unidad funcional.
+    - Renombrado de registros (RAT -> entradas del ROB).
+    - ROB para confirmar (commit) en orden.
+    - Cola de loads/stores con reenvío store -> load.
+    - Latencias configurables por unidad funcional (MUL más lenta que ADD).
+
+Los saltos se resuelven al ejecutarse. Sin predicción la búsqueda se detiene
+hasta resolver el salto; con predicción se asume "no tomado" y si el salto se
+toma se descartan las instrucciones más jóvenes. No modela la extensión
+vectorial (ver vector_unit).
+"""
+
+# Clase de unidad funcional de cada instrucción.
+FU_CLASS = {
+    "ADD": "ALU", "SUB": "ALU", "AND": "ALU", "OR": "ALU", "SLT": "ALU", "SLTU": "ALU",
+    "ADDI": "ALU",
+    "MUL": "MUL",
+    "LW": "LOAD",
+    "SW": "STORE",
+    "BEQ": "BRANCH", "BNE": "BRANCH",
+}
+
+DEFAULT_LATENCIES = {"ALU": 1, "MUL": 4, "LOAD": 2, "STORE": 1, "BRANCH": 1}
+DEFAULT_UNITS = {"ALU": 2, "MUL": 1, "LOAD": 1, "STORE": 1, "BRANCH": 1}
+DEFAULT_RS_SIZES = {"ALU": 4, "MUL": 2, "BRANCH": 2}
+
+
+class ROBEntry:
+    """
+    Entrada del buffer de reordenamiento.
+
+    Los operandos (qj/qk) apuntan a la entrada del ROB que los producirá,
+    o son None si el valor (vj/vk) ya está disponible.
+    """
+
+    def __init__(self, rob_id, instr):
+        self.id = rob_id
+        self.instr = instr
+        self.op = instr["op"]
+        self.fu = FU_CLASS[self.op]
+        self.rd = int(instr["rd"][1:]) if instr.get("rd") else None
+
+        self.vj = self.vk = 0
+        self.qj = self.qk = None
+
+        self.started = False
+        self.done = False
+        self.finish_cycle = None
+        self.value = None
+        self.address = None
+        self.taken = False
+        self.squashed = False
+
+
+class OutOfOrderCore:
+    """
+    Núcleo fuera de orden de emisión simple y commit simple.
+    """
+
+    def __init__(self, instruction_memory, hazard_unit=None, latencies=None,
+                 units=None, rs_sizes=None, rob_size=8, lsq_size=4, cdb_width=1):
+        """
+        Args:
+            instruction_memory (list[dict]): Lista de instrucciones a ejecutar.
+            hazard_unit (HazardUnit, optional): Solo se usa enable_branch_prediction.
+            latencies (dict, optional): Ciclos por clase de unidad funcional.
+            units (dict, optional): Cantidad de unidades por clase.
+            rs_sizes (dict, optional): Estaciones de reserva por clase (ALU, MUL, BRANCH).
+            rob_size (int): Entradas del ROB.
+            lsq_size (int): Entradas de la cola de loads/stores.
+            cdb_width (int): Resultados que se difunden por ciclo.
+        """
+        self.instruction_memory = instruction_memory or []
+        if has_vector_ops(self.instruction_memory):
+            raise ValueError("El núcleo fuera de orden no soporta instrucciones vectoriales.")
+        self.hazard_unit = hazard_unit or HazardUnit(enable_forwarding=True,
+                                                     enable_branch_prediction=True)
+        self.latencies = dict(DEFAULT_LATENCIES, **(latencies or {}))
+        self.units = dict(DEFAULT_UNITS, **(units or {}))
+        self.rs_sizes = dict(DEFAULT_RS_SIZES, **(rs_sizes or {}))
+        self.rob_size = rob_size
+        self.lsq_size = lsq_size
+        self.cdb_width = cdb_width
+
+        # Vista por etapas para render_pipeline (IF, ID=emisión, EX, MEM, WB=commit).
+        self.pipeline = {
+            "IF": None,
+            "ID": None,
+            "EX": None,
+            "MEM": None,
+            "WB": None,
+        }
+
+        self.pc = 0
+        self.cycle = 0
+        self.finished = False
+
+        self.memory = int32_array(64)
+        self.registers = int32_array(32)
+        self.last_mem_write = None
+
+        self.rob = []                     # Entradas en orden de programa
+        self.rat = [None] * 32            # Registro -> ROBEntry productora
+        self.rs = {fu: [] for fu in self.rs_sizes}
+        self.lsq = []                     # LW/SW en orden de programa
+        self.fetch_slot = None            # Instrucción buscada, pendiente de emitir
+        self.pending_branch = None        # Salto que bloquea la búsqueda (sin predicción)
+
+        self._next_id = 0
+        self.fetched = 0
+
+        # Mismos contadores que Pipeline.stats, más stalls estructurales.
+        self.stats = {
+            "instructions": 0,
+            "stalls": 0,
+            "data_stalls": 0,      # Ciclos sin despachar nada por operandos pendientes
+            "branch_stalls": 0,
+            "structural_stalls": 0,
+            "flushes": 0,
+        }
+
+    # ----------------------------------------------------------------------
+    # Utilidades internas
+    # ----------------------------------------------------------------------
+
+    def _reg_index(self, name: str) -> int:
+        return int(name[1:])
+
+    def _read_operand(self, name):
+        """
+        Lee un operando en la emisión: (valor, productor pendiente o None).
+        """
+        idx = self._reg_index(name)
+        producer = self.rat[idx]
+        if producer is None:
+            return self.registers[idx], None
+        if producer.done:
+            return producer.value, None
+        return 0, producer
+
+    def _alu(self, op, a, b, imm):
+        return execute(op, a, imm if op == "ADDI" else b)
+
+    # ----------------------------------------------------------------------
+    # Ejecución de un ciclo
+    # ----------------------------------------------------------------------
+
+    def step(self):
+        """
+        Ejecuta un ciclo de reloj: commit, difusión (CDB), ejecución, emisión y búsqueda.
+
+        Retorna:
+            dict o None: Información del ciclo. 'stall' es True si no se pudo
+            emitir ninguna instrucción quedando programa por ejecutar.
+        """
+        if self.finished:
+            return None
+
+        self.cycle += 1
+        for stage in self.pipeline:
+            self.pipeline[stage] = None
+
+        self._commit()
+        self._broadcast()
+        data_stall = self._execute()
+        stall_reason = self._issue()
+        self._fetch()
+
+        if (not self.rob and self.fetch_slot is None
+                and self.pc >= len(self.instruction_memory)):
+            self.finished = True
+            return None
+
+        info = {"stall": stall_reason is not None, "forwardA": "NO", "forwardB": "NO"}
+        if stall_reason:
+            info["stall_reason"] = stall_reason
+            if stall_reason == "branch":
+                self.stats["branch_stalls"] += 1
+            else:
+                self.stats["structural_stalls"] += 1
+        if data_stall:
+            self.stats["data_stalls"] += 1
+        if stall_reason or data_stall:
+            self.stats["stalls"] += 1
+        return info
+
+    # ------------------------------------------------------------------
+    # Commit en orden
+    # ------------------------------------------------------------------
+
+    def _commit(self):
+        if not self.rob or not self.rob[0].done:
+            return
+
+        entry = self.rob.pop(0)
+        self.pipeline["WB"] = entry.instr
+        self.stats["instructions"] += 1
+
+        if entry.op == "SW":
+            entry.instr["addr"] = entry.address
+            entry.instr["store_value"] = entry.value
+            if 0 <= entry.address < len(self.memory):
+                self.memory[entry.address] = entry.value
+                self.last_mem_write = entry.address
+            self.lsq.remove(entry)
+        elif entry.op == "LW":
+            self.lsq.remove(entry)
+
+        if entry.rd:
+            self.registers[entry.rd] = entry.value
+            if self.rat[entry.rd] is entry:
+                self.rat[entry.rd] = None
+        self.registers[0] = 0
+
+    # ------------------------------------------------------------------
+    # Difusión de resultados por el bus común (CDB)
+    # ------------------------------------------------------------------
+
+    def _broadcast(self):
+        finished = [e for e in self.rob
+                    if e.started and not e.done and e.finish_cycle <= self.cycle]
+        for entry in finished[:self.cdb_width]:
+            entry.done = True
+            for waiting in self.rob:
+                if waiting.qj is entry:
+                    waiting.vj, waiting.qj = entry.value, None
+                if waiting.qk is entry:
+                    waiting.vk, waiting.qk = entry.value, None
+            if entry.fu in self.rs and entry in self.rs[entry.fu]:
+                self.rs[entry.fu].remove(entry)
+            if entry.fu == "BRANCH":
+                self._resolve_branch(entry)
+
+    def _resolve_branch(self, entry):
+        target = entry.instr["pc"] + entry.instr.get("imm", 0)
+        if not 0 <= target < len(self.instruction_memory):
+            target = len(self.instruction_memory)
+
+        if self.pending_branch is entry:
+            # Sin predicción: la búsqueda estaba detenida esperando este salto.
+            self.pending_branch = None
+            self.pc = target if entry.taken else entry.instr["pc"] + 1
+        elif entry.taken:
+            # Predicción "no tomado" fallida: descartar lo más joven.
+            self._squash_after(entry)
+            self.pc = target
+
+    def _squash_after(self, entry):
+        index = self.rob.index(entry)
+        for younger in self.rob[index + 1:]:
+            younger.squashed = True
+        self.rob = self.rob[:index + 1]
+        self.stats["flushes"] += 1
+        self.lsq = [e for e in self.lsq if not e.squashed]
+        for fu in self.rs:
+            self.rs[fu] = [e for e in self.rs[fu] if not e.squashed]
+        self.fetch_slot = None
+
+        # Reconstruir la RAT con las entradas que sobreviven.
+        self.rat = [None] * 32
+        for survivor in self.rob:
+            if survivor.rd:
+                self.rat[survivor.rd] = survivor
+
+    # ------------------------------------------------------------------
+    # Ejecución en las unidades funcionales
+    # ------------------------------------------------------------------
+
+    def _execute(self):
+        """
+        Despacha a las unidades libres las entradas con sus operandos listos.
+
+        Retorna:
+            bool: True si no se despachó nada y alguna entrada esperaba un
+            operando (o un store anterior, si es un load): stall de datos.
+        """
+        busy = {fu: 0 for fu in self.units}
+        for entry in self.rob:
+            if entry.started and not entry.done:
+                busy[entry.fu] += 1
+
+        dispatched = waiting = False
+        for entry in self.rob:
+            if entry.started:
+                continue
+            if entry.qj is not None or entry.qk is not None:
+                waiting = True
+                continue
+            if busy[entry.fu] >= self.units[entry.fu]:
+                continue
+            if entry.fu == "LOAD" and not self._load_ready(entry):
+                waiting = True
+                continue
+
+            self._start(entry)
+            busy[entry.fu] += 1
+            dispatched = True
+        return waiting and not dispatched
+
+    def _start(self, entry):
+        instr = entry.instr
+        op = entry.op
+        entry.started = True
+        entry.finish_cycle = self.cycle + self.latencies[entry.fu]
+
+        if entry.fu in ("ALU", "MUL"):
+            entry.value = self._alu(op, entry.vj, entry.vk, instr.get("imm", 0))
+            self.pipeline["EX"] = self.pipeline["EX"] or instr
+        elif op == "LW":
+            entry.value = self._load_value(entry)
+            self.pipeline["MEM"] = instr
+        elif op == "SW":
+            entry.address = entry.vj + instr["imm"]
+            entry.value = entry.vk
+            self.pipeline["MEM"] = instr
+        elif entry.fu == "BRANCH":
+            entry.taken = (entry.vj == entry.vk) if op == "BEQ" else (entry.vj != entry.vk)
+            self.pipeline["EX"] = self.pipeline["EX"] or instr
+
+    def _load_ready(self, entry):
+        """
+        Un load puede ejecutarse si ningún store anterior tiene dirección
+        desconocida o, si coincide la dirección, el dato ya está listo.
+        """
+        entry.address = entry.vj + entry.instr["imm"]
+        for older in self.lsq:
+            if older is entry:
+                break
+            if older.op != "SW":
+                continue
+            if older.address is None:
+                if older.qj is not None:
+                    return False
+                older.address = older.vj + older.instr["imm"]
+            if older.address == entry.address and older.qk is not None:
+                return False
+        return True
+
+    def _load_value(self, entry):
+        # Reenvío desde el store anterior más joven con la misma dirección.
+        value = None
+        for older in self.lsq:
+            if older is entry:
+                break
+            if older.op == "SW" and older.address == entry.address:
+                value = older.vk
+        if value is not None:
+            return value
+        if 0 <= entry.address < len(self.memory):
+            return self.memory[entry.address]
+        return 0
+
+    # ------------------------------------------------------------------
+    # Emisión (issue) con renombrado
+    # ------------------------------------------------------------------
+
+    def _issue(self):
+        """
+        Emite la instrucción del slot de búsqueda. Retorna el motivo del
+        stall o None si se emitió (o ya no queda programa).
+        """
+        instr = self.fetch_slot
+        if instr is None:
+            if self.pending_branch is not None:
+                return "branch"
+            return None
+
+        fu = FU_CLASS[instr["op"]]
+        if len(self.rob) >= self.rob_size:
+            return "rob_full"
+        if fu in ("LOAD", "STORE"):
+            if len(self.lsq) >= self.lsq_size:
+                return "lsq_full"
+        elif len(self.rs[fu]) >= self.rs_sizes[fu]:
+            return "rs_full"
+
+        entry = ROBEntry(self._next_id, instr)
+        self._next_id += 1
+
+        if instr.get("rs1"):
+            entry.vj, entry.qj = self._read_operand(instr["rs1"])
+        if instr.get("rs2"):
+            entry.vk, entry.qk = self._read_operand(instr["rs2"])
+
+        self.rob.append(entry)
+        if fu in ("LOAD", "STORE"):
+            self.lsq.append(entry)
+        else:
+            self.rs[fu].append(entry)
+
+        if entry.rd:
+            self.rat[entry.rd] = entry
+        if fu == "BRANCH" and not self.hazard_unit.enable_branch_prediction:
+            self.pending_branch = entry
+
+        self.pipeline["ID"] = instr
+        self.fetch_slot = None
+        return None
+
+    # ------------------------------------------------------------------
+    # Búsqueda (fetch)
+    # ------------------------------------------------------------------
+
+    def _fetch(self):
+        if self.fetch_slot is not None or self.pending_branch is not None:
+            self.pipeline["IF"] = self.fetch_slot
+            return
+        if self.pc < len(self.instruction_memory):
+            instr = dict(self.instruction_memory[self.pc])
+            instr["pc"] = self.pc
+            instr["seq"] = self.fetched
+            self.fetched += 1
+            self.fetch_slot = instr
+            self.pc += 1
+        self.pipeline["IF"] = self.fetch_slot
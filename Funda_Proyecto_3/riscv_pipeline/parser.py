@@ -0,0 +1,165 @@
+import re
+
+from .alu import R_TYPE_OPS
+from .vector_unit import VECTOR_ARITH_OPS, VECTOR_MEMORY_OPS
+
+"""
+Parsea una línea de código ensamblador RISC-V y la convierte
+en un diccionario estructurado con los campos relevantes.
+
+Soporta las siguientes instrucciones:
+    - R-type : ADD, SUB, AND, OR, MUL, SLT, SLTU
+    - I-type : ADDI
+    - Load   : LW  (ej. LW x1, 0(x2))
+    - Store  : SW  (ej. SW x1, 0(x2))
+    - Branch : BEQ, BNE (ej. BEQ x1, x2, -4)
+    - Vector : VSETVLI, VLE32.V, VSE32.V, VADD.VV, VMUL.VV, VREDSUM.VS
+               (ej. vsetvli x5, x10, e32 / vle32.v v1, (x11) / vadd.vv v3, v1, v2;
+               ver vector_unit)
+
+Una línea "---" separa programas: cada uno corre en su propio hilo de
+hardware (ver multithreading.MultithreadedPipeline).
+"""
+
+PROGRAM_SEPARATOR = "---"
+
+# Opciones de tipo que acepta VSETVLI (solo SEW = 32 y LMUL = 1).
+VTYPE_OPTIONS = ("e32", "m1", "ta", "tu", "ma", "mu")
+
+
+def parse_riscv_line(line):
+    line = line.split("#", 1)[0].strip()
+    if not line:
+        return None  # Ignorar líneas vacías o comentarios.
+
+    # Quitar comas y separar por espacios.
+    tokens = line.replace(",", "").split()
+    op = tokens[0].upper()
+
+    # Instrucciones tipo R (formato: op rd, rs1, rs2).
+    if op in R_TYPE_OPS:
+        return {"op": op, "rd": tokens[1], "rs1": tokens[2], "rs2": tokens[3]}
+
+    # Instrucciones tipo I (formato: op rd, rs1, imm).
+    elif op in ["ADDI"]:
+        return {"op": op, "rd": tokens[1], "rs1": tokens[2], "imm": int(tokens[3])}
+
+    # Instrucción de carga tipo LW (formato: LW rd, offset(rs1)).
+    elif op == "LW":
+        rd = tokens[1]
+        match = re.match(r"(-?\d+)\((x\d+)\)", tokens[2])
+        if match:
+            imm, rs1 = int(match.group(1)), match.group(2)
+            return {"op": op, "rd": rd, "rs1": rs1, "imm": imm}
+
+    # Instrucción de almacenamiento tipo SW (formato: SW rs2, offset(rs1)).
+    elif op == "SW":
+        rs2 = tokens[1]
+        match = re.match(r"(-?\d+)\((x\d+)\)", tokens[2])
+        if match:
+            imm, rs1 = int(match.group(1)), match.group(2)
+            return {"op": op, "rs1": rs1, "rs2": rs2, "imm": imm}
+
+    # Instrucciones de salto condicional tipo BEQ/BNE (formato: BEQ rs1, rs2, imm).
+    elif op in ["BEQ", "BNE"]:
+        return {"op": op, "rs1": tokens[1], "rs2": tokens[2], "imm": int(tokens[3])}
+
+    # Configuración vectorial (formato: vsetvli rd, rs1, e32[, m1, ta, ma]).
+    elif op == "VSETVLI":
+        if all(option.lower() in VTYPE_OPTIONS for option in tokens[3:]):
+            return {"op": op, "rd": tokens[1], "rs1": tokens[2]}
+
+    # Carga/almacenamiento vectorial (formato: vle32.v vd, (rs1) / vse32.v vs3, (rs1)).
+    elif op in VECTOR_MEMORY_OPS:
+        match = re.match(r"0?\((x\d+)\)$", tokens[2])
+        if match:
+            data = "vd" if op == "VLE32.V" else "vs3"
+            return {"op": op, data: tokens[1], "rs1": match.group(1)}
+
+    # Aritmética vectorial (formato: vadd.vv vd, vs2, vs1).
+    elif op in VECTOR_ARITH_OPS:
+        return {"op": op, "vd": tokens[1], "vs2": tokens[2], "vs1": tokens[3]}
+
+    return None  # Si no se reconoce el formato, devolver None.
+
+
+def format_instruction(instr):
+    """
+    Operación inversa de parse_riscv_line: convierte el diccionario de una
+    instrucción en su texto ensamblador.
+    """
+    if "tid" in instr:
+        # Instrucción de un hilo: registros físicos (32 * tid + n) -> xn.
+        arch = {key: value for key, value in instr.items() if key != "tid"}
+        for field in ("rd", "rs1", "rs2"):
+            if field in arch:
+                arch[field] = f"x{int(arch[field][1:]) % 32}"
+        return f"T{instr['tid']} {format_instruction(arch)}"
+
+    if "head" in instr:
+        # Micro-op fusionado (ver fusion): las dos instrucciones originales.
+        return f"{format_instruction(instr['head'])} + {format_instruction(instr['tail'])}"
+
+    op = instr.get("op", "")
+    if op in R_TYPE_OPS:
+        return f"{op} {instr['rd']}, {instr['rs1']}, {instr['rs2']}"
+    elif op == "ADDI":
+        return f"{op} {instr['rd']}, {instr['rs1']}, {instr['imm']}"
+    elif op == "LW":
+        return f"{op} {instr['rd']}, {instr['imm']}({instr['rs1']})"
+    elif op == "SW":
+        return f"{op} {instr['rs2']}, {instr['imm']}({instr['rs1']})"
+    elif op in ["BEQ", "BNE"]:
+        return f"{op} {instr['rs1']}, {instr['rs2']}, {instr['imm']}"
+    elif op == "VSETVLI":
+        return f"{op} {instr['rd']}, {instr['rs1']}, e32"
+    elif op == "VLE32.V":
+        return f"{op} {instr['vd']}, ({instr['rs1']})"
+    elif op == "VSE32.V":
+        return f"{op} {instr['vs3']}, ({instr['rs1']})"
+    elif op in VECTOR_ARITH_OPS:
+        return f"{op} {instr['vd']}, {instr['vs2']}, {instr['vs1']}"
+    return op
+
+
+def parse_programs(text):
+    """
+    Separa un texto en programas (líneas "---") y parsea cada uno.
+
+    Retorna:
+        list[list[dict]]: Un programa por bloque, sin los bloques vacíos.
+    """
+    programs = [[]]
+    for line in text.splitlines():
+        if line.strip() == PROGRAM_SEPARATOR:
+            programs.append([])
+            continue
+        instr = parse_riscv_line(line)
+        if instr:
+            programs[-1].append(instr)
+    return [program for program in programs if program]
+
+
+def load_assembly_programs(path):
+    """
+    Como load_assembly_file, pero retorna un programa por bloque "---".
+    """
+    with open(path, "r") as f:
+        return parse_programs(f.read())
+
+
+def load_assembly_file(path):
+    """
+    Carga un archivo de texto que contiene instrucciones RISC-V y
+    las convierte en una lista de diccionarios estructurados.
+    """
+    with open(path, "r") as f:
+        lines = f.readlines()
+
+    instructions = []
+    for line in lines:
+        instr = parse_riscv_line(line)
+        if instr:
+            instructions.append(instr)
+
+    return instructions
@@ -0,0 +1,641 @@
+from collections import deque
+
+from .alu import R_TYPE_OPS, execute
+from .hazard_unit import HazardUnit
+from .block_translator import get_translator
+from .state import int32_array
+from .vector_unit import VECTOR_ISSUE_OPS, VECTOR_OPS, VectorUnit, has_vector_ops
+
+"""
+Clase que representa un procesador segmentado (pipeline) de 5 etapas:
+IF, ID, EX, MEM y WB.
+
+Cada slot de self.pipeline es el registro de segmentación que alimenta su
+etapa (ID = IF/ID, EX = ID/EX, MEM = EX/MEM, WB = MEM/WB) y los valores viajan
+en el registro de la instrucción: ID lee rs1/rs2 al pasar a EX, EX calcula el
+resultado eligiendo cada operando con los multiplexores de reenvío, MEM lee o
+escribe la memoria y WB escribe el resultado en el banco de registros.
+"""
+
+BRANCH_OPS = ("BEQ", "BNE")
+
+# Registros de segmentación: slot que los contiene y campos que transportan.
+LATCHES = {
+    "IF/ID": ("ID", ("pc",)),
+    "ID/EX": ("EX", ("rs1_val", "rs2_val", "imm", "forwardA", "forwardB")),
+    "EX/MEM": ("MEM", ("result", "addr", "store_value")),
+    "MEM/WB": ("WB", ("result",)),
+}
+
+
+class Pipeline:
+    """
+    Procesador segmentado básico con manejo de riesgos de datos y saltos condicionales.
+    """
+
+    def __init__(self, instruction_memory, hazard_unit=None, instruction_stream=None,
+                 memory_system=None, fusion=None, vector_unit=None):
+        """
+        Args:
+            instruction_memory (list[dict]): Lista de instrucciones a ejecutar.
+            hazard_unit (HazardUnit, optional): Unidad de riesgos.
+            instruction_stream (iterable[dict], optional): Flujo dinámico de
+                instrucciones (p. ej. trace.TraceReader). Si se indica, IF toma
+                las instrucciones del flujo en lugar de indexar por pc, y los
+                saltos usan el resultado ya resuelto en cada registro ('taken').
+            memory_system (MemorySystem, optional): Modelo de tiempo de la
+                memoria principal. Sin él, MEM completa cada acceso en un ciclo.
+            fusion (FusionUnit, optional): Fusión de pares de instrucciones en ID
+                (ver fusion). No aplica en modo traza.
+            vector_unit (VectorUnit, optional): Unidad vectorial (ver
+                vector_unit). Si el programa tiene instrucciones vectoriales y
+                no se indica, se crea una con los valores por defecto.
+        """
+        self.instruction_memory = instruction_memory or []
+        self.hazard_unit = hazard_unit or HazardUnit(enable_forwarding=True)
+
+        # Modo traza: iterador + instrucciones devueltas por un flush.
+        self.instruction_stream = iter(instruction_stream) if instruction_stream is not None else None
+        self._replay = deque()
+        self._stream_done = False
+
+        self.pipeline = {
+            "IF": None,
+            "ID": None,
+            "EX": None,
+            "MEM": None,
+            "WB": None,
+        }
+
+        self.pc = 0        # Contador de programa (índice en instruction_memory)
+        self.cycle = 0     # Ciclo actual
+        self.fetched = 0   # Instrucciones buscadas (da el 'seq' de cada una)
+        self.stalled = False     # Stall que se aplicará en el PRÓXIMO ciclo
+        self.fetch_enabled = True   # False mientras se vacía el pipeline (run_functional)
+        self._functional_block = None   # Último bloque de la corrida funcional en curso
+        self.functional = False     # True si algún tramo corrió con run_functional (ciclos estimados)
+        self.finished = False
+        self.hazard_info = {}    # Última detección: selección de reenvío para ID/EX
+
+        # Estado de 32 bits con signo en buffers array('i') (ver state).
+        self.memory = int32_array(64)
+        self.registers = int32_array(32)
+        self.last_mem_write = None
+
+        # Sistema de memoria: cargas en vuelo (registro -> ciclo de llegada / valor).
+        self.memory_system = memory_system
+        self.pending_loads = {}
+        self._pending_values = {}
+        self._arrived = {}       # Cargas que llegaron en este ciclo (bypass a EX)
+        if memory_system is not None:
+            memory_system.bind(self.memory)
+
+        self.fusion = fusion if instruction_stream is None else None
+
+        if vector_unit is None and has_vector_ops(self.instruction_memory):
+            vector_unit = VectorUnit()
+        self.vector_unit = vector_unit
+
+        # Contadores acumulados de la ejecución.
+        self.stats = {
+            "instructions": 0,     # Instrucciones retiradas en WB
+            "stalls": 0,           # Ciclos con stall (datos o salto)
+            "data_stalls": 0,
+            "branch_stalls": 0,
+            "flushes": 0,          # Saltos tomados que vaciaron IF/ID
+            "memory_stalls": 0,    # Ciclos con MEM congelada por el sistema de memoria
+        }
+        if self.fusion is not None:
+            self.stats["fused"] = 0    # Micro-ops fusionados retirados (2 instrucciones cada uno)
+        if self.vector_unit is not None:
+            self.stats["vector_stalls"] = 0    # Ciclos con MEM esperando a la unidad vectorial
+
+    # ----------------------------------------------------------------------
+    # Utilidades internas
+    # ----------------------------------------------------------------------
+
+    def _reg_index(self, name: str) -> int:
+        """
+        Convierte 'x5' en 5. Asume nombres bien formados.
+        """
+        return int(name[1:])
+
+    @property
+    def latches(self):
+        """
+        Contenido de los registros de segmentación IF/ID, ID/EX, EX/MEM y MEM/WB
+        (None si el latch tiene una burbuja).
+        """
+        view = {}
+        for name, (stage, fields) in LATCHES.items():
+            instr = self.pipeline[stage]
+            if instr is None:
+                view[name] = None
+                continue
+            view[name] = {"op": instr.get("op"), "seq": instr.get("seq")}
+            view[name].update((field, instr[field]) for field in fields if field in instr)
+        return view
+
+    def _fetch_from_stream(self):
+        """
+        Siguiente instrucción del flujo dinámico (o None si se agotó).
+        """
+        if self._replay:
+            return self._replay.popleft()
+        instr = next(self.instruction_stream, None)
+        if instr is None:
+            self._stream_done = True
+        return instr
+
+    def _fetch(self):
+        """
+        Etapa IF: siguiente instrucción (del flujo dinámico o de
+        instruction_memory según el pc), o None si no queda ninguna.
+        """
+        if self.instruction_stream is not None:
+            instr = self._fetch_from_stream()
+            if instr is not None:
+                self.pc = instr.get("pc", self.pc)
+                instr["seq"] = self.fetched
+                self.fetched += 1
+            return instr
+
+        if self.pc >= len(self.instruction_memory) or not self.fetch_enabled:
+            return None
+        # Copia superficial para poder adjuntar metadatos como 'pc'
+        instr = dict(self.instruction_memory[self.pc])
+        instr["pc"] = self.pc
+        instr["seq"] = self.fetched
+        self.fetched += 1
+        self.pc += 1
+        return instr
+
+    def _detect_hazards(self):
+        """
+        Consulta la HazardUnit por la instrucción en ID.
+        """
+        return self.hazard_unit.detect_hazard(self.pipeline, self.pipeline["ID"],
+                                              self._loads_in_flight(), self.cycle)
+
+    def _branch_penalty(self, branch):
+        """
+        True si el ciclo extra de un salto sin predicción detiene ID/IF.
+        """
+        return True
+
+    def _memory_access(self, instr):
+        """
+        Envía el LW/SW de la etapa MEM al sistema de memoria.
+
+        Retorna:
+            bool: False si no se pudo aceptar (MEM se congela este ciclo).
+        """
+        ms = self.memory_system
+        if instr["op"] == "SW":
+            if not ms.can_store():
+                return False
+            ms.store(instr["addr"], instr["store_value"])
+            return True
+
+        if not ms.can_load(self.cycle):
+            return False
+        value, ready = ms.load(instr["addr"], self.cycle)
+        instr["result"] = value
+        if instr["rd"] != "x0":
+            self.pending_loads[instr["rd"]] = ready
+            self._pending_values[instr["rd"]] = value
+        return True
+
+    def _complete_loads(self):
+        """
+        Escribe en el banco de registros las cargas cuyo dato ya llegó.
+        """
+        for rd, ready in list(self.pending_loads.items()):
+            if ready <= self.cycle:
+                value = self._pending_values.pop(rd)
+                self.registers[self._reg_index(rd)] = value
+                self._arrived[rd] = value
+                del self.pending_loads[rd]
+
+    def _latch_operands(self, instr, hazard_info):
+        """
+        Paso de ID a EX: lee rs1/rs2 del banco de registros y guarda en el
+        latch ID/EX la selección de los multiplexores de reenvío.
+        """
+        for src, select in (("rs1", "forwardA"), ("rs2", "forwardB")):
+            reg = instr.get(src)
+            instr[src + "_val"] = self.registers[self._reg_index(reg)] if reg else 0
+            instr[select] = hazard_info.get(select, "NO")
+
+    @staticmethod
+    def _forwarded(producer, reg):
+        """
+        Resultado que reenvía un latch para reg: el de un micro-op fusionado
+        puede ser el de su primera instrucción (rd2).
+        """
+        if producer.get("rd") == reg or "rd2" not in producer:
+            return producer["result"]
+        return producer["result2"]
+
+    def _operand(self, instr, src, select):
+        """
+        Multiplexor de reenvío de un operando de EX.
+
+        "EX" toma el resultado del latch EX/MEM y "MEM" el del latch MEM/WB;
+        si no, el valor leído en ID, salvo que el registro sea una carga que
+        llegó de la memoria en este mismo ciclo (bypass, solo con forwarding).
+        """
+        source = instr[select]
+        reg = instr.get(src)
+        if source == "EX":
+            return self._forwarded(self.pipeline["MEM"], reg)
+        if source == "MEM":
+            return self._forwarded(self.pipeline["WB"], reg)
+        if reg in self._arrived and self.hazard_unit.enable_forwarding:
+            return self._arrived[reg]
+        return instr[src + "_val"]
+
+    def _resolve_early_branch(self, instr):
+        """
+        Comparador de saltos en ID: operandos del banco de registros (ya
+        escrito por WB en este ciclo) o reenviados desde el latch EX/MEM.
+
+        Retorna:
+            bool: True si el salto se toma.
+        """
+        if "taken" in instr:
+            return instr["taken"]
+        values = []
+        for src, select in (("rs1", "forwardA"), ("rs2", "forwardB")):
+            if self.hazard_info.get(select) == "MEM":
+                values.append(self._forwarded(self.pipeline["MEM"], instr[src]))
+            else:
+                values.append(self.registers[self._reg_index(instr[src])])
+        if instr["op"] == "BEQ":
+            return values[0] == values[1]
+        return values[0] != values[1]
+
+    def _flush_taken(self, branch, stages):
+        """
+        Salto tomado: vacía las etapas más jóvenes que el salto y redirige el PC.
+        """
+        if self.instruction_stream is not None:
+            # Las instrucciones descartadas ya son el camino correcto de la
+            # traza: se vuelven a buscar.
+            for stage in stages:
+                if self.pipeline[stage]:
+                    self._replay.appendleft(self.pipeline[stage])
+                self.pipeline[stage] = None
+            self.stats["flushes"] += 1
+            return
+
+        base_pc = branch.get("pc")
+        if base_pc is not None:
+            target_pc = base_pc + branch.get("imm", 0)
+            if 0 <= target_pc < len(self.instruction_memory):
+                self.pc = target_pc
+            else:
+                # Si la dirección cae fuera, terminamos el programa.
+                self.pc = len(self.instruction_memory)
+        for stage in stages:
+            self.pipeline[stage] = None
+        self.stats["flushes"] += 1
+
+    def _loads_in_flight(self):
+        """
+        Cargas en vuelo para la HazardUnit (registro -> ciclo de llegada).
+
+        Los LW que están en MEM o EX todavía no se enviaron a la memoria: se
+        acceden dentro de uno o dos ciclos y su dato llega, como pronto, una
+        latencia después.
+        """
+        if self.memory_system is None:
+            return None
+        waiting = self.pending_loads
+        for stage, distance in (("MEM", 1), ("EX", 2)):
+            instr = self.pipeline[stage]
+            if not instr or instr.get("op") != "LW" or instr["rd"] == "x0":
+                continue
+            if waiting is self.pending_loads:
+                waiting = dict(self.pending_loads)
+            ready = self.cycle + distance + self.memory_system.latency
+            waiting[instr["rd"]] = max(waiting.get(instr["rd"], 0), ready)
+        return waiting
+
+    def _fuse(self):
+        """
+        Decodificador con fusión: si la instrucción en ID y la recién buscada
+        forman un par, ID pasa a tener el micro-op y IF busca la siguiente.
+        """
+        head, tail = self.pipeline["ID"], self.pipeline["IF"]
+        if head is None or tail is None:
+            return
+        fused = self.fusion.fuse(head, tail)
+        if fused is not None:
+            self.pipeline["ID"] = fused
+            self.pipeline["IF"] = self._fetch()
+
+    # ----------------------------------------------------------------------
+    # Modo funcional (traducción por bloques)
+    # ----------------------------------------------------------------------
+
+    def run_functional(self, max_blocks=1_000_000):
+        """
+        Ejecuta el resto del programa con el motor de bloques traducidos.
+
+        No simula las etapas: deja registros y memoria en su estado final y
+        usa el costo estimado por bloque para ciclos y stalls. Si la corrida
+        detallada ya empezó, primero se vacía el pipeline (ver _drain) y los
+        bloques siguen desde el pc de la siguiente instrucción sin buscar.
+
+        Retorna:
+            dict o None: Estadísticas de BlockTranslator.run (None si el
+            programa ya terminó).
+        """
+        if self.finished:
+            return None
+        if self.vector_unit is not None:
+            raise ValueError("El modo funcional no soporta instrucciones vectoriales.")
+        # Llenado del pipeline solo al empezar desde cero: después de vaciarlo
+        # (o al continuar una corrida funcional) las instrucciones siguientes
+        # se solapan con las anteriores.
+        fill = self.cycle == 0
+        if self._drain():
+            self._functional_block = None
+        if self.finished:
+            return None
+
+        translator = get_translator(self.instruction_memory, len(self.memory))
+        stats = translator.run(self.registers, self.memory, self.hazard_unit,
+                               pc=self.pc, max_blocks=max_blocks, fill=fill,
+                               pred=self._functional_block)
+        self._functional_block = stats["last_block"]
+        self.functional = True
+
+        self.pc = stats["pc"]
+        self.cycle += stats["cycles"]
+        for key in ("instructions", "stalls", "data_stalls", "branch_stalls", "flushes"):
+            self.stats[key] += stats[key]
+        self.finished = stats["finished"]
+        self.stalled = False
+        self.hazard_info = {}
+        return stats
+
+    def _drain(self):
+        """
+        Deja de buscar y avanza ciclos detallados hasta que las instrucciones
+        ya buscadas (y las cargas en vuelo) terminen.
+
+        Retorna:
+            bool: True si había algo en vuelo.
+        """
+        memory_pending = self.memory_system is not None and (
+            self.pending_loads or not self.memory_system.idle(self.cycle))
+        if all(stage is None for stage in self.pipeline.values()) and not memory_pending:
+            return False
+        self.fetch_enabled = False
+        try:
+            # Pipeline.step directo: sin los envoltorios de breakpoints o avance rápido.
+            while not self.finished:
+                Pipeline.step(self)
+        finally:
+            self.fetch_enabled = True
+        self.finished = self.pc >= len(self.instruction_memory)
+        return True
+
+    # ----------------------------------------------------------------------
+    # Ejecución de un ciclo
+    # ----------------------------------------------------------------------
+
+    def step(self):
+        """
+        Ejecuta un ciclo de reloj del pipeline.
+
+        Retorna:
+            dict o None: Información de hazard para este ciclo (stall, forwarding).
+        """
+        if self.finished:
+            return None
+
+        self.cycle += 1
+
+        # Stall del ciclo anterior: afecta cómo avanza el pipeline ahora
+        stall_prev = self.stalled
+
+        # ------------------------------------------------------------------
+        # Etapa WB: escribir en registros el resultado del latch MEM/WB
+        # ------------------------------------------------------------------
+        if self._arrived:
+            self._arrived = {}
+        if self.pending_loads:
+            self._complete_loads()
+
+        if self.pipeline["WB"]:
+            instr = self.pipeline["WB"]
+            if "result" in instr and instr["rd"] != "x0":
+                # Con sistema de memoria el LW se escribe al llegar (_complete_loads).
+                if instr["op"] != "LW" or self.memory_system is None:
+                    self.registers[self._reg_index(instr["rd"])] = instr["result"]
+            self.stats["instructions"] += 1
+            if "rd2" in instr:
+                # Micro-op fusionado: también retira su primera instrucción
+                # (si ambas escriben el mismo registro, manda la segunda).
+                if instr["rd2"] != instr.get("rd"):
+                    self.registers[self._reg_index(instr["rd2"])] = instr["result2"]
+                self.stats["instructions"] += 1
+                self.stats["fused"] += 1
+
+        # ------------------------------------------------------------------
+        # Etapa MEM: accesos a memoria
+        # ------------------------------------------------------------------
+        if self.pipeline["MEM"]:
+            instr = self.pipeline["MEM"]
+            op = instr.get("op")
+
+            if self.vector_unit is not None and op in VECTOR_ISSUE_OPS:
+                if not self.vector_unit.issue(instr, self.cycle, self.memory, self.memory_system):
+                    return self._memory_freeze("vector")
+
+            elif self.memory_system is not None:
+                if op in ["LW", "SW"] and not self._memory_access(instr):
+                    return self._memory_freeze()
+
+            elif op == "SW":
+                addr = instr["addr"]
+                if 0 <= addr < len(self.memory):
+                    self.memory[addr] = instr["store_value"]
+                    self.last_mem_write = addr
+
+            elif op == "LW":
+                addr = instr["addr"]
+                instr["result"] = self.memory[addr] if 0 <= addr < len(self.memory) else 0
+
+        if self.memory_system is not None:
+            self.memory_system.tick(self.cycle)
+            self.last_mem_write = self.memory_system.last_write
+
+        # ------------------------------------------------------------------
+        # Etapa EX: ALU con operandos reenviados, dirección de LW/SW y
+        # resolución de saltos (BEQ/BNE) + cálculo de penalización
+        # ------------------------------------------------------------------
+        ex_instr = self.pipeline["EX"]
+        penalty_branch = None  # salto que paga 1 ciclo extra si NO hay predicción
+
+        if ex_instr:
+            op = ex_instr.get("op")
+            a = self._operand(ex_instr, "rs1", "forwardA")
+            b = self._operand(ex_instr, "rs2", "forwardB")
+            taken = None
+
+            if "head" in ex_instr:
+                # Micro-op fusionado: ALU de la primera instrucción y, con su
+                # resultado, dirección/dato del LW/SW o comparación del salto.
+                taken = self.fusion.execute(ex_instr, a, b)
+
+            elif op in R_TYPE_OPS:
+                ex_instr["result"] = execute(op, a, b)
+
+            elif op == "ADDI":
+                ex_instr["result"] = execute(op, a, ex_instr["imm"])
+
+            elif op in ("LW", "SW"):
+                # Modo traza: la dirección ya viene en el registro.
+                if "addr" not in ex_instr:
+                    ex_instr["addr"] = a + ex_instr["imm"]
+                if op == "SW":
+                    ex_instr["store_value"] = b
+
+            elif op in BRANCH_OPS and not ex_instr.get("resolved"):
+                if "taken" in ex_instr:
+                    # Modo traza: el resultado del salto ya viene resuelto.
+                    taken = ex_instr["taken"]
+                elif op == "BEQ":
+                    taken = (a == b)
+                else:
+                    taken = (a != b)
+
+            elif op in VECTOR_OPS:
+                # Parte escalar: vl (VSETVLI) o vl + dirección base (VLE32/VSE32).
+                self.vector_unit.execute(ex_instr, a)
+
+            if taken is not None:
+                if taken:
+                    # Flush de IF e ID: penalización de salto tomado (el destino
+                    # es relativo al salto, la segunda instrucción si está fusionado).
+                    self._flush_taken(ex_instr.get("tail", ex_instr), ("IF", "ID"))
+
+                # Si NO hay predicción de saltos, cada branch (tomado o no) paga 1 ciclo extra
+                if not self.hazard_unit.enable_branch_prediction:
+                    penalty_branch = ex_instr
+
+        # ------------------------------------------------------------------
+        # Etapa ID: comparador de saltos (solo con early_branch_resolution).
+        # El salto se resuelve en el ciclo en que pasa a EX y solo se
+        # descarta la instrucción que está en IF.
+        # ------------------------------------------------------------------
+        id_instr = self.pipeline["ID"]
+        if (not stall_prev and id_instr and self.hazard_unit.early_branch_resolution
+                and id_instr.get("op") in BRANCH_OPS and "head" not in id_instr):
+            if self._resolve_early_branch(id_instr):
+                self._flush_taken(id_instr, ("IF",))
+            id_instr["resolved"] = True
+            if not self.hazard_unit.enable_branch_prediction:
+                penalty_branch = id_instr
+
+        # ------------------------------------------------------------------
+        # Avance del pipeline (usando stall_prev)
+        # ------------------------------------------------------------------
+        self.pipeline["WB"] = self.pipeline["MEM"]
+        self.pipeline["MEM"] = self.pipeline["EX"]
+
+        if not stall_prev:
+            # Avanza normalmente: ID lee el banco de registros hacia ID/EX
+            if id_instr is not None:
+                self._latch_operands(id_instr, self.hazard_info)
+            self.pipeline["EX"] = id_instr
+            self.pipeline["ID"] = self.pipeline["IF"]
+        else:
+            # Insertar burbuja en EX y mantener ID/IF (la instrucción en ID se reevalúa)
+            self.pipeline["EX"] = None
+            # NO fijamos aquí self.stalled; se recalcula al final del ciclo
+
+        # ------------------------------------------------------------------
+        # Etapa IF: traer nueva instrucción solo si NO hubo stall previo
+        # ------------------------------------------------------------------
+        if not stall_prev:
+            self.pipeline["IF"] = self._fetch()
+            if self.fusion is not None:
+                self._fuse()
+
+        # ------------------------------------------------------------------
+        # ¿Terminó el programa?
+        # ------------------------------------------------------------------
+        stream_pending = self.instruction_stream is not None and (
+            self._replay or not self._stream_done)
+        memory_pending = self.memory_system is not None and (
+            self.pending_loads or not self.memory_system.idle(self.cycle))
+        vector_pending = self.vector_unit is not None and not self.vector_unit.idle(self.cycle)
+        if all(stage is None for stage in self.pipeline.values()) and not (
+                stream_pending or memory_pending or vector_pending):
+            self.finished = True
+            return None
+
+        # ------------------------------------------------------------------
+        # Detección de hazards de datos (load-use, RAW) en la instrucción en ID.
+        # ------------------------------------------------------------------
+        hazard_info = self._detect_hazards()
+
+        # Stall por datos (tal como lo decide la HazardUnit)
+        data_stall = hazard_info.get("stall", False)
+        branch_penalty = penalty_branch is not None and self._branch_penalty(penalty_branch)
+
+        # ------------------------------------------------------------------
+        # Integrar penalización por branch a las métricas:
+        #   - Queremos que el main, que suma cuando hazard_info["stall"] es True,
+        #     cuente también estos stalls de control.
+        # ------------------------------------------------------------------
+        if branch_penalty:
+            hazard_info["branch_stall"] = True
+            # Si ya había stall por datos, lo conservamos; si no, lo marcamos.
+            hazard_info["stall"] = True or data_stall
+
+        # Stall global que se usará en el PRÓXIMO ciclo
+        self.hazard_info = hazard_info
+        self.stalled = bool(hazard_info.get("stall", False))
+        if self.stalled:
+            self.stats["stalls"] += 1
+            if data_stall:
+                self.stats["data_stalls"] += 1
+            if branch_penalty:
+                self.stats["branch_stalls"] += 1
+
+        return hazard_info
+
+    def _memory_freeze(self, reason="memory"):
+        """
+        Ciclo en que el sistema de memoria (o la unidad vectorial, con reason
+        "vector") no acepta la instrucción de MEM: EX, ID e IF se mantienen
+        (EX no se vuelve a ejecutar) y WB recibe una burbuja.
+        """
+        self.pipeline["WB"] = None
+        if self.memory_system is not None:
+            self.memory_system.tick(self.cycle)
+            self.last_mem_write = self.memory_system.last_write
+
+        # El productor que iba a reenviarse desde MEM/WB ya escribió el banco
+        # de registros: la instrucción retenida en EX vuelve a leerlo. El
+        # reenvío desde EX/MEM se mantiene (un micro-op fusionado retenido en
+        # MEM puede producir rd2).
+        ex_instr = self.pipeline["EX"]
+        if ex_instr is not None:
+            self._latch_operands(ex_instr, {select: "EX" for select in ("forwardA", "forwardB")
+                                            if ex_instr[select] == "EX"})
+
+        hazard_info = self._detect_hazards()
+        self.hazard_info = hazard_info
+        self.stalled = hazard_info["stall"]
+        hazard_info["stall"] = True
+        hazard_info[f"{reason}_stall"] = True
+        self.stats["stalls"] += 1
+        self.stats[f"{reason}_stalls"] += 1
+        return hazard_info
@@ -0,0 +1,209 @@
+from .parser import format_instruction
+
+"""
+Diagrama de tiempo del pipeline (instrucción x ciclo, estilo Gantt).
+
+Se construye de forma incremental a partir del estado de Pipeline después de
+cada step: cada instrucción dinámica (identificada por su 'seq') es una fila y
+cada ciclo una columna, con la etapa en la que estaba (IF/ID/EX/MEM/WB), STALL
+si quedó retenida en la misma etapa o FLUSH si fue descartada por un salto.
+Con fusión (ver fusion) la fila de la primera instrucción pasa a mostrar el
+par y la segunda termina con FUSED en el ciclo en que se fusionó.
+
+Las celdas de cada fila se guardan en un bytearray desde el ciclo en que la
+instrucción entró, así que el costo en memoria es de pocos bytes por ciclo.
+"""
+
+EMPTY, IF, ID, EX, MEM, WB, STALL, FLUSH, FUSED = range(9)
+
+STAGE_CODES = {"IF": IF, "ID": ID, "EX": EX, "MEM": MEM, "WB": WB}
+CODE_LABELS = {IF: "IF", ID: "ID", EX: "EX", MEM: "MEM", WB: "WB", STALL: "stall", FLUSH: "flush",
+               FUSED: "fused"}
+
+# Colores por código de celda (compartidos con render_pipeline_diagram).
+CODE_COLORS = {
+    IF: (90, 140, 220),
+    ID: (90, 190, 200),
+    EX: (110, 200, 110),
+    MEM: (220, 190, 80),
+    WB: (200, 120, 200),
+    STALL: (220, 80, 80),
+    FLUSH: (120, 120, 120),
+    FUSED: (150, 150, 220),
+}
+
+
+class DiagramRow:
+    """
+    Fila del diagrama: una instrucción dinámica.
+    """
+
+    __slots__ = ("seq", "pc", "label", "start_cycle", "cells")
+
+    def __init__(self, seq, pc, label, start_cycle):
+        self.seq = seq
+        self.pc = pc
+        self.label = label
+        self.start_cycle = start_cycle
+        self.cells = bytearray()
+
+    @property
+    def end_cycle(self):
+        return self.start_cycle + len(self.cells)
+
+    def set(self, cycle, code):
+        index = cycle - self.start_cycle
+        if index >= len(self.cells):
+            self.cells.extend(bytes(index - len(self.cells) + 1))
+        self.cells[index] = code
+
+    def get(self, cycle):
+        index = cycle - self.start_cycle
+        if 0 <= index < len(self.cells):
+            return self.cells[index]
+        return EMPTY
+
+
+class PipelineDiagram:
+    """
+    Acumula el diagrama de tiempo de un procesador.
+    """
+
+    def __init__(self):
+        self.rows = []
+        self.last_cycle = 0
+        self._rows_by_seq = {}     # Solo instrucciones en vuelo
+        self._stage_of = {}        # seq -> etapa del ciclo anterior
+        self._fused = set()        # seq de los micro-ops fusionados ya registrados
+
+    def __len__(self):
+        return len(self.rows)
+
+    def record(self, pipeline_dict, cycle):
+        """
+        Agrega la columna del ciclo 'cycle' a partir del estado de las etapas.
+
+        Args:
+            pipeline_dict (dict): Pipeline.pipeline después de step().
+            cycle (int): Ciclo recién ejecutado (Pipeline.cycle).
+        """
+        current = {}
+        fused_tails = set()
+        for stage, instr in pipeline_dict.items():
+            if not instr or "seq" not in instr:
+                continue
+            seq = instr["seq"]
+            row = self._rows_by_seq.get(seq)
+            if row is None:
+                row = DiagramRow(seq, instr.get("pc"), format_instruction(instr), cycle)
+                self._rows_by_seq[seq] = row
+                self.rows.append(row)
+            if "head" in instr and seq not in self._fused:
+                self._fused.add(seq)
+                fused_tails.add(self._record_fusion(row, instr, cycle))
+
+            code = STAGE_CODES[stage]
+            if self._stage_of.get(seq) == stage:
+                code = STALL
+            row.set(cycle, code)
+            current[seq] = stage
+
+        # Instrucciones que desaparecieron: retiradas (venían de WB) o descartadas.
+        for seq, stage in self._stage_of.items():
+            if seq in current:
+                continue
+            row = self._rows_by_seq.pop(seq)
+            self._fused.discard(seq)
+            if seq in fused_tails:
+                row.set(cycle, FUSED)
+            elif stage != "WB":
+                row.set(cycle, FLUSH)
+
+        self._stage_of = current
+        self.last_cycle = max(self.last_cycle, cycle)
+
+    def _record_fusion(self, row, instr, cycle):
+        """
+        Micro-op fusionado visto por primera vez: la fila de la primera
+        instrucción pasa a mostrar el par y la segunda, si no tenía fila
+        (se buscó y se fusionó en el mismo ciclo), recibe una con FUSED.
+
+        Retorna:
+            int: seq de la segunda instrucción.
+        """
+        head, tail = instr["head"], instr["tail"]
+        row.label = f"{format_instruction(head)} + {format_instruction(tail)}"
+        seq = tail["seq"]
+        if seq not in self._rows_by_seq:
+            tail_row = DiagramRow(seq, tail.get("pc"), format_instruction(tail), cycle)
+            tail_row.set(cycle, FUSED)
+            # Antes de la instrucción que IF buscó en ese mismo ciclo (orden de seq).
+            index = len(self.rows)
+            while index and self.rows[index - 1].seq > seq:
+                index -= 1
+            self.rows.insert(index, tail_row)
+        return seq
+
+    def visible_rows(self, first_row, count):
+        """
+        Filas [first_row, first_row + count) sin recorrer el resto.
+        """
+        first_row = max(0, first_row)
+        return self.rows[first_row:first_row + count]
+
+
+# ----------------------------------------------------------------------
+# Exportación
+# ----------------------------------------------------------------------
+
+SVG_CELL_W = 36
+SVG_CELL_H = 16
+SVG_LABEL_W = 180
+
+
+def _window(diagram, first_row, max_rows, first_cycle, max_cycles):
+    rows = diagram.visible_rows(first_row, max_rows if max_rows else len(diagram.rows))
+    if max_cycles is None:
+        last = max((row.end_cycle for row in rows), default=first_cycle)
+        max_cycles = max(0, last - first_cycle)
+    return rows, max_cycles
+
+
+def export_svg(diagram, path, first_row=0, max_rows=500, first_cycle=1, max_cycles=None):
+    """
+    Exporta una ventana del diagrama a SVG (sin dependencias externas).
+    """
+    rows, max_cycles = _window(diagram, first_row, max_rows, first_cycle, max_cycles)
+    width = SVG_LABEL_W + max_cycles * SVG_CELL_W
+    height = (len(rows) + 1) * SVG_CELL_H
+
+    def color(code):
+        r, g, b = CODE_COLORS[code]
+        return f"rgb({r},{g},{b})"
+
+    with open(path, "w") as f:
+        f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+                f'font-family="monospace" font-size="10">\n')
+        f.write(f'<rect width="{width}" height="{height}" fill="rgb(30,30,30)"/>\n')
+
+        for col in range(max_cycles):
+            x = SVG_LABEL_W + col * SVG_CELL_W
+            f.write(f'<text x="{x + 4}" y="{SVG_CELL_H - 4}" fill="white">{first_cycle + col}</text>\n')
+
+        for i, row in enumerate(rows):
+            y = (i + 1) * SVG_CELL_H
+            f.write(f'<text x="4" y="{y + SVG_CELL_H - 4}" fill="white">'
+                    f'{row.seq}: {row.label}</text>\n')
+            start = max(row.start_cycle, first_cycle)
+            end = min(row.end_cycle, first_cycle + max_cycles)
+            for cycle in range(start, end):
+                code = row.get(cycle)
+                if code == EMPTY:
+                    continue
+                x = SVG_LABEL_W + (cycle - first_cycle) * SVG_CELL_W
+                f.write(f'<rect x="{x}" y="{y}" width="{SVG_CELL_W - 1}" height="{SVG_CELL_H - 1}" '
+                        f'fill="{color(code)}"/>')
+                f.write(f'<text x="{x + 3}" y="{y + SVG_CELL_H - 4}" fill="black">'
+                        f'{CODE_LABELS[code]}</text>\n')
+
+        f.write("</svg>\n")
@@ -0,0 +1,168 @@
+from .fusion import FusionUnit
+from .hazard_unit import HazardUnit
+from .memory_system import MemorySystem
+from .multithreading import MultithreadedPipeline
+from .ooo_core import OutOfOrderCore
+from .pipeline import Pipeline
+
+"""
+Construcción de procesadores a partir de la clave de configuración que usan la
+interfaz, el runner sin interfaz y las pruebas diferenciales.
+"""
+
+MODE_KEYS = list(HazardUnit.MODES) + ["ooo"]
+
+
+def create_processor(mode_key, program, memory_system=None, early_branch=False, fusion=None,
+                     vector_unit=None):
+    """
+    Crea el procesador de la configuración elegida: Pipeline en orden o
+    el núcleo fuera de orden (que siempre reenvía y predice "no tomado").
+
+    memory_system (MemorySystem), early_branch (saltos resueltos en ID),
+    fusion (FusionUnit) y vector_unit (VectorUnit) solo aplican a Pipeline;
+    el núcleo fuera de orden modela la memoria con su propia cola de
+    cargas/escrituras y no tiene extensión vectorial.
+    """
+    if mode_key == "ooo":
+        return OutOfOrderCore(program, HazardUnit(True, True))
+    return Pipeline(program, HazardUnit.from_mode(mode_key, early_branch),
+                    memory_system=memory_system, fusion=fusion, vector_unit=vector_unit)
+
+
+def create_multithreaded(mode_key, programs, fetch_policy="round_robin", memory_system=None,
+                         early_branch=False):
+    """
+    Crea un Pipeline multihilo con un hilo de hardware por programa.
+    """
+    if mode_key == "ooo":
+        raise ValueError("El núcleo fuera de orden no soporta varios hilos.")
+    return MultithreadedPipeline(programs, HazardUnit.from_mode(mode_key, early_branch),
+                                 fetch_policy, memory_system)
+
+
+class ProcessorGroup:
+    """
+    Varios procesadores, uno por configuración, ejecutando el mismo programa.
+
+    El programa se decodifica una sola vez y todos los núcleos comparten la
+    misma tupla de instrucciones (de solo lectura: cada núcleo copia la
+    instrucción al buscarla). step() avanza un ciclo a todos los que no han
+    terminado en una sola llamada.
+
+    Args:
+        mode_keys (list[str]): Configuración de cada procesador (ver MODE_KEYS).
+        programs (list[list[dict]]): Programas ya parseados; con más de uno,
+            cada procesador es un pipeline multihilo (un hilo por programa).
+        memory_model (bool): Un MemorySystem propio por procesador.
+        early_branch (bool): Saltos resueltos en ID.
+        fetch_policy (str): Política de búsqueda con varios hilos.
+        fusion_pairs (tuple[str], optional): Fusión de macro-ops (ver fusion) en
+            los Pipeline en orden con un solo programa.
+    """
+
+    def __init__(self, mode_keys, programs, memory_model=False, early_branch=False,
+                 fetch_policy="round_robin", fusion_pairs=None):
+        self.mode_keys = list(mode_keys)
+        self.programs = [tuple(program) for program in programs]
+        self.program = tuple(instr for program in self.programs for instr in program)
+        self.processors = []
+        for mode_key in self.mode_keys:
+            memory_system = MemorySystem() if memory_model else None
+            if len(self.programs) > 1:
+                proc = create_multithreaded(mode_key, self.programs, fetch_policy, memory_system,
+                                            early_branch)
+            else:
+                fusion = FusionUnit(fusion_pairs) if fusion_pairs and mode_key != "ooo" else None
+                proc = create_processor(mode_key, self.program, memory_system, early_branch, fusion)
+            self.processors.append(proc)
+        self._active = [proc for proc in self.processors if not proc.finished]
+
+    def __len__(self):
+        return len(self.processors)
+
+    def __iter__(self):
+        return iter(self.processors)
+
+    @property
+    def finished(self):
+        return not self._active
+
+    def step(self):
+        """
+        Avanza un ciclo todos los procesadores activos.
+
+        Retorna:
+            int: Procesadores que siguen activos.
+        """
+        active = self._active
+        done = False
+        for proc in active:
+            proc.step()
+            done = done or proc.finished
+        if done:
+            self._active = [proc for proc in active if not proc.finished]
+        return len(self._active)
+
+    def run(self, max_cycles=1_000_000):
+        """
+        Avanza hasta que todos terminen o lleguen a max_cycles. Un procesador
+        que llega al límite deja de avanzar aunque los demás sigan (y sigue
+        activo: no terminó).
+        """
+        while True:
+            pending = [proc for proc in self._active if proc.cycle < max_cycles]
+            if not pending:
+                return
+            for proc in pending:
+                proc.step()
+            self._active = [proc for proc in self._active if not proc.finished]
+
+    def refresh(self):
+        """
+        Recalcula los activos (después de avanzar procesadores por fuera de step()).
+        """
+        self._active = [proc for proc in self.processors if not proc.finished]
+
+    def results(self):
+        return [processor_result(proc, mode_key)
+                for proc, mode_key in zip(self.processors, self.mode_keys)]
+
+
+def processor_result(proc, mode_key):
+    """
+    Configuración y contadores de un procesador (historial y reportes). Los
+    parámetros de lo que el procesador no usa quedan en 0 o "" (ver
+    results_store.CONFIG_COLUMNS).
+    """
+    memory_system = getattr(proc, "memory_system", None)
+    fusion = getattr(proc, "fusion", None)
+    vector_unit = getattr(proc, "vector_unit", None)
+    threaded = isinstance(proc, MultithreadedPipeline)
+    result = {
+        "config": mode_key,
+        "forwarding": proc.hazard_unit.enable_forwarding,
+        "branch_prediction": proc.hazard_unit.enable_branch_prediction,
+        "early_branch": proc.hazard_unit.early_branch_resolution,
+        "memory_model": memory_system is not None,
+        "memory_latency": memory_system.latency if memory_system is not None else 0,
+        "memory_banks": memory_system.banks if memory_system is not None else 0,
+        "functional": getattr(proc, "functional", False),
+        "fast_forwarding": getattr(proc, "loop_fast_forward", None) is not None,
+        "fusion_pairs": ",".join(sorted(f"{head}+{tail}" for head, tail in fusion.pairs))
+                        if fusion is not None else "",
+        "thread_count": len(proc.threads) if threaded else 1,
+        "fetch_policy": proc.fetch_policy if threaded else "",
+        "vlen": vector_unit.vlen if vector_unit is not None else 0,
+        "lanes": vector_unit.lanes if vector_unit is not None else 0,
+        "chaining": vector_unit.chaining if vector_unit is not None else False,
+        "cycles": proc.cycle,
+    }
+    result.update(proc.stats)
+    if getattr(proc, "loop_fast_forward", None) is not None:
+        result["fast_forward"] = dict(proc.loop_fast_forward.stats)
+    if vector_unit is not None:
+        result["vector"] = dict(vector_unit.stats)
+    if threaded:
+        result["threads"] = proc.thread_results()
+    return result
@@ -0,0 +1,188 @@
+import random
+
+from .alu import R_TYPE_OPS
+from .parser import format_instruction
+from .vector_unit import VECTOR_ARITH_OPS
+
+"""
+Generador de programas aleatorios restringidos para las pruebas diferenciales.
+
+Los programas usan solo las instrucciones soportadas por el parser y se pueden
+ajustar para estresar lo que interesa del pipeline:
+    - dependency_density: probabilidad de que un operando lea uno de los
+      últimos registros escritos (riesgos RAW a distancia 1-3).
+    - load_use_rate: probabilidad de que un LW vaya seguido de una
+      instrucción que usa su resultado (riesgo de carga-uso).
+    - branch_rate: probabilidad de un salto hacia adelante.
+    - loop_rate: probabilidad de un bucle acotado con contador
+      (ADDI / cuerpo / ADDI -1 / BNE hacia atrás).
+    - vector_rate: probabilidad de una instrucción vectorial (VSETVLI,
+      VLE32/VSE32 con su base en un registro, o aritmética sobre v1..v4).
+
+Los contadores de bucle usan registros reservados que el resto del programa
+no escribe, así que todo programa generado termina.
+"""
+
+ALU_OPS = list(R_TYPE_OPS) + ["ADDI"]
+BRANCH_OPS = ["BEQ", "BNE"]
+VECTOR_REGISTERS = ["v1", "v2", "v3", "v4"]
+
+# Registros reservados para los contadores de bucle.
+LOOP_COUNTERS = ["x28", "x29", "x30", "x31"]
+
+
+class ProgramGenerator:
+    def __init__(self, seed=None, num_registers=8, memory_size=64,
+                 dependency_density=0.5, load_use_rate=0.5, branch_rate=0.1,
+                 loop_rate=0.05, max_loop_iterations=4, vector_rate=0.0):
+        """
+        Args:
+            seed: Semilla del generador (el mismo seed da el mismo programa).
+            num_registers (int): Registros de datos usados (x1..xN).
+            memory_size (int): Palabras de memoria a las que apuntan LW/SW.
+        """
+        self.rng = random.Random(seed)
+        self.registers = [f"x{i}" for i in range(1, num_registers + 1)]
+        self.memory_size = memory_size
+        self.dependency_density = dependency_density
+        self.load_use_rate = load_use_rate
+        self.branch_rate = branch_rate
+        self.loop_rate = loop_rate
+        self.max_loop_iterations = max_loop_iterations
+        self.vector_rate = vector_rate
+        self.recent = []       # Últimos registros escritos
+        self.next_counter = 0
+
+    # ----------------------------------------------------------------------
+    # Operandos
+    # ----------------------------------------------------------------------
+
+    def _dest(self):
+        rd = self.rng.choice(self.registers)
+        self.recent = (self.recent + [rd])[-3:]
+        return rd
+
+    def _source(self):
+        if self.recent and self.rng.random() < self.dependency_density:
+            return self.rng.choice(self.recent)
+        return self.rng.choice(["x0"] + self.registers)
+
+    def _imm(self):
+        return self.rng.randint(-8, 16)
+
+    def _address(self):
+        # La mayoría de accesos usan x0 como base para caer dentro de la memoria;
+        # el resto usa un registro cualquiera (fuera de rango también es válido).
+        if self.rng.random() < 0.7:
+            return "x0", self.rng.randrange(self.memory_size)
+        return self._source(), self.rng.randint(0, 8)
+
+    # ----------------------------------------------------------------------
+    # Instrucciones
+    # ----------------------------------------------------------------------
+
+    def _alu(self, src=None):
+        op = self.rng.choice(ALU_OPS)
+        rs1 = src or self._source()
+        if op == "ADDI":
+            return {"op": op, "rd": self._dest(), "rs1": rs1, "imm": self._imm()}
+        return {"op": op, "rd": self._dest(), "rs1": rs1, "rs2": self._source()}
+
+    def _load(self):
+        rs1, imm = self._address()
+        return {"op": "LW", "rd": self._dest(), "rs1": rs1, "imm": imm}
+
+    def _store(self):
+        rs1, imm = self._address()
+        return {"op": "SW", "rs1": rs1, "rs2": self._source(), "imm": imm}
+
+    def _simple(self):
+        """
+        Instrucción sin saltos; un LW puede ir seguido de su uso inmediato.
+        """
+        k = self.rng.random()
+        if k < 0.6:
+            return [self._alu()]
+        if k < 0.8:
+            load = self._load()
+            if self.rng.random() < self.load_use_rate:
+                return [load, self._alu(src=load["rd"])]
+            return [load]
+        return [self._store()]
+
+    def _vector(self):
+        """
+        Instrucción vectorial; las que usan un registro escalar (vl pedido o
+        dirección base) van precedidas del ADDI que lo carga.
+        """
+        k = self.rng.random()
+        if k < 0.25:
+            avl = self._dest()
+            rs1 = "x0" if self.rng.random() < 0.2 else avl
+            return [{"op": "ADDI", "rd": avl, "rs1": "x0", "imm": self.rng.randint(0, 6)},
+                    {"op": "VSETVLI", "rd": self._dest(), "rs1": rs1}]
+        if k < 0.6:
+            base = self._dest()
+            access = ({"op": "VLE32.V", "vd": self.rng.choice(VECTOR_REGISTERS), "rs1": base}
+                      if self.rng.random() < 0.6 else
+                      {"op": "VSE32.V", "vs3": self.rng.choice(VECTOR_REGISTERS), "rs1": base})
+            return [{"op": "ADDI", "rd": base, "rs1": "x0",
+                     "imm": self.rng.randrange(self.memory_size)}, access]
+        vd, vs2, vs1 = (self.rng.choice(VECTOR_REGISTERS) for _ in range(3))
+        return [{"op": self.rng.choice(VECTOR_ARITH_OPS), "vd": vd, "vs2": vs2, "vs1": vs1}]
+
+    def _forward_branch(self):
+        skip = self.rng.randint(1, 3)
+        branch = {"op": self.rng.choice(BRANCH_OPS), "rs1": self._source(),
+                  "rs2": self._source(), "imm": skip + 1}
+        body = []
+        while len(body) < skip:
+            body.extend(self._simple())
+        return [branch] + body[:skip]
+
+    def _loop(self):
+        counter = LOOP_COUNTERS[self.next_counter % len(LOOP_COUNTERS)]
+        self.next_counter += 1
+        body = []
+        for _ in range(self.rng.randint(1, 4)):
+            body.extend(self._simple())
+        iterations = self.rng.randint(1, self.max_loop_iterations)
+        return ([{"op": "ADDI", "rd": counter, "rs1": "x0", "imm": iterations}]
+                + body
+                + [{"op": "ADDI", "rd": counter, "rs1": counter, "imm": -1},
+                   {"op": "BNE", "rs1": counter, "rs2": "x0", "imm": -(len(body) + 1)}])
+
+    def generate(self, length=24):
+        """
+        Genera un programa de aproximadamente 'length' instrucciones.
+
+        Retorna:
+            list[dict]: Instrucciones en el mismo formato que parse_riscv_line.
+        """
+        program = []
+        self.recent = []
+        while len(program) < length:
+            k = self.rng.random()
+            if k < self.loop_rate:
+                program.extend(self._loop())
+            elif k < self.loop_rate + self.branch_rate:
+                program.extend(self._forward_branch())
+            elif k < self.loop_rate + self.branch_rate + self.vector_rate:
+                program.extend(self._vector())
+            else:
+                program.extend(self._simple())
+        return program
+
+
+def generate_program(seed, length=24, **options):
+    """
+    Atajo: genera un programa con ProgramGenerator(seed, **options).
+    """
+    return ProgramGenerator(seed, **options).generate(length)
+
+
+def program_text(program):
+    """
+    Texto ensamblador del programa (se puede pegar en el editor).
+    """
+    return "\n".join(format_instruction(instr) for instr in program)
@@ -0,0 +1,258 @@
+import hashlib
+import sqlite3
+import time
+
+from .parser import PROGRAM_SEPARATOR, format_instruction
+
+"""
+Almacén persistente de resultados de ejecución (SQLite embebido).
+
+Cada corrida guarda el hash del programa, la configuración de cada procesador
+(unidad de riesgos, resolución temprana de saltos, sistema de memoria y sus
+parámetros, modo funcional o detallado, avance rápido, pares de fusión,
+hilos y política de búsqueda, VLEN y lanes) y el conjunto completo de
+contadores. Las consultas solo comparan corridas con la misma configuración. Los índices
+permiten consultas rápidas como "mejor configuración para este programa" o
+"regresiones desde la semana pasada", y el historial se pagina desde disco en
+lugar de mantenerse en memoria.
+"""
+
+# Relativa al directorio de trabajo, igual que los diagramas exportados.
+DEFAULT_DB_PATH = "resultados.db"
+
+# Contadores que se guardan por procesador (los que un procesador no tiene quedan en 0).
+COUNTERS = ["cycles", "instructions", "stalls", "data_stalls", "branch_stalls", "flushes",
+            "memory_stalls", "structural_stalls", "fused", "vector_stalls"]
+
+# Configuración de cada procesador (ver processors.processor_result). Los
+# parámetros de lo que el procesador no usa quedan en 0 o "".
+CONFIG_COLUMNS = ["config", "forwarding", "branch_prediction", "early_branch",
+                  "memory_model", "memory_latency", "memory_banks", "functional",
+                  "fast_forwarding", "fusion_pairs", "thread_count", "fetch_policy",
+                  "vlen", "lanes", "chaining"]
+
+# Columnas que distinguen configuraciones en best_config/regressions
+# (forwarding y branch_prediction ya están implícitas en config).
+CONFIG_KEY = [column for column in CONFIG_COLUMNS
+              if column not in ("forwarding", "branch_prediction")]
+
+# Columnas agregadas después de la primera versión del esquema (bases existentes).
+MIGRATIONS = {
+    "early_branch": "INTEGER NOT NULL DEFAULT 0",
+    "memory_model": "INTEGER NOT NULL DEFAULT 0",
+    "functional": "INTEGER NOT NULL DEFAULT 0",
+    "thread_count": "INTEGER NOT NULL DEFAULT 1",
+    "memory_latency": "INTEGER NOT NULL DEFAULT 0",
+    "memory_banks": "INTEGER NOT NULL DEFAULT 0",
+    "fast_forwarding": "INTEGER NOT NULL DEFAULT 0",
+    "fusion_pairs": "TEXT NOT NULL DEFAULT ''",
+    "fetch_policy": "TEXT NOT NULL DEFAULT ''",
+    "vlen": "INTEGER NOT NULL DEFAULT 0",
+    "lanes": "INTEGER NOT NULL DEFAULT 0",
+    "chaining": "INTEGER NOT NULL DEFAULT 0",
+    "memory_stalls": "INTEGER NOT NULL DEFAULT 0",
+    "structural_stalls": "INTEGER NOT NULL DEFAULT 0",
+    "fused": "INTEGER NOT NULL DEFAULT 0",
+    "vector_stalls": "INTEGER NOT NULL DEFAULT 0",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at    REAL    NOT NULL,
+    program_hash  TEXT    NOT NULL,
+    program_size  INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS run_results (
+    run_id             INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    processor          INTEGER NOT NULL,
+    config             TEXT    NOT NULL,
+    forwarding         INTEGER NOT NULL,
+    branch_prediction  INTEGER NOT NULL,
+    early_branch       INTEGER NOT NULL DEFAULT 0,
+    memory_model       INTEGER NOT NULL DEFAULT 0,
+    memory_latency     INTEGER NOT NULL DEFAULT 0,
+    memory_banks       INTEGER NOT NULL DEFAULT 0,
+    functional         INTEGER NOT NULL DEFAULT 0,
+    fast_forwarding    INTEGER NOT NULL DEFAULT 0,
+    fusion_pairs       TEXT    NOT NULL DEFAULT '',
+    thread_count       INTEGER NOT NULL DEFAULT 1,
+    fetch_policy       TEXT    NOT NULL DEFAULT '',
+    vlen               INTEGER NOT NULL DEFAULT 0,
+    lanes              INTEGER NOT NULL DEFAULT 0,
+    chaining           INTEGER NOT NULL DEFAULT 0,
+    cycles             INTEGER NOT NULL,
+    instructions       INTEGER NOT NULL DEFAULT 0,
+    stalls             INTEGER NOT NULL DEFAULT 0,
+    data_stalls        INTEGER NOT NULL DEFAULT 0,
+    branch_stalls      INTEGER NOT NULL DEFAULT 0,
+    flushes            INTEGER NOT NULL DEFAULT 0,
+    memory_stalls      INTEGER NOT NULL DEFAULT 0,
+    structural_stalls  INTEGER NOT NULL DEFAULT 0,
+    fused              INTEGER NOT NULL DEFAULT 0,
+    vector_stalls      INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (run_id, processor)
+);
+
+CREATE INDEX IF NOT EXISTS idx_runs_program_time ON runs(program_hash, created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_time ON runs(created_at);
+CREATE INDEX IF NOT EXISTS idx_results_config_cycles ON run_results(config, cycles);
+"""
+
+
+def program_hash(programs):
+    """
+    Hash estable de un programa ya parseado (independiente de espacios y
+    comentarios). 'programs' tiene un programa por hilo; el separador entra
+    en el hash, así que A---B y A seguido de B son programas distintos.
+    """
+    text = f"\n{PROGRAM_SEPARATOR}\n".join(
+        "\n".join(format_instruction(instr) for instr in program) for program in programs)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class ResultsStore:
+    """
+    Historial de corridas respaldado por SQLite.
+
+    Args:
+        path (str): Archivo de la base de datos (":memory:" para pruebas).
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+
+    def close(self):
+        self.conn.close()
+
+    def _migrate(self):
+        """
+        Agrega a run_results las columnas que le falten (bases de una versión anterior).
+        """
+        existing = {row["name"] for row in self.conn.execute("PRAGMA table_info(run_results)")}
+        with self.conn:
+            for column, definition in MIGRATIONS.items():
+                if column not in existing:
+                    self.conn.execute(f"ALTER TABLE run_results ADD COLUMN {column} {definition}")
+
+    # ----------------------------------------------------------------------
+    # Escritura
+    # ----------------------------------------------------------------------
+
+    def record_run(self, programs, results, created_at=None):
+        """
+        Guarda una corrida.
+
+        Args:
+            programs (list[list[dict]]): Programa ejecutado, uno por hilo.
+            results (list[dict]): Un diccionario por procesador con las columnas
+                de CONFIG_COLUMNS y los contadores de COUNTERS.
+            created_at (float, optional): Marca de tiempo (por defecto, ahora).
+
+        Returns:
+            int: Identificador de la corrida.
+        """
+        created_at = time.time() if created_at is None else created_at
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (created_at, program_hash, program_size) VALUES (?, ?, ?)",
+                (created_at, program_hash(programs), sum(len(program) for program in programs)))
+            run_id = cursor.lastrowid
+            columns = CONFIG_COLUMNS + COUNTERS
+            self.conn.executemany(
+                f"INSERT INTO run_results (run_id, processor, {', '.join(columns)}) "
+                f"VALUES (?, ?, {', '.join('?' * len(columns))})",
+                [(run_id, processor, *(r[c] for c in CONFIG_COLUMNS),
+                  *(r.get(c, 0) for c in COUNTERS))
+                 for processor, r in enumerate(results)])
+        return run_id
+
+    # ----------------------------------------------------------------------
+    # Consultas
+    # ----------------------------------------------------------------------
+
+    def count_runs(self):
+        return self.conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def page(self, offset=0, limit=20):
+        """
+        Corridas de la más reciente a la más antigua, una página a la vez.
+
+        Returns:
+            list[dict]: {'id', 'created_at', 'program_hash', 'results': [...]}
+            donde 'results' está ordenado por número de procesador.
+        """
+        runs = self.conn.execute(
+            "SELECT id, created_at, program_hash FROM runs ORDER BY id DESC LIMIT ? OFFSET ?",
+            (limit, offset)).fetchall()
+        if not runs:
+            return []
+
+        ids = [row["id"] for row in runs]
+        results = {run_id: [] for run_id in ids}
+        rows = self.conn.execute(
+            f"SELECT * FROM run_results WHERE run_id IN ({', '.join('?' * len(ids))}) "
+            f"ORDER BY run_id, processor", ids)
+        for row in rows:
+            results[row["run_id"]].append(dict(row))
+
+        return [{"id": row["id"], "created_at": row["created_at"],
+                 "program_hash": row["program_hash"], "results": results[row["id"]]}
+                for row in runs]
+
+    def best_config(self, program_hash_value):
+        """
+        Configuración con menos ciclos registrada para un programa.
+
+        Returns:
+            dict o None: Columnas de CONFIG_KEY, 'cycles', 'stalls' y 'run_id'.
+        """
+        row = self.conn.execute(
+            f"SELECT {', '.join('rr.' + c for c in CONFIG_KEY)}, rr.cycles, rr.stalls, rr.run_id "
+            "FROM runs r JOIN run_results rr ON rr.run_id = r.id "
+            "WHERE r.program_hash = ? ORDER BY rr.cycles, rr.stalls LIMIT 1",
+            (program_hash_value,)).fetchone()
+        return dict(row) if row else None
+
+    def regressions(self, since):
+        """
+        Programas/configuraciones cuyo peor resultado desde 'since' es más
+        lento que el mejor resultado anterior a 'since'. Una configuración es
+        la combinación de columnas de CONFIG_KEY.
+
+        Args:
+            since (float): Marca de tiempo (p. ej. time.time() - 7 * 86400).
+
+        Returns:
+            list[dict]: 'program_hash', columnas de CONFIG_KEY, 'best_before'
+            y 'worst_since'.
+        """
+        key = ", ".join("rr." + c for c in CONFIG_KEY)
+        join = " AND ".join(f"before.{c} = recent.{c}" for c in ["program_hash"] + CONFIG_KEY)
+        rows = self.conn.execute(
+            f"""
+            WITH recent AS (
+                SELECT r.program_hash, {key}, MAX(rr.cycles) AS cycles
+                FROM runs r JOIN run_results rr ON rr.run_id = r.id
+                WHERE r.created_at >= ?
+                GROUP BY r.program_hash, {key}
+            ),
+            before AS (
+                SELECT r.program_hash, {key}, MIN(rr.cycles) AS cycles
+                FROM runs r JOIN run_results rr ON rr.run_id = r.id
+                WHERE r.created_at < ?
+                GROUP BY r.program_hash, {key}
+            )
+            SELECT recent.program_hash, {', '.join('recent.' + c for c in CONFIG_KEY)},
+                   before.cycles AS best_before, recent.cycles AS worst_since
+            FROM recent JOIN before ON {join}
+            WHERE recent.cycles > before.cycles
+            ORDER BY recent.cycles - before.cycles DESC
+            """, (since, since)).fetchall()
+        return [dict(row) for row in rows]
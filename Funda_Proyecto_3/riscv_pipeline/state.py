@@ -0,0 +1,79 @@
+from array import array
+
+"""
+Estado arquitectónico (banco de registros y memoria de datos) en buffers
+array('i') de enteros de 32 bits con signo.
+
+Los buffers exponen el buffer protocol, así que se pueden pasar sin copiar a
+memoryview, bytes, escritores de trazas o NumPy (as_numpy), y se cargan en
+bloque desde cualquier objeto con ese protocolo (import_state). Escribir un
+valor fuera de 32 bits lanza OverflowError: la ALU (alu.wrap32) se encarga
+de reducir cada resultado antes.
+"""
+
+TYPECODE = "i"   # int32 en todas las plataformas soportadas (itemsize 4)
+
+
+def int32_array(size):
+    """
+    Buffer de 'size' palabras en cero.
+    """
+    return array(TYPECODE, bytes(4 * size))
+
+
+def export_state(proc):
+    """
+    Vistas sin copia (memoryview, formato 'i') de registros y memoria de un
+    procesador (Pipeline, OutOfOrderCore o GoldenModel).
+    """
+    return {"registers": memoryview(proc.registers), "memory": memoryview(proc.memory)}
+
+
+def _copy_into(target, source):
+    try:
+        view = memoryview(source)
+    except TypeError:
+        # Secuencia sin buffer protocol (p. ej. una lista de enteros).
+        view = memoryview(array(TYPECODE, source))
+    view = view.cast("B")
+    dest = memoryview(target).cast("B")
+    if view.nbytes != dest.nbytes:
+        raise ValueError(f"Se esperaban {dest.nbytes} bytes y llegaron {view.nbytes}.")
+    dest[:] = view
+
+
+def import_state(proc, registers=None, memory=None):
+    """
+    Copia en bloque registros y/o memoria desde buffers int32 del mismo
+    tamaño (array('i'), bytes, numpy.int32, ...), sobre los buffers actuales
+    del procesador (las vistas exportadas siguen siendo válidas).
+    """
+    if registers is not None:
+        _copy_into(proc.registers, registers)
+    if memory is not None:
+        _copy_into(proc.memory, memory)
+
+
+def snapshot(proc):
+    """
+    Copia del estado arquitectónico: (registros, memoria) como array('i').
+    """
+    return proc.registers[:], proc.memory[:]
+
+
+def restore(proc, state):
+    """
+    Restaura un estado tomado con snapshot().
+    """
+    registers, memory = state
+    import_state(proc, registers, memory)
+
+
+def as_numpy(buffer):
+    """
+    Vista numpy.int32 sin copia de un buffer de estado. NumPy es opcional y
+    solo se importa aquí.
+    """
+    import numpy
+
+    return numpy.frombuffer(buffer, dtype=numpy.int32)
@@ -0,0 +1,292 @@
+from collections import deque
+
+from .block_translator import get_translator
+from .golden_model import GoldenModel
+from .pipeline import BRANCH_OPS, Pipeline
+from .state import import_state, restore, snapshot
+
+"""
+Detección de régimen estacionario en bucles y avance rápido (fast-forward).
+
+Cada vez que un BEQ/BNE hacia atrás se toma y IF busca la cabeza del bucle
+termina una iteración. De cada iteración se guarda:
+    - el estado del pipeline en la frontera: PC de cada etapa, saltos ya
+      resueltos, stall pendiente y selección de reenvío;
+    - la ocupación por PC y el stall de cada ciclo (firma de tiempo);
+    - el camino ejecutado (PCs que entraron a EX, o sea, cada salto);
+    - los ciclos y contadores que costó.
+
+Sin sistema de memoria el tiempo del pipeline solo depende del estado en la
+frontera y de los saltos, así que si dos iteraciones seguidas coinciden en
+todo, cada iteración siguiente con el mismo camino cuesta exactamente lo
+mismo. Las restantes se ejecutan con los bloques traducidos (solo semántica
+funcional) mientras el camino coincida, y se suman sus ciclos y stalls
+multiplicando. En cuanto una iteración toma otro camino (p. ej. la salida
+del bucle) se descarta y sigue la simulación detallada.
+
+Las instrucciones que en la frontera siguen en WB/MEM/EX pertenecen al final
+de la iteración: se ejecutan antes con el golden model para tener el estado
+preciso, y al terminar se les cargan los valores de la última iteración
+avanzada (el pipeline vuelve a aplicar sus escrituras, que ya son las del
+estado final).
+
+No aplica con sistema de memoria (la latencia depende de las direcciones),
+en modo traza ni con varios hilos.
+"""
+
+MAX_ITERATION_CYCLES = 4096   # Iteraciones más largas no se registran
+RECENT_PCS = 8                # PCs recientes que se guardan para la cola de la iteración
+
+STATS_KEYS = ("instructions", "stalls", "data_stalls", "branch_stalls", "flushes", "memory_stalls")
+
+
+def supports_fast_forward(proc):
+    """
+    True si el procesador admite LoopFastForward.
+    """
+    return (type(proc) is Pipeline and proc.memory_system is None
+            and proc.instruction_stream is None and proc.fusion is None
+            and proc.vector_unit is None)
+
+
+def enable_fast_forward(proc, max_cycles=1_000_000):
+    """
+    Engancha un LoopFastForward si el procesador lo admite.
+
+    Retorna:
+        bool: True si quedó activo.
+    """
+    if not supports_fast_forward(proc):
+        return False
+    LoopFastForward(proc, max_cycles).attach()
+    return True
+
+
+def _value(registers, name):
+    return registers[int(name[1:])] if name else 0
+
+
+class LoopFastForward:
+    """
+    Detector de régimen estacionario para un Pipeline.
+
+    attach() reemplaza proc.step en la instancia; quien avance el procesador
+    con step() (runner, pruebas, interfaz) no tiene que cambiar nada.
+
+    Args:
+        proc (Pipeline): Procesador a acelerar.
+        max_cycles (int): No se avanza más allá de este ciclo (bucles infinitos).
+    """
+
+    def __init__(self, proc, max_cycles=1_000_000):
+        if not supports_fast_forward(proc):
+            raise ValueError("El avance rápido requiere un Pipeline sin sistema de memoria ni traza.")
+        self.proc = proc
+        self.max_cycles = max_cycles
+        self._step = proc.step
+
+        self._path = []
+        self._recent = deque(maxlen=RECENT_PCS)
+        self._window = []
+        self._last_ex = None
+        self._previous = None
+        self._baseline = self._counters()
+
+        self.stats = {
+            "fast_forwards": 0,     # Veces que se avanzó
+            "iterations": 0,        # Iteraciones avanzadas
+            "cycles": 0,            # Ciclos sumados analíticamente
+        }
+
+    def attach(self):
+        self.proc.step = self.step
+        self.proc.loop_fast_forward = self
+        return self
+
+    def detach(self):
+        del self.proc.step
+        del self.proc.loop_fast_forward
+
+    # ----------------------------------------------------------------------
+    # Observación de cada ciclo
+    # ----------------------------------------------------------------------
+
+    def _counters(self):
+        proc = self.proc
+        return (proc.cycle, proc.fetched) + tuple(proc.stats[key] for key in STATS_KEYS)
+
+    def step(self):
+        proc = self.proc
+        flushes = proc.stats["flushes"]
+        hazard_info = self._step()
+        if proc.finished:
+            return hazard_info
+
+        pipeline = proc.pipeline
+        ex = pipeline["EX"]
+        if ex is not None and ex is not self._last_ex:
+            # Solo las instrucciones del camino correcto llegan a EX.
+            self._last_ex = ex
+            self._path.append(ex["pc"])
+            self._recent.append(ex["pc"])
+
+        if self._window is not None:
+            self._window.append((tuple(instr["pc"] if instr else None for instr in pipeline.values()),
+                                 proc.stalled))
+            if len(self._window) > MAX_ITERATION_CYCLES:
+                self._window = None
+
+        head = pipeline["IF"]
+        if proc.stats["flushes"] > flushes and head is not None and self._path:
+            branch_pc = self._path[-1]
+            branch = proc.instruction_memory[branch_pc]
+            if (branch.get("op") in BRANCH_OPS and branch.get("imm", 0) <= 0
+                    and branch_pc + branch.get("imm", 0) == head["pc"]):
+                self._iteration_end(head, branch_pc)
+        return hazard_info
+
+    def _iteration_end(self, head, branch_pc):
+        proc = self.proc
+        counters = self._counters()
+        record = None
+        if self._window is not None:
+            record = {
+                "loop": (head["pc"], branch_pc),
+                "state": (
+                    tuple((instr["pc"], instr.get("resolved", False)) if instr else None
+                          for instr in proc.pipeline.values()),
+                    proc.stalled, proc.pc, tuple(sorted(proc.hazard_info.items())),
+                ),
+                "path": tuple(self._path),
+                "window": tuple(self._window),
+                "deltas": tuple(now - before for now, before in zip(counters, self._baseline)),
+            }
+
+        if record is not None and record == self._previous:
+            self._fast_forward(record, head)
+            counters = self._counters()
+
+        self._previous = record
+        self._baseline = counters
+        self._path = []
+        self._window = []
+
+    # ----------------------------------------------------------------------
+    # Avance rápido
+    # ----------------------------------------------------------------------
+
+    def _block_plan(self, translator, path):
+        """
+        Bloques traducidos que recorren exactamente 'path' (None si no encaja).
+        """
+        plan = []
+        i = 0
+        while i < len(path):
+            block = translator.get_block(path[i])
+            size = block.end - block.start
+            if list(path[i:i + size]) != list(range(block.start, block.end)):
+                return None
+            plan.append(block)
+            i += size
+        return plan
+
+    def _run_iteration(self, plan, head_pc):
+        """
+        Ejecuta una iteración con los bloques del plan; False si se desvía.
+        """
+        registers, memory = self.proc.registers, self.proc.memory
+        pc = head_pc
+        for block in plan:
+            if pc != block.start:
+                return False
+            pc, _ = block.func(registers, memory)
+            registers[0] = 0
+        return pc == head_pc
+
+    def _fast_forward(self, record, head):
+        proc = self.proc
+        head_pc = record["loop"][0]
+        path = record["path"]
+        deltas = record["deltas"]
+        cycles = deltas[0]
+        budget = (self.max_cycles - proc.cycle) // cycles if cycles > 0 else 0
+
+        # Instrucciones de la iteración que siguen en vuelo (de la más vieja a la más nueva).
+        in_flight = [proc.pipeline[stage] for stage in ("WB", "MEM", "EX")]
+        in_flight = [instr for instr in in_flight if instr is not None and instr["seq"] < head["seq"]]
+        if [instr["pc"] for instr in in_flight] != list(self._recent)[len(self._recent) - len(in_flight):]:
+            return
+        replay = -(-len(in_flight) // len(path)) if in_flight else 0
+        if budget <= replay:
+            return
+
+        translator = get_translator(proc.instruction_memory, len(proc.memory))
+        plan = self._block_plan(translator, path)
+        if plan is None:
+            return
+
+        # Estado preciso: aplicar lo que aún no escribieron las instrucciones en vuelo.
+        original = snapshot(proc)
+        golden = GoldenModel(proc.instruction_memory, len(proc.memory))
+        import_state(golden, proc.registers, proc.memory)
+        for instr in in_flight:
+            golden.pc = instr["pc"]
+            golden.step()
+        if in_flight and golden.pc != head_pc:
+            return
+        import_state(proc, golden.registers, golden.memory)
+
+        history = deque(maxlen=max(replay, 1))
+        iterations = 0
+        while iterations < budget:
+            before = snapshot(proc)
+            if not self._run_iteration(plan, head_pc):
+                restore(proc, before)
+                break
+            history.append(before)
+            iterations += 1
+
+        if iterations < max(replay, 1):
+            restore(proc, original)
+            return
+
+        # Se repiten con el golden model las últimas iteraciones para conocer
+        # los valores de las instrucciones que quedan en vuelo.
+        restore(proc, history[0])
+        import_state(golden, proc.registers, proc.memory)
+        golden.pc = head_pc
+        values = deque(maxlen=max(len(in_flight), 1))
+        for _ in range(len(history)):
+            for _ in path:
+                instr = golden.instruction_memory[golden.pc]
+                operands = {src + "_val": _value(golden.registers, instr.get(src))
+                            for src in ("rs1", "rs2")}
+                executed = golden.step()
+                record_values = dict(operands)
+                if "addr" in executed:
+                    record_values["addr"] = executed["addr"]
+                if executed["op"] == "SW":
+                    record_values["store_value"] = operands["rs2_val"]
+                elif instr.get("rd") and instr["rd"] != "x0":
+                    record_values["result"] = _value(golden.registers, instr["rd"])
+                values.append(record_values)
+        import_state(proc, golden.registers, golden.memory)
+
+        for instr, latest in zip(in_flight, list(values)[len(values) - len(in_flight):]):
+            for field, value in latest.items():
+                if field in instr:
+                    instr[field] = value
+
+        # Contadores: cada iteración cuesta exactamente lo mismo que la registrada.
+        fetched = deltas[1] * iterations
+        proc.cycle += cycles * iterations
+        proc.fetched += fetched
+        for key, delta in zip(STATS_KEYS, deltas[2:]):
+            proc.stats[key] += delta * iterations
+        for instr in proc.pipeline.values():
+            if instr is not None:
+                instr["seq"] += fetched
+
+        self.stats["fast_forwards"] += 1
+        self.stats["iterations"] += iterations
+        self.stats["cycles"] += cycles * iterations
@@ -0,0 +1,242 @@
+import argparse
+import json
+
+from .memory_system import MemorySystem
+from .parser import load_assembly_file, parse_programs
+from .processors import create_processor, processor_result
+from .hazard_unit import HazardUnit
+from .vector_unit import LANES, VLEN, VectorUnit
+
+"""
+Comparación de kernels escalares y vectoriales (ver vector_unit) en ciclos e
+instrucciones retiradas, para cada configuración de Pipeline.
+
+Uso:
+    riscv-pipeline-vector-bench
+    python -m riscv_pipeline.vector_bench --kernel dot --lanes 2 --no-chaining
+    riscv-pipeline-vector-bench --mem-latency 8 --vlen 256 --json
+    riscv-pipeline-vector-bench --scalar mio.s --vector mio_v.s
+
+Los kernels incluidos trabajan sobre la memoria de datos (64 palabras), que
+se llena con valores conocidos antes de correr; las dos versiones tienen que
+terminar con la misma memoria.
+"""
+
+MEMORY_WORDS = 64
+
+
+def dot_kernels(n=24):
+    """
+    Producto punto de a[0:n] y b[n:2n]; el resultado queda en mem[63].
+    """
+    scalar = f"""
+        ADDI x1, x0, 0
+        ADDI x2, x0, {n}
+        ADDI x3, x0, {n}
+        ADDI x4, x0, 0
+        LW x5, 0(x1)
+        LW x6, 0(x2)
+        MUL x7, x5, x6
+        ADD x4, x4, x7
+        ADDI x1, x1, 1
+        ADDI x2, x2, 1
+        ADDI x3, x3, -1
+        BNE x3, x0, -7
+        SW x4, 63(x0)
+    """
+    vector = f"""
+        ADDI x1, x0, 0
+        ADDI x2, x0, {n}
+        ADDI x3, x0, {n}
+        vsetvli x5, x3, e32
+        vle32.v v1, (x1)
+        vle32.v v2, (x2)
+        vmul.vv v3, v1, v2
+        vredsum.vs v4, v3, v4
+        ADD x1, x1, x5
+        ADD x2, x2, x5
+        SUB x3, x3, x5
+        BNE x3, x0, -8
+        ADDI x6, x0, 1
+        vsetvli x0, x6, e32
+        ADDI x7, x0, 63
+        vse32.v v4, (x7)
+    """
+    return scalar, vector
+
+
+def memcpy_kernels(n=32):
+    """
+    Copia mem[0:n] a mem[n:2n].
+    """
+    scalar = f"""
+        ADDI x1, x0, 0
+        ADDI x2, x0, {n}
+        ADDI x3, x0, {n}
+        LW x5, 0(x1)
+        SW x5, 0(x2)
+        ADDI x1, x1, 1
+        ADDI x2, x2, 1
+        ADDI x3, x3, -1
+        BNE x3, x0, -5
+    """
+    vector = f"""
+        ADDI x1, x0, 0
+        ADDI x2, x0, {n}
+        ADDI x3, x0, {n}
+        vsetvli x5, x3, e32
+        vle32.v v1, (x1)
+        vse32.v v1, (x2)
+        ADD x1, x1, x5
+        ADD x2, x2, x5
+        SUB x3, x3, x5
+        BNE x3, x0, -6
+    """
+    return scalar, vector
+
+
+def vadd_kernels(n=20):
+    """
+    c[i] = a[i] + b[i] con a en mem[0:n], b en mem[n:2n] y c en mem[2n:3n].
+    """
+    scalar = f"""
+        ADDI x1, x0, 0
+        ADDI x3, x0, {n}
+        LW x5, 0(x1)
+        LW x6, {n}(x1)
+        ADD x7, x5, x6
+        SW x7, {2 * n}(x1)
+        ADDI x1, x1, 1
+        ADDI x3, x3, -1
+        BNE x3, x0, -6
+    """
+    vector = f"""
+        ADDI x1, x0, 0
+        ADDI x2, x0, {n}
+        ADDI x8, x0, {2 * n}
+        ADDI x3, x0, {n}
+        vsetvli x5, x3, e32
+        vle32.v v1, (x1)
+        vle32.v v2, (x2)
+        vadd.vv v3, v1, v2
+        vse32.v v3, (x8)
+        ADD x1, x1, x5
+        ADD x2, x2, x5
+        ADD x8, x8, x5
+        SUB x3, x3, x5
+        BNE x3, x0, -9
+    """
+    return scalar, vector
+
+
+KERNELS = {
+    "dot": dot_kernels,
+    "memcpy": memcpy_kernels,
+    "vadd": vadd_kernels,
+}
+
+
+def initial_memory():
+    """
+    Datos de entrada de los kernels: mem[i] = i + 1.
+    """
+    return [i + 1 for i in range(MEMORY_WORDS)]
+
+
+def run_kernel(program, mode_key, data=None, memory_latency=None, vector_options=None,
+               max_cycles=1_000_000):
+    """
+    Ejecuta un programa en Pipeline con la memoria inicial 'data'.
+
+    Retorna:
+        Pipeline en su estado final.
+    """
+    memory_system = MemorySystem(memory_latency) if memory_latency is not None else None
+    vector_unit = VectorUnit(**vector_options) if vector_options is not None else None
+    proc = create_processor(mode_key, program, memory_system, vector_unit=vector_unit)
+    for addr, value in enumerate(data or ()):
+        proc.memory[addr] = value
+    while not proc.finished and proc.cycle < max_cycles:
+        proc.step()
+    return proc
+
+
+def compare_kernel(scalar, vector, mode_key, data=None, memory_latency=None,
+                   vector_options=None):
+    """
+    Corre las dos versiones de un kernel en una configuración.
+
+    Retorna:
+        dict: Resultados de cada versión, aceleración y si la memoria final coincide.
+    """
+    scalar_proc = run_kernel(scalar, mode_key, data, memory_latency)
+    vector_proc = run_kernel(vector, mode_key, data, memory_latency, vector_options)
+    result = {
+        "config": mode_key,
+        "scalar": processor_result(scalar_proc, mode_key),
+        "vector": processor_result(vector_proc, mode_key),
+        "same_memory": list(scalar_proc.memory) == list(vector_proc.memory),
+    }
+    result["speedup"] = (scalar_proc.cycle / vector_proc.cycle) if vector_proc.cycle else 0.0
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compara versiones escalar y vectorial de un kernel en ciclos e instrucciones.")
+    parser.add_argument("--kernel", action="append", choices=sorted(KERNELS),
+                        help="Kernel incluido (se puede repetir; por defecto, todos)")
+    parser.add_argument("--scalar", help="Versión escalar propia (.s)")
+    parser.add_argument("--vector", help="Versión vectorial propia (.s)")
+    parser.add_argument("--config", action="append", choices=list(HazardUnit.MODES),
+                        help="Configuración (se puede repetir; por defecto, todas)")
+    parser.add_argument("--vlen", type=int, default=VLEN, help="Bits por registro vectorial")
+    parser.add_argument("--lanes", type=int, default=LANES,
+                        help="Elementos por ciclo de las unidades vectoriales")
+    parser.add_argument("--no-chaining", action="store_true",
+                        help="Sin encadenamiento entre instrucciones vectoriales")
+    parser.add_argument("--mem-latency", type=int, default=None,
+                        help="Latencia del sistema de memoria (sin ella, MEM tarda un ciclo)")
+    parser.add_argument("--json", action="store_true", help="Salida en JSON")
+    args = parser.parse_args(argv)
+
+    if (args.scalar is None) != (args.vector is None):
+        parser.error("--scalar y --vector van juntos")
+    if args.vlen < 32 or args.vlen % 32:
+        parser.error("--vlen debe ser un múltiplo de 32")
+
+    kernels = []
+    if args.scalar:
+        kernels.append(("propio", load_assembly_file(args.scalar), load_assembly_file(args.vector),
+                        None))
+    if args.kernel or not args.scalar:
+        for name in args.kernel or sorted(KERNELS):
+            scalar, vector = (parse_programs(text)[0] for text in KERNELS[name]())
+            kernels.append((name, scalar, vector, initial_memory()))
+
+    vector_options = {"vlen": args.vlen, "lanes": args.lanes, "chaining": not args.no_chaining}
+    results = []
+    for name, scalar, vector, data in kernels:
+        for mode_key in args.config or list(HazardUnit.MODES):
+            result = compare_kernel(scalar, vector, mode_key, data, args.mem_latency,
+                                    vector_options)
+            result["kernel"] = name
+            results.append(result)
+
+    if args.json:
+        print(json.dumps({"vector": vector_options, "results": results}, indent=2))
+        return 0
+
+    print(f"VLEN {args.vlen} ({args.vlen // 32} elementos), {args.lanes} lanes, "
+          f"encadenamiento {'no' if args.no_chaining else 'sí'}")
+    for result in results:
+        s, v = result["scalar"], result["vector"]
+        check = "" if result["same_memory"] else "  (¡memoria distinta!)"
+        print(f"{result['kernel']:<8} {result['config']:<14} escalar {s['cycles']:>6,} ciclos "
+              f"{s['instructions']:>5,} instr | vectorial {v['cycles']:>6,} ciclos "
+              f"{v['instructions']:>5,} instr | x{result['speedup']:.2f}{check}")
+    return 0 if all(result["same_memory"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
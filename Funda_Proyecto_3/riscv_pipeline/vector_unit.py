@@ -0,0 +1,240 @@
+from .alu import execute, to_unsigned, wrap32
+from .state import int32_array
+
+"""
+Extensión vectorial (subconjunto de RVV) para Pipeline y GoldenModel.
+
+Instrucciones (solo SEW = 32 bits y LMUL = 1, sin máscaras):
+    VSETVLI rd, rs1, e32        vl = min(x[rs1], VLMAX); rd = vl
+                                (rs1 = x0: vl = VLMAX, o sin cambio si rd = x0)
+    VLE32.V vd, (rs1)           vd[i] = mem[x[rs1] + i]          i < vl
+    VSE32.V vs3, (rs1)          mem[x[rs1] + i] = vs3[i]
+    VADD.VV vd, vs2, vs1        vd[i] = vs2[i] + vs1[i]
+    VMUL.VV vd, vs2, vs1        vd[i] = vs2[i] * vs1[i]
+    VREDSUM.VS vd, vs2, vs1     vd[0] = vs1[0] + suma(vs2[0:vl])
+
+La memoria se direcciona por palabra (como LW/SW), así que un acceso de
+unidad de paso recorre palabras consecutivas. Los elementos desde vl en
+adelante no se modifican, y con vl = 0 ninguna instrucción escribe nada.
+
+VectorRegisters es el estado arquitectónico (32 registros de VLEN bits y vl)
+con la semántica funcional que comparten GoldenModel y Pipeline.
+
+VectorUnit le agrega el modelo de tiempo que usa Pipeline:
+    - En EX, VSETVLI calcula vl (y su rd, que se reenvía como cualquier
+      resultado de la ALU); las demás toman vl y la dirección de rs1.
+    - En MEM la instrucción se emite a su unidad (aritmética o de memoria).
+      Cada unidad procesa 'lanes' elementos por ciclo (un "beat") y acepta
+      una instrucción nueva recién cuando terminó de emitir la anterior; si
+      está ocupada, MEM se congela (vector_stalls).
+    - Cada registro vectorial recuerda en qué ciclo tiene su primer y su
+      último elemento. Con encadenamiento (chaining) una instrucción
+      empieza en cuanto está el primer elemento de sus fuentes y va detrás
+      de ellas beat a beat; sin él, espera al último. Las reducciones
+      entregan su resultado después del árbol de sumas entre lanes.
+    - VLE32/VSE32 con MemorySystem reservan los bancos elemento a elemento
+      (lanes palabras por beat), así que pocos bancos dan conflictos; un
+      VSE32 espera a que el buffer de escritura escalar se vacíe.
+El efecto funcional se aplica al emitir, en orden de programa; el tiempo de
+los elementos solo decide cuándo la unidad queda libre y cuándo termina el
+programa.
+"""
+
+VLEN = 128       # Bits por registro vectorial (VLMAX = VLEN / 32)
+LANES = 4        # Elementos por ciclo de cada unidad
+VECTOR_REGISTERS = 32
+
+VECTOR_MEMORY_OPS = ("VLE32.V", "VSE32.V")
+VECTOR_ARITH_OPS = ("VADD.VV", "VMUL.VV", "VREDSUM.VS")
+VECTOR_ISSUE_OPS = VECTOR_MEMORY_OPS + VECTOR_ARITH_OPS   # Se emiten en MEM
+VECTOR_OPS = ("VSETVLI",) + VECTOR_ISSUE_OPS
+
+_ALU_OP = {"VADD.VV": "ADD", "VMUL.VV": "MUL"}
+
+
+def has_vector_ops(program):
+    """
+    True si el programa usa alguna instrucción vectorial.
+    """
+    return any(instr.get("op") in VECTOR_OPS for instr in program)
+
+
+def read_memory(memory, addr, count):
+    """
+    Palabras mem[addr:addr + count] (0 fuera de rango, como LW).
+    """
+    return [memory[a] if 0 <= a < len(memory) else 0 for a in range(addr, addr + count)]
+
+
+def write_memory(memory, addr, values):
+    """
+    Escribe palabras desde addr (las que caen fuera de rango se ignoran, como SW).
+    """
+    for a, value in enumerate(values, addr):
+        if 0 <= a < len(memory):
+            memory[a] = value
+
+
+class VectorRegisters:
+    """
+    Banco de registros vectoriales y vl.
+
+    Args:
+        vlen (int): Bits por registro (múltiplo de 32).
+    """
+
+    def __init__(self, vlen=VLEN):
+        if vlen < 32 or vlen % 32:
+            raise ValueError(f"VLEN debe ser múltiplo de 32: {vlen}")
+        self.vlen = vlen
+        self.vlmax = vlen // 32
+        self.registers = [int32_array(self.vlmax) for _ in range(VECTOR_REGISTERS)]
+        self.vl = 0
+
+    def _reg(self, name):
+        return self.registers[int(name[1:])]
+
+    def set_vl(self, instr, avl):
+        """
+        VSETVLI: fija vl a partir del valor de rs1 (avl) y lo retorna (es el rd).
+        """
+        if instr["rs1"] != "x0":
+            self.vl = min(to_unsigned(avl), self.vlmax)
+        elif instr["rd"] != "x0":
+            self.vl = self.vlmax
+        return self.vl
+
+    def execute(self, instr, a):
+        """
+        Parte escalar de una instrucción vectorial (EX): a es el valor de rs1.
+        VSETVLI deja su resultado en 'result'; las demás guardan el vl vigente
+        y, las de memoria, la dirección base.
+        """
+        op = instr["op"]
+        if op == "VSETVLI":
+            instr["result"] = self.set_vl(instr, a)
+            return
+        instr["vl"] = self.vl
+        if op in VECTOR_MEMORY_OPS:
+            instr["addr"] = a
+
+    def write(self, name, values):
+        reg = self._reg(name)
+        for i, value in enumerate(values):
+            reg[i] = value
+
+    def arith(self, instr):
+        """
+        VADD.VV, VMUL.VV y VREDSUM.VS sobre los primeros vl elementos.
+        """
+        vl = instr["vl"]
+        if not vl:
+            return
+        op = instr["op"]
+        vs2, vs1, vd = self._reg(instr["vs2"]), self._reg(instr["vs1"]), self._reg(instr["vd"])
+        if op == "VREDSUM.VS":
+            vd[0] = wrap32(vs1[0] + sum(vs2[:vl]))
+            return
+        alu_op = _ALU_OP[op]
+        for i in range(vl):
+            vd[i] = execute(alu_op, vs2[i], vs1[i])
+
+    def apply(self, instr, memory):
+        """
+        Efecto funcional de una instrucción ya pasada por execute().
+        """
+        op = instr["op"]
+        if op == "VLE32.V":
+            self.write(instr["vd"], read_memory(memory, instr["addr"], instr["vl"]))
+        elif op == "VSE32.V":
+            write_memory(memory, instr["addr"], self._reg(instr["vs3"])[:instr["vl"]])
+        else:
+            self.arith(instr)
+
+
+class VectorUnit(VectorRegisters):
+    """
+    Registros vectoriales más el modelo de tiempo de las unidades (ver el
+    docstring del módulo).
+
+    Args:
+        vlen (int): Bits por registro vectorial.
+        lanes (int): Elementos que procesa cada unidad por ciclo.
+        chaining (bool): Encadenamiento entre instrucciones dependientes.
+    """
+
+    def __init__(self, vlen=VLEN, lanes=LANES, chaining=True):
+        super().__init__(vlen)
+        self.lanes = max(1, lanes)
+        self.chaining = chaining
+        self.available = {}              # registro -> (ciclo del primer elemento, del último)
+        self.busy = {"alu": 0, "mem": 0}  # Ciclo en que cada unidad acepta otra instrucción
+        self.drain = 0                    # Ciclo en que termina lo emitido hasta ahora
+        self.stats = {
+            "vector_instructions": 0,    # Emitidas a las unidades (sin VSETVLI)
+            "elements": 0,
+            "beats": 0,                  # Ciclos de unidad ocupados
+            "chained": 0,                # Empezaron antes de que su fuente terminara
+        }
+
+    def idle(self, cycle):
+        """
+        True si ya no queda ningún elemento en vuelo.
+        """
+        return self.drain <= cycle
+
+    def issue(self, instr, cycle, memory, memory_system=None):
+        """
+        Etapa MEM: emite la instrucción a su unidad y aplica su efecto.
+
+        Retorna:
+            bool: False si la unidad no la puede aceptar (MEM se congela).
+        """
+        op = instr["op"]
+        unit = "mem" if op in VECTOR_MEMORY_OPS else "alu"
+        if self.busy[unit] > cycle:
+            return False
+        if op == "VSE32.V" and memory_system is not None and not memory_system.can_vector_store():
+            return False
+
+        vl = instr["vl"]
+        beats = max(1, -(-vl // self.lanes))
+        sources = [self.available.get(instr[f], (0, 0)) for f in ("vs1", "vs2", "vs3") if f in instr]
+        first_in = max((first for first, _ in sources), default=0)
+        last_in = max((last for _, last in sources), default=0)
+        if self.chaining:
+            start = max(cycle, first_in)
+            end = max(start + beats - 1, last_in)
+            if last_in > start:
+                self.stats["chained"] += 1
+        else:
+            start = max(cycle, last_in)
+            end = start + beats - 1
+
+        first, last = start + 1, end + 1
+        if op == "VLE32.V":
+            if memory_system is None:
+                values = read_memory(memory, instr["addr"], vl)
+            else:
+                values, first, last = memory_system.vector_load(instr["addr"], vl, start, self.lanes)
+            self.write(instr["vd"], values)
+        elif op == "VSE32.V":
+            values = self._reg(instr["vs3"])[:vl]
+            if memory_system is None:
+                write_memory(memory, instr["addr"], values)
+            else:
+                last = max(last, memory_system.vector_store(instr["addr"], values, start, self.lanes))
+        else:
+            self.arith(instr)
+            if op == "VREDSUM.VS":
+                # Árbol de sumas entre lanes: el resultado sale de una vez.
+                first = last = last + (self.lanes - 1).bit_length()
+
+        if "vd" in instr:
+            self.available[instr["vd"]] = (first, last)
+        self.busy[unit] = end + 1
+        self.drain = max(self.drain, last, end + 1)
+        self.stats["vector_instructions"] += 1
+        self.stats["elements"] += vl
+        self.stats["beats"] += beats
+        return True